@@ -3,70 +3,107 @@ Application configuration management.
 Loads environment variables and provides configuration settings.
 """
 import os
-from typing import List, Dict
-from dotenv import load_dotenv
+import functools
+from typing import List, Dict, Tuple, FrozenSet
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    # Settings compiled from .env at deploy time (scripts/compile_env.py)
+    from app.config_compiled import ENV as _COMPILED_ENV
+except ImportError:
+    from dotenv import load_dotenv
+    
+    # Load environment variables from .env file
+    load_dotenv()
+    _COMPILED_ENV = {}
+
+# Snapshot the environment once so settings are never re-read from os.environ.
+# Real environment variables take precedence over compiled values, matching
+# load_dotenv() which never overrides variables that are already set.
+_ENV: Dict[str, str] = {**_COMPILED_ENV, **os.environ}
 
 
 class Config:
     """Application configuration class."""
     
     # GitHub Configuration
-    GITHUB_TOKEN: str = os.getenv("GITHUB_TOKEN", "")
+    GITHUB_TOKEN: str = _ENV.get("GITHUB_TOKEN", "")
     GITHUB_API_BASE: str = "https://api.github.com"
+    # Stay below GitHub's 5000 requests/hour authenticated limit
+    GITHUB_REQUESTS_PER_HOUR: int = int(_ENV.get("GITHUB_REQUESTS_PER_HOUR", "4500"))
     
     # GitLab Configuration
-    GITLAB_TOKEN: str = os.getenv("GITLAB_TOKEN", "")
-    GITLAB_API_BASE: str = os.getenv("GITLAB_API_BASE", "https://gitlab.com/api/v4")
+    GITLAB_TOKEN: str = _ENV.get("GITLAB_TOKEN", "")
+    GITLAB_API_BASE: str = _ENV.get("GITLAB_API_BASE", "https://gitlab.com/api/v4")
     
     # Google Gemini Configuration
-    GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    GEMINI_API_KEY: str = _ENV.get("GEMINI_API_KEY", "")
     GEMINI_MODEL: str = "gemini-2.5-flash"
     #"gemini-pro"
+    GEMINI_REQUESTS_PER_MINUTE: int = int(_ENV.get("GEMINI_REQUESTS_PER_MINUTE", "10"))
     
     # Email Configuration
-    SMTP_HOST: str = os.getenv("SMTP_HOST", "smtp.gmail.com")
-    SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
-    SMTP_USERNAME: str = os.getenv("SMTP_USERNAME", "")
-    SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
-    EMAIL_FROM: str = os.getenv("EMAIL_FROM", "")
-    EMAIL_TO: str = os.getenv("EMAIL_TO", "")
-    EMAIL_ALERTS_ENABLED: bool = os.getenv("EMAIL_ALERTS_ENABLED", "true").lower() == "true"
+    SMTP_HOST: str = _ENV.get("SMTP_HOST", "smtp.gmail.com")
+    SMTP_PORT: int = int(_ENV.get("SMTP_PORT", "587"))
+    SMTP_USERNAME: str = _ENV.get("SMTP_USERNAME", "")
+    SMTP_PASSWORD: str = _ENV.get("SMTP_PASSWORD", "")
+    EMAIL_FROM: str = _ENV.get("EMAIL_FROM", "")
+    EMAIL_TO: str = _ENV.get("EMAIL_TO", "")
+    EMAIL_ALERTS_ENABLED: bool = _ENV.get("EMAIL_ALERTS_ENABLED", "true").lower() == "true"
     
     # Slack Configuration
-    SLACK_WEBHOOK_URL: str = os.getenv("SLACK_WEBHOOK_URL", "")
-    SLACK_ALERTS_ENABLED: bool = os.getenv("SLACK_ALERTS_ENABLED", "true").lower() == "true"
+    SLACK_WEBHOOK_URL: str = _ENV.get("SLACK_WEBHOOK_URL", "")
+    SLACK_ALERTS_ENABLED: bool = _ENV.get("SLACK_ALERTS_ENABLED", "true").lower() == "true"
+    # Seconds during which an identical alert that was delivered is not posted again
+    SLACK_DEDUPE_TTL: int = int(_ENV.get("SLACK_DEDUPE_TTL", "180"))
+    # Log Slack alerts instead of posting them (staging / integration tests)
+    SLACK_DRY_RUN: bool = _ENV.get("SLACK_DRY_RUN", "false").lower() == "true"
+    
+    # GitHub webhook secret; when set, deliveries must carry a valid X-Hub-Signature-256
+    GITHUB_WEBHOOK_SECRET: str = _ENV.get("GITHUB_WEBHOOK_SECRET", "")
     
     # Flask Configuration
-    FLASK_HOST: str = os.getenv("FLASK_HOST", "0.0.0.0")
-    FLASK_PORT: int = int(os.getenv("FLASK_PORT", "5000"))
+    FLASK_HOST: str = _ENV.get("FLASK_HOST", "0.0.0.0")
+    FLASK_PORT: int = int(_ENV.get("FLASK_PORT", "5000"))
     
     # Application Configuration
-    CHECK_INTERVAL_MINUTES: int = int(os.getenv("CHECK_INTERVAL_MINUTES", "60"))
-    DATABASE_PATH: str = os.getenv("DATABASE_PATH", "./data/blockchain_monitor.db")
+    CHECK_INTERVAL_MINUTES: int = int(_ENV.get("CHECK_INTERVAL_MINUTES", "60"))
+    DATABASE_PATH: str = _ENV.get("DATABASE_PATH", "./data/blockchain_monitor.db")
+    LOG_LEVEL: str = _ENV.get("LOG_LEVEL", "INFO").upper()
     
     # Monitored Repositories
-    MONITORED_REPOS: List[str] = [
+    MONITORED_REPOS: Tuple[str, ...] = tuple(
         repo.strip() 
-        for repo in os.getenv("MONITORED_REPOS", "").split(",") 
+        for repo in _ENV.get("MONITORED_REPOS", "").split(",") 
         if repo.strip()
-    ]
+    )
+    # Set view of MONITORED_REPOS for O(1) membership tests (e.g. webhooks);
+    # the tuple keeps the configured order for iteration and display
+    MONITORED_REPOS_SET: FrozenSet[str] = frozenset(MONITORED_REPOS)
+    GITLAB_REPOS: FrozenSet[str] = frozenset(
+        repo for repo in MONITORED_REPOS if repo.startswith("gitlab:")
+    )
+    GITHUB_REPOS: Tuple[str, ...] = tuple(
+        repo for repo in MONITORED_REPOS if not repo.startswith("gitlab:")
+    )
+    HAS_GITLAB_REPOS: bool = bool(GITLAB_REPOS)
+    HAS_GITHUB_REPOS: bool = bool(GITHUB_REPOS)
     
     # Repository-specific tag filters (optional)
     # Format: repo_name:tag_pattern1,tag_pattern2;another_repo:pattern
     # Example: ethereum-optimism/optimism:op-geth,op-node
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_repo_tag_filters(cls) -> Dict[str, List[str]]:
         """
         Parse repository-specific tag filters from environment.
         
+        The result is parsed once and cached; treat it as read-only.
+        
         Returns:
             Dictionary mapping repo names to list of tag patterns.
         """
         filters = {}
-        filter_str = os.getenv("REPO_TAG_FILTERS", "")
+        filter_str = _ENV.get("REPO_TAG_FILTERS", "")
         
         if filter_str:
             # Split by semicolon for different repos
@@ -97,12 +134,9 @@ class Config:
         missing = []
         
         # Check if we have tokens for the platforms being used
-        has_gitlab_repos = any(repo.startswith("gitlab:") for repo in cls.MONITORED_REPOS)
-        has_github_repos = any(not repo.startswith("gitlab:") for repo in cls.MONITORED_REPOS)
-        
-        if has_github_repos and not cls.GITHUB_TOKEN:
+        if cls.HAS_GITHUB_REPOS and not cls.GITHUB_TOKEN:
             missing.append("GITHUB_TOKEN (required for GitHub repositories)")
-        if has_gitlab_repos and not cls.GITLAB_TOKEN:
+        if cls.HAS_GITLAB_REPOS and not cls.GITLAB_TOKEN:
             missing.append("GITLAB_TOKEN (required for GitLab repositories)")
         
         if not cls.GEMINI_API_KEY:
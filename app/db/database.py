@@ -2,15 +2,156 @@
 SQLite database management.
 Handles database initialization, schema creation, and CRUD operations.
 """
+import hashlib
 import sqlite3
 import os
-from typing import Optional, List, Dict, Any
+import threading
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from datetime import datetime
 from contextlib import contextmanager
 
 from app.models import Repository, AlertHistory
 
 
+# Number of prepared statements each connection keeps cached
+STATEMENT_CACHE_SIZE = 128
+
+# Applied to every new connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+# Read-only connections shared by the query endpoints, and how long a
+# reader waits for one before opening a temporary connection instead
+READ_POOL_SIZE = 4
+READ_SLOT_TIMEOUT = 0.5
+
+# Applied to read-only connections used by the query endpoints
+READ_ONLY_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+# Columns added after the initial schema: (name, type)
+REPOSITORY_MIGRATIONS = (
+    ("etag", "TEXT"),
+    ("last_modified", "TEXT"),
+)
+ALERT_HISTORY_MIGRATIONS = (
+    ("old_version", "TEXT"),
+    ("reasoning", "TEXT"),
+    ("release_notes_hash", "TEXT"),
+)
+
+# Statements are kept as constants so the identical SQL text hits the
+# per-connection prepared statement cache on every call.
+GET_REPOSITORY_SQL = "SELECT * FROM repositories WHERE repo_name = ?"
+
+GET_ALL_REPOSITORIES_SQL = "SELECT * FROM repositories ORDER BY repo_name"
+
+# Names looked up per query in get_repositories(), well under SQLite's
+# bound-parameter limit; the placeholder list is filled in per batch size
+GET_REPOSITORIES_BATCH_SIZE = 500
+GET_REPOSITORIES_SQL = "SELECT * FROM repositories WHERE repo_name IN ({placeholders})"
+
+UPSERT_REPOSITORY_SQL = """
+INSERT INTO repositories 
+(repo_name, repo_url, last_checked, last_version_or_tag, 
+ last_alerted_version, severity, mandatory_upgrade, 
+ etag, last_modified, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(repo_name) DO UPDATE 
+SET repo_url = excluded.repo_url,
+    last_checked = excluded.last_checked,
+    last_version_or_tag = COALESCE(excluded.last_version_or_tag, 
+                                   last_version_or_tag),
+    last_alerted_version = COALESCE(excluded.last_alerted_version, 
+                                    last_alerted_version),
+    severity = COALESCE(excluded.severity, severity),
+    mandatory_upgrade = excluded.mandatory_upgrade,
+    etag = COALESCE(excluded.etag, etag),
+    last_modified = COALESCE(excluded.last_modified, last_modified),
+    updated_at = excluded.updated_at
+"""
+
+INSERT_ALERT_SQL = """
+INSERT INTO alert_history 
+(repo_name, version, severity, mandatory_upgrade, summary, alerted_at,
+ old_version, reasoning, release_notes_hash)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+GET_ALERT_HISTORY_SQL = """
+SELECT * FROM alert_history 
+ORDER BY alerted_at DESC 
+LIMIT ?
+"""
+
+GET_REPO_ALERT_HISTORY_SQL = """
+SELECT * FROM alert_history 
+WHERE repo_name = ? 
+ORDER BY alerted_at DESC 
+LIMIT ?
+"""
+
+GET_CACHED_ANALYSIS_SQL = """
+SELECT severity, mandatory_upgrade, summary, reasoning FROM alert_history 
+WHERE repo_name = ? AND version = ? AND old_version = ? AND release_notes_hash = ? 
+ORDER BY alerted_at DESC 
+LIMIT 1
+"""
+
+
+def release_notes_hash(release_notes: str) -> str:
+    """
+    Fingerprint release notes for matching a stored analysis.
+    
+    Args:
+        release_notes: Release notes text.
+        
+    Returns:
+        Hex digest of the notes.
+    """
+    return hashlib.blake2b(release_notes.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _ThreadConnections:
+    """Connections owned by one thread; kept in a thread-local so they die with it."""
+    
+    __slots__ = ("conn", "__weakref__")
+    
+    def __init__(self):
+        self.conn: Optional[sqlite3.Connection] = None
+
+
+def _release_connection(connections: List[sqlite3.Connection], lock: threading.Lock,
+                        conn: sqlite3.Connection) -> None:
+    """
+    Close a thread's connection once its thread has exited.
+    
+    Args:
+        connections: The database's list of open connections.
+        lock: Lock guarding that list.
+        conn: Connection to close.
+    """
+    with lock:
+        try:
+            connections.remove(conn)
+        except ValueError:
+            # Already closed by Database.close()
+            return
+    conn.close()
+
+
 class Database:
     """SQLite database manager for blockchain monitor."""
     
@@ -22,6 +163,11 @@ class Database:
             db_path: Path to SQLite database file.
         """
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._idle_readers: deque = deque()
+        self._reader_slots = threading.BoundedSemaphore(READ_POOL_SIZE)
         self._ensure_db_directory()
         self._init_schema()
     
@@ -31,24 +177,149 @@ class Database:
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir)
     
+    def _open(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open and configure a new connection tracked for close().
+        
+        Args:
+            read_only: Open a mode=ro connection with the read-only pragmas.
+        
+        Returns:
+            sqlite3.Connection: Database connection.
+        """
+        if read_only:
+            database = Path(os.path.abspath(self.db_path)).as_uri() + "?mode=ro"
+        else:
+            database = self.db_path
+        
+        conn = sqlite3.connect(
+            database,
+            uri=read_only,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in READ_ONLY_PRAGMAS if read_only else CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's persistent connection, opening it on first use.
+        
+        The connection is closed when the thread exits, so short-lived
+        threads (per-cycle worker pools, per-request server threads) do
+        not leave connections and file descriptors behind.
+        
+        Returns:
+            sqlite3.Connection: Database connection.
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _ThreadConnections()
+            self._local.holder = holder
+        
+        if holder.conn is None:
+            holder.conn = self._open()
+            # The thread-local holder is dropped when its thread exits
+            weakref.finalize(
+                holder, _release_connection, self._connections, self._connections_lock,
+                holder.conn
+            )
+        return holder.conn
+    
     @contextmanager
     def _get_connection(self):
         """
-        Context manager for database connections.
+        Context manager for a database transaction.
+        
+        Commits on success and rolls back on error. The underlying
+        connection stays open and is reused by the same thread.
         
         Yields:
             sqlite3.Connection: Database connection.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        conn = self._connect()
+        with conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+    
+    @contextmanager
+    def read_only(self):
+        """
+        Context manager for read-only queries.
+        
+        Borrows a mode=ro connection with query_only set from a pool of
+        at most READ_POOL_SIZE, so API reads never contend with the
+        monitor's writes under WAL and request threads do not each keep
+        a connection open. Streaming readers hold their connection until
+        the response finishes; if the pool stays exhausted for
+        READ_SLOT_TIMEOUT seconds (e.g. stalled clients), a temporary
+        connection is opened and closed afterwards instead of blocking.
+        
+        Yields:
+            sqlite3.Connection: Read-only database connection.
+        """
+        if not self._reader_slots.acquire(timeout=READ_SLOT_TIMEOUT):
+            conn = self._open(read_only=True)
+            try:
+                yield conn
+            finally:
+                _release_connection(self._connections, self._connections_lock, conn)
+            return
+        
+        try:
+            try:
+                conn = self._idle_readers.pop()
+            except IndexError:
+                conn = self._open(read_only=True)
+            try:
+                yield conn
+            finally:
+                self._idle_readers.append(conn)
         finally:
+            self._reader_slots.release()
+    
+    def _stream_rows(self, sql: str, params: Tuple = ()) -> Iterator[sqlite3.Row]:
+        """
+        Run a read-only query and stream its rows.
+        
+        The query runs before this returns; the pooled connection is
+        given back once the rows are exhausted or the iterator is closed.
+        
+        Args:
+            sql: Query to run.
+            params: Query parameters.
+        
+        Returns:
+            Iterator of sqlite3.Row objects.
+        """
+        def rows() -> Iterator[Optional[sqlite3.Row]]:
+            with self.read_only() as conn:
+                cursor = conn.execute(sql, params)
+                try:
+                    # Pause here so the query has run before the caller
+                    # starts iterating
+                    yield None
+                    yield from cursor
+                finally:
+                    cursor.close()
+        
+        iterator = rows()
+        next(iterator)
+        return iterator
+    
+    def close(self) -> None:
+        """Close all connections opened by this database instance."""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        self._idle_readers.clear()
+        for conn in connections:
             conn.close()
+        self._local = threading.local()
     
     def _init_schema(self):
         """Initialize database schema."""
@@ -62,6 +333,8 @@ class Database:
             last_alerted_version TEXT,
             severity TEXT,
             mandatory_upgrade INTEGER DEFAULT 0,
+            etag TEXT,
+            last_modified TEXT,
             created_at TEXT NOT NULL,
             updated_at TEXT NOT NULL
         );
@@ -74,16 +347,33 @@ class Database:
             mandatory_upgrade INTEGER NOT NULL,
             summary TEXT,
             alerted_at TEXT NOT NULL,
+            old_version TEXT,
+            reasoning TEXT,
+            release_notes_hash TEXT,
             FOREIGN KEY (repo_name) REFERENCES repositories (repo_name)
         );
         
         CREATE INDEX IF NOT EXISTS idx_repo_name ON repositories(repo_name);
-        CREATE INDEX IF NOT EXISTS idx_alert_repo ON alert_history(repo_name);
+        CREATE INDEX IF NOT EXISTS idx_alert_repo_date ON alert_history(repo_name, alerted_at DESC);
+        DROP INDEX IF EXISTS idx_alert_repo;
         CREATE INDEX IF NOT EXISTS idx_alert_date ON alert_history(alerted_at);
+        CREATE INDEX IF NOT EXISTS idx_alert_repo_version ON alert_history(repo_name, version);
         """
         
         with self._get_connection() as conn:
             conn.executescript(schema)
+            
+            # Add columns missing from databases created by older versions
+            for table, migrations in (("repositories", REPOSITORY_MIGRATIONS),
+                                      ("alert_history", ALERT_HISTORY_MIGRATIONS)):
+                existing = {
+                    row["name"] for row in conn.execute(f"PRAGMA table_info({table})")
+                }
+                for column, column_type in migrations:
+                    if column not in existing:
+                        conn.execute(
+                            f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"
+                        )
     
     def get_repository(self, repo_name: str) -> Optional[Repository]:
         """
@@ -96,27 +386,80 @@ class Database:
             Repository object or None if not found.
         """
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM repositories WHERE repo_name = ?",
-                (repo_name,)
-            )
+            cursor = conn.execute(GET_REPOSITORY_SQL, (repo_name,))
             row = cursor.fetchone()
             
             if row:
-                return Repository(
-                    id=row["id"],
-                    repo_name=row["repo_name"],
-                    repo_url=row["repo_url"],
-                    last_checked=row["last_checked"],
-                    last_version_or_tag=row["last_version_or_tag"],
-                    last_alerted_version=row["last_alerted_version"],
-                    severity=row["severity"],
-                    mandatory_upgrade=bool(row["mandatory_upgrade"]),
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"]
-                )
+                return self._repository_from_row(row)
             return None
     
+    def get_repositories(self, repo_names: List[str]) -> Dict[str, Repository]:
+        """
+        Get several repositories by name with batched IN (...) queries.
+        
+        Args:
+            repo_names: Repository names (owner/repo).
+            
+        Returns:
+            Mapping of repository name to Repository; names not in the
+            database are left out.
+        """
+        names = list(dict.fromkeys(repo_names))
+        repositories: Dict[str, Repository] = {}
+        
+        with self._get_connection() as conn:
+            for start in range(0, len(names), GET_REPOSITORIES_BATCH_SIZE):
+                batch = names[start:start + GET_REPOSITORIES_BATCH_SIZE]
+                sql = GET_REPOSITORIES_SQL.format(placeholders=", ".join("?" * len(batch)))
+                for row in conn.execute(sql, batch):
+                    repositories[row["repo_name"]] = self._repository_from_row(row)
+        
+        return repositories
+    
+    @staticmethod
+    def _repository_from_row(row: sqlite3.Row) -> Repository:
+        """Build a Repository from a repositories table row."""
+        return Repository(
+            id=row["id"],
+            repo_name=row["repo_name"],
+            repo_url=row["repo_url"],
+            last_checked=row["last_checked"],
+            last_version_or_tag=row["last_version_or_tag"],
+            last_alerted_version=row["last_alerted_version"],
+            severity=row["severity"],
+            mandatory_upgrade=bool(row["mandatory_upgrade"]),
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+    
+    def iter_all_repositories_raw(self) -> Iterator[sqlite3.Row]:
+        """
+        Iterate over all monitored repositories as raw rows.
+        
+        The query runs immediately, but rows are fetched from the cursor
+        as the caller consumes them, so large result sets can be
+        streamed without materializing a list. The read-only connection
+        returns to the pool when iteration finishes.
+        
+        Returns:
+            Iterator of sqlite3.Row objects.
+        """
+        return self._stream_rows(GET_ALL_REPOSITORIES_SQL)
+    
+    def get_all_repositories_raw(self) -> List[sqlite3.Row]:
+        """
+        Get all monitored repositories as raw rows.
+        
+        Cheaper than get_all_repositories() for callers that only
+        serialize the columns.
+        
+        Returns:
+            List of sqlite3.Row objects.
+        """
+        return list(self.iter_all_repositories_raw())
+    
     def get_all_repositories(self) -> List[Repository]:
         """
         Get all monitored repositories.
@@ -124,31 +467,16 @@ class Database:
         Returns:
             List of Repository objects.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM repositories ORDER BY repo_name")
-            rows = cursor.fetchall()
-            
-            return [
-                Repository(
-                    id=row["id"],
-                    repo_name=row["repo_name"],
-                    repo_url=row["repo_url"],
-                    last_checked=row["last_checked"],
-                    last_version_or_tag=row["last_version_or_tag"],
-                    last_alerted_version=row["last_alerted_version"],
-                    severity=row["severity"],
-                    mandatory_upgrade=bool(row["mandatory_upgrade"]),
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"]
-                )
-                for row in rows
-            ]
+        return [self._repository_from_row(row) for row in self.get_all_repositories_raw()]
     
     def upsert_repository(self, repo_name: str, repo_url: str, 
                          last_version_or_tag: Optional[str] = None,
                          last_alerted_version: Optional[str] = None,
                          severity: Optional[str] = None,
-                         mandatory_upgrade: bool = False) -> None:
+                         mandatory_upgrade: bool = False,
+                         etag: Optional[str] = None,
+                         last_modified: Optional[str] = None,
+                         now: Optional[str] = None) -> None:
         """
         Insert or update repository record.
         
@@ -159,47 +487,43 @@ class Database:
             last_alerted_version: Last version that triggered an alert.
             severity: Severity level.
             mandatory_upgrade: Whether upgrade is mandatory.
+            etag: ETag of the last release lookup ("" clears it).
+            last_modified: Last-Modified of the last release lookup ("" clears it).
+            now: ISO timestamp to record; defaults to the current UTC time.
+        """
+        now = now or datetime.utcnow().isoformat()
+        
+        with self._get_connection() as conn:
+            conn.execute(
+                UPSERT_REPOSITORY_SQL,
+                (repo_name, repo_url, now, last_version_or_tag,
+                 last_alerted_version, severity, int(mandatory_upgrade), 
+                 etag, last_modified, now, now)
+            )
+    
+    def upsert_repositories_bulk(self, items: List[Tuple[str, str]]) -> None:
+        """
+        Insert or update several repositories in a single transaction.
+        
+        Args:
+            items: List of (repo_name, repo_url) tuples.
         """
         now = datetime.utcnow().isoformat()
         
         with self._get_connection() as conn:
-            # Check if repository exists
-            existing = self.get_repository(repo_name)
-            
-            if existing:
-                # Update existing
-                conn.execute(
-                    """
-                    UPDATE repositories 
-                    SET repo_url = ?,
-                        last_checked = ?,
-                        last_version_or_tag = COALESCE(?, last_version_or_tag),
-                        last_alerted_version = COALESCE(?, last_alerted_version),
-                        severity = COALESCE(?, severity),
-                        mandatory_upgrade = ?,
-                        updated_at = ?
-                    WHERE repo_name = ?
-                    """,
-                    (repo_url, now, last_version_or_tag, last_alerted_version,
-                     severity, int(mandatory_upgrade), now, repo_name)
-                )
-            else:
-                # Insert new
-                conn.execute(
-                    """
-                    INSERT INTO repositories 
-                    (repo_name, repo_url, last_checked, last_version_or_tag, 
-                     last_alerted_version, severity, mandatory_upgrade, 
-                     created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (repo_name, repo_url, now, last_version_or_tag,
-                     last_alerted_version, severity, int(mandatory_upgrade), 
-                     now, now)
-                )
+            conn.executemany(
+                UPSERT_REPOSITORY_SQL,
+                [
+                    (repo_name, repo_url, now, None, None, None, 0, None, None, now, now)
+                    for repo_name, repo_url in items
+                ]
+            )
     
     def add_alert_history(self, repo_name: str, version: str, severity: str,
-                          mandatory_upgrade: bool, summary: str) -> None:
+                          mandatory_upgrade: bool, summary: str,
+                          now: Optional[str] = None, old_version: Optional[str] = None,
+                          reasoning: Optional[str] = None,
+                          release_notes_hash: Optional[str] = None) -> None:
         """
         Add alert to history.
         
@@ -209,19 +533,50 @@ class Database:
             severity: Severity level.
             mandatory_upgrade: Whether upgrade is mandatory.
             summary: AI-generated summary.
+            now: ISO timestamp to record; defaults to the current UTC time.
+            old_version: Version the alert upgraded from.
+            reasoning: AI-generated reasoning.
+            release_notes_hash: release_notes_hash() of the analysed notes.
         """
-        now = datetime.utcnow().isoformat()
+        now = now or datetime.utcnow().isoformat()
         
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO alert_history 
-                (repo_name, version, severity, mandatory_upgrade, summary, alerted_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (repo_name, version, severity, int(mandatory_upgrade), summary, now)
+                INSERT_ALERT_SQL,
+                (repo_name, version, severity, int(mandatory_upgrade), summary, now,
+                 old_version, reasoning, release_notes_hash)
             )
     
+    def iter_alert_history_raw(self, repo_name: Optional[str] = None, 
+                               limit: int = 50) -> Iterator[sqlite3.Row]:
+        """
+        Iterate over alert history as raw rows.
+        
+        Args:
+            repo_name: Optional repository name to filter by.
+            limit: Maximum number of records to return.
+            
+        Returns:
+            Iterator of sqlite3.Row objects.
+        """
+        if repo_name:
+            return self._stream_rows(GET_REPO_ALERT_HISTORY_SQL, (repo_name, limit))
+        return self._stream_rows(GET_ALERT_HISTORY_SQL, (limit,))
+    
+    def get_alert_history_raw(self, repo_name: Optional[str] = None, 
+                              limit: int = 50) -> List[sqlite3.Row]:
+        """
+        Get alert history as raw rows.
+        
+        Args:
+            repo_name: Optional repository name to filter by.
+            limit: Maximum number of records to return.
+            
+        Returns:
+            List of sqlite3.Row objects.
+        """
+        return list(self.iter_alert_history_raw(repo_name, limit))
+    
     def get_alert_history(self, repo_name: Optional[str] = None, 
                          limit: int = 50) -> List[AlertHistory]:
         """
@@ -234,38 +589,48 @@ class Database:
         Returns:
             List of AlertHistory objects.
         """
-        with self._get_connection() as conn:
-            if repo_name:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM alert_history 
-                    WHERE repo_name = ? 
-                    ORDER BY alerted_at DESC 
-                    LIMIT ?
-                    """,
-                    (repo_name, limit)
-                )
-            else:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM alert_history 
-                    ORDER BY alerted_at DESC 
-                    LIMIT ?
-                    """,
-                    (limit,)
-                )
+        rows = self.get_alert_history_raw(repo_name, limit)
+        
+        return [
+            AlertHistory(
+                id=row["id"],
+                repo_name=row["repo_name"],
+                version=row["version"],
+                severity=row["severity"],
+                mandatory_upgrade=bool(row["mandatory_upgrade"]),
+                summary=row["summary"],
+                alerted_at=row["alerted_at"]
+            )
+            for row in rows
+        ]
+    
+    def get_cached_analysis(self, repo_name: str, old_version: str, version: str,
+                            release_notes_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the analysis recorded when the same update was last alerted on.
+        
+        Only an alert for the same version change with unchanged release
+        notes matches, so the stored analysis describes exactly this update.
+        
+        Args:
+            repo_name: Repository name.
+            old_version: Version the update starts from.
+            version: Version to look up.
+            release_notes_hash: release_notes_hash() of the current notes.
             
-            rows = cursor.fetchall()
+        Returns:
+            Analysis dictionary or None if this update was never alerted.
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                GET_CACHED_ANALYSIS_SQL, (repo_name, version, old_version, release_notes_hash)
+            ).fetchone()
             
-            return [
-                AlertHistory(
-                    id=row["id"],
-                    repo_name=row["repo_name"],
-                    version=row["version"],
-                    severity=row["severity"],
-                    mandatory_upgrade=bool(row["mandatory_upgrade"]),
-                    summary=row["summary"],
-                    alerted_at=row["alerted_at"]
-                )
-                for row in rows
-            ]
+            if row:
+                return {
+                    "summary": row["summary"] or "",
+                    "mandatory_upgrade": bool(row["mandatory_upgrade"]),
+                    "severity": row["severity"],
+                    "reasoning": row["reasoning"] or ""
+                }
+            return None
@@ -0,0 +1,60 @@
+"""
+JSON encoding and decoding helpers.
+Uses orjson when it is installed and falls back to the standard library.
+Kept free of Flask so services and CLI scripts can import it cheaply.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON from bytes or str.
+    
+    Args:
+        data: Raw JSON document.
+    
+    Returns:
+        Parsed Python object.
+    
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize obj to a compact JSON string.
+    
+    Args:
+        obj: Object to serialize.
+    
+    Returns:
+        JSON document.
+    """
+    if orjson:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def dumpb(obj: Any) -> bytes:
+    """
+    Serialize obj to compact UTF-8 JSON bytes, ready for a request body.
+    
+    Args:
+        obj: Object to serialize.
+    
+    Returns:
+        JSON document as bytes.
+    """
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,42 @@
+"""
+Flask JSON provider.
+Serves jsonify() responses through orjson when it is installed; only
+the app factory imports this module.
+"""
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+from app.json_codec import orjson
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used for jsonify() responses."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a compact JSON string, keeping dict key order."""
+        # orjson output is always compact; anything else (indent in debug
+        # mode, sort_keys, ...) goes through the stdlib encoder
+        if kwargs.get("separators", (",", ":")) == (",", ":"):
+            kwargs.pop("separators", None)
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize a JSON string or bytes."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def configure_json(app) -> None:
+    """
+    Install the orjson provider on a Flask app when orjson is available.
+    
+    Args:
+        app: Flask application.
+    """
+    if orjson:
+        app.json = OrjsonProvider(app)
+
@@ -3,17 +3,33 @@ Main application entry point.
 Runs Flask API server and scheduled monitoring tasks.
 """
 from flask import Flask
-from apscheduler.schedulers.background import BackgroundScheduler
 import atexit
+import logging
+import logging.handlers
+import queue
+import sys
 
 from app.config import Config
-from app.db.database import Database
-from app.services.repository_service import RepositoryService
-from app.services.gemini_service import GeminiService
-from app.services.email_service import EmailService
-from app.services.slack_service import SlackService
-from app.routes.api import api_bp, init_routes
-from app.monitor import check_all_repositories
+
+
+def configure_logging() -> None:
+    """
+    Send application logs to stdout at the configured level.
+    
+    Records are handed to a queue and written by a listener thread, so
+    request and worker threads never block on stdout.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(getattr(logging, Config.LOG_LEVEL, logging.INFO))
 
 
 def create_app() -> Flask:
@@ -32,15 +48,31 @@ def create_app() -> Flask:
         print("\nPlease check your .env file.")
         exit(1)
     
+    # Import services lazily so importing this module stays cheap
+    from app.scheduler import IntervalScheduler
+    from app.db.database import Database
+    from app.services.repository_service import RepositoryService
+    from app.services.gemini_service import GeminiService
+    from app.services.email_service import EmailService
+    from app.services.slack_service import SlackService
+    from app.services.http import create_session
+    from app.json_provider import configure_json
+    from app.routes import api
+    from app.routes.api import api_bp, init_routes
+    from app.monitor import check_all_repositories
+    
     # Initialize services
     print("Initializing services...")
     
     db = Database(Config.DATABASE_PATH)
     tag_filters = Config.get_repo_tag_filters()
-    repo_service = RepositoryService(tag_filters=tag_filters)
+    
+    # One pooled HTTP session shared by every service that speaks HTTP
+    http_session = create_session()
+    repo_service = RepositoryService(tag_filters=tag_filters, session=http_session)
     gemini_service = GeminiService()
     email_service = EmailService()
-    slack_service = SlackService()
+    slack_service = SlackService(session=http_session)
     
     print("✓ Database initialized")
     print("✓ Repository service initialized (GitHub + GitLab)")
@@ -63,22 +95,22 @@ def create_app() -> Flask:
     
     # Initialize monitored repositories in database
     print("\nInitializing monitored repositories:")
+    repo_items = []
     for repo_name in Config.MONITORED_REPOS:
         repo_url = repo_service.get_repo_url(repo_name)
         platform = repo_service.get_platform(repo_name)
-        db.upsert_repository(repo_name, repo_url)
+        repo_items.append((repo_name, repo_url))
         print(f"  - {repo_name} [{platform}]")
+    db.upsert_repositories_bulk(repo_items)
     
     # Create Flask app
     app = Flask(__name__)
+    configure_json(app)
     
     # Initialize routes with services
     init_routes(db, repo_service, gemini_service, email_service, slack_service)
     app.register_blueprint(api_bp)
     
-    # Setup scheduler for periodic checks
-    scheduler = BackgroundScheduler()
-    
     def scheduled_check():
         """Scheduled repository check task."""
         with app.app_context():
@@ -88,20 +120,24 @@ def create_app() -> Flask:
             )
     
     # Schedule periodic checks
-    scheduler.add_job(
-        func=scheduled_check,
-        trigger="interval",
-        minutes=Config.CHECK_INTERVAL_MINUTES,
-        id="repository_check",
-        name="Check repositories for updates"
+    scheduler = IntervalScheduler(
+        scheduled_check,
+        interval_seconds=Config.CHECK_INTERVAL_MINUTES * 60,
+        name="repository-check"
     )
     
     # Start scheduler
     scheduler.start()
     print(f"\n✓ Scheduler started (checking every {Config.CHECK_INTERVAL_MINUTES} minutes)")
     
-    # Shutdown scheduler on exit
+    # On exit (handlers run last-registered first): flush queued Slack alerts
+    # and emails, stop webhook workers and the scheduler, then close pooled
+    # HTTP connections
+    atexit.register(http_session.close)
     atexit.register(lambda: scheduler.shutdown())
+    atexit.register(lambda: api.webhook_queue.shutdown(wait=False))
+    atexit.register(lambda: email_service.shutdown())
+    atexit.register(lambda: slack_service.shutdown())
     
     # Run initial check
     print("\nRunning initial repository check...")
@@ -113,6 +149,8 @@ def create_app() -> Flask:
 
 def main():
     """Main application entry point."""
+    configure_logging()
+    
     print("="*60)
     print("Blockchain Release Monitor")
     print("="*60)
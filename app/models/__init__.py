@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Repository:
     """Repository monitoring record."""
     
@@ -18,9 +18,11 @@ class Repository:
     mandatory_upgrade: bool
     created_at: Optional[str]
     updated_at: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AlertHistory:
     """Alert history record."""
     
@@ -1,21 +1,104 @@
 """
 Monitoring logic for checking repository updates.
 """
-from typing import Dict, Any
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import logging
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 
-from app.db.database import Database
-from app.services.repository_service import RepositoryService
-from app.services.gemini_service import GeminiService
-from app.services.email_service import EmailService
-from app.services.slack_service import SlackService
 from app.config import Config
+from app.db.database import release_notes_hash
+
+if TYPE_CHECKING:
+    # Only needed for annotations; avoid importing service SDKs at load time
+    from app.db.database import Database
+    from app.models import Repository
+    from app.services.repository_service import RepositoryService
+    from app.services.gemini_service import GeminiService
+    from app.services.email_service import EmailService
+    from app.services.slack_service import SlackService
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on repositories checked concurrently
+MAX_CHECK_WORKERS = 16
+
+
+def _record_alert(db: Database, alert: Dict[str, Any], notes_hash: str, now: str) -> None:
+    """
+    Store a delivered alert as the repository's last alerted version.
+    
+    Args:
+        db: Database instance.
+        alert: send_alert() keyword arguments of the delivered alert.
+        notes_hash: release_notes_hash() of the analysed release notes.
+        now: Timestamp for the database writes.
+    """
+    analysis = alert["analysis"]
+    db.upsert_repository(
+        alert["repo_name"],
+        alert["repo_url"],
+        last_alerted_version=alert["new_version"],
+        now=now
+    )
+    
+    # Add to alert history
+    db.add_alert_history(
+        repo_name=alert["repo_name"],
+        version=alert["new_version"],
+        severity=analysis.get("severity", "MEDIUM"),
+        mandatory_upgrade=analysis.get("mandatory_upgrade", False),
+        summary=analysis.get("summary", ""),
+        now=now,
+        old_version=alert["old_version"],
+        reasoning=analysis.get("reasoning", ""),
+        release_notes_hash=notes_hash
+    )
+
+
+def _alert_result(alert: Dict[str, Any], alerts_sent: Dict[str, bool]) -> Dict[str, Any]:
+    """
+    Build the check result for an alert.
+    
+    Args:
+        alert: send_alert() keyword arguments of the alert.
+        alerts_sent: Delivery outcome per channel ("email", "slack").
+        
+    Returns:
+        Result dictionary with status alert_sent or alert_failed.
+    """
+    if alerts_sent["email"] or alerts_sent["slack"]:
+        analysis = alert["analysis"]
+        return {
+            "repo_name": alert["repo_name"],
+            "status": "alert_sent",
+            "old_version": alert["old_version"],
+            "new_version": alert["new_version"],
+            "severity": analysis.get("severity", "MEDIUM"),
+            "mandatory_upgrade": analysis.get("mandatory_upgrade", False),
+            "email_sent": alerts_sent["email"],
+            "slack_sent": alerts_sent["slack"],
+            "summary": analysis.get("summary")
+        }
+    return {
+        "repo_name": alert["repo_name"],
+        "status": "alert_failed",
+        "old_version": alert["old_version"],
+        "new_version": alert["new_version"],
+        "message": "All notification methods failed"
+    }
 
 
 def check_repository_updates(repo_name: str, db: Database, 
                             repo_service: RepositoryService,
                             gemini_service: GeminiService,
                             email_service: EmailService,
-                            slack_service: SlackService) -> Dict[str, Any]:
+                            slack_service: SlackService,
+                            slack_batch: Optional[List[Tuple[Dict[str, Any], Dict[str, Any], str]]] = None,
+                            known_repos: Optional[Dict[str, Repository]] = None) -> Dict[str, Any]:
     """
     Check for updates in a single repository.
     
@@ -25,25 +108,47 @@ def check_repository_updates(repo_name: str, db: Database,
         github_service: Repository service instance.
         gemini_service: Gemini service instance.
         email_service: Email service instance.
+        slack_service: Slack service instance.
+        slack_batch: If given, the Slack alert, this check's result and
+            the release notes hash are appended here for the caller to send in one batch instead of
+            being posted directly; the caller then settles the result from
+            the batch outcome.
+        known_repos: Database records prefetched by the caller; when given,
+            a repository missing from it is treated as not yet stored.
         
     Returns:
         Result dictionary with update information.
     """
-    print(f"\nChecking {repo_name}...")
+    logger.info("Checking %s...", repo_name)
+    
+    # One timestamp for every database write made by this check
+    now = datetime.utcnow().isoformat()
     
     try:
-        # Get repository from database
-        repo = db.get_repository(repo_name)
+        # Get repository from database (or the caller's bulk lookup)
+        if known_repos is not None:
+            repo = known_repos.get(repo_name)
+        else:
+            repo = db.get_repository(repo_name)
         last_version = repo.last_version_or_tag if repo else None
         
         # Get repo URL
         repo_url = repo_service.get_repo_url(repo_name)
         
-        # Check for updates
-        update_info = repo_service.check_for_updates(repo_name, last_version)
+        # Check for updates, sending the stored HTTP validators if any
+        update_info = repo_service.check_for_updates(
+            repo_name, 
+            last_version,
+            etag=repo.etag if repo else None,
+            last_modified=repo.last_modified if repo else None
+        )
+        
+        # Validators to store for the next check ("" clears stale ones)
+        etag = update_info.get("etag") or ""
+        last_modified = update_info.get("last_modified") or ""
         
         if "error" in update_info:
-            print(f"  Error: {update_info['error']}")
+            logger.warning("%s: error: %s", repo_name, update_info["error"])
             return {
                 "repo_name": repo_name,
                 "status": "error",
@@ -51,10 +156,17 @@ def check_repository_updates(repo_name: str, db: Database,
             }
         
         if not update_info.get("has_update"):
-            print(f"  No updates. Current version: {update_info.get('current_version')}")
+            logger.info("%s: no updates. Current version: %s", 
+                        repo_name, update_info.get("current_version"))
             
             # Update last checked time
-            db.upsert_repository(repo_name, repo_url)
+            db.upsert_repository(
+                repo_name, 
+                repo_url, 
+                etag=etag, 
+                last_modified=last_modified, 
+                now=now
+            )
             
             return {
                 "repo_name": repo_name,
@@ -67,18 +179,22 @@ def check_repository_updates(repo_name: str, db: Database,
         old_version = update_info["old_version"] or "N/A"
         is_first_check = update_info.get("is_first_check", False)
         
-        print(f"  New version detected: {old_version} → {new_version}")
+        logger.info("%s: new version detected: %s → %s", 
+                    repo_name, old_version, new_version)
         
         # Update database with new version
         db.upsert_repository(
             repo_name, 
             repo_url, 
-            last_version_or_tag=new_version
+            last_version_or_tag=new_version,
+            etag=etag,
+            last_modified=last_modified,
+            now=now
         )
         
         # Skip AI analysis and alerts for first check
         if is_first_check:
-            print(f"  First check - no alert sent")
+            logger.info("%s: first check - no alert sent", repo_name)
             return {
                 "repo_name": repo_name,
                 "status": "first_check",
@@ -86,108 +202,96 @@ def check_repository_updates(repo_name: str, db: Database,
                 "message": "Repository initialized. Will alert on next update."
             }
         
-        # Perform AI analysis
-        print(f"  Analyzing changes with AI...")
+        # Reuse the stored analysis of this exact update (same versions,
+        # unchanged release notes) if it was alerted on before
+        release_notes = update_info.get("release_notes") or ""
+        notes_hash = release_notes_hash(release_notes)
+        analysis = db.get_cached_analysis(repo_name, old_version, new_version, notes_hash)
         
-        analysis = gemini_service.analyze_version_change(
-            repo_name=repo_name,
-            old_version=old_version,
-            new_version=new_version,
-            release_notes=update_info.get("release_notes", ""),
-            commit_messages=update_info.get("commit_messages", [])
-        )
+        if analysis:
+            logger.info("%s: using cached analysis", repo_name)
+        else:
+            # Perform AI analysis
+            logger.info("%s: analyzing changes with AI...", repo_name)
+            
+            analysis = gemini_service.analyze_version_change(
+                repo_name=repo_name,
+                old_version=old_version,
+                new_version=new_version,
+                release_notes=release_notes,
+                commit_messages=update_info.get("commit_messages", [])
+            )
         
         severity = analysis.get("severity", "MEDIUM")
         mandatory = analysis.get("mandatory_upgrade", False)
         
-        print(f"  Severity: {severity}, Mandatory: {mandatory}")
-        print(f"  Summary: {analysis.get('summary', '')[:100]}...")
+        logger.info("%s: severity: %s, mandatory: %s", repo_name, severity, mandatory)
+        logger.debug("%s: summary: %.100s...", repo_name, analysis.get("summary", ""))
         
         # Update database with analysis
         db.upsert_repository(
             repo_name,
             repo_url,
             severity=severity,
-            mandatory_upgrade=mandatory
+            mandatory_upgrade=mandatory,
+            now=now
         )
         
         # Decide if alert should be sent
         should_alert = gemini_service.should_send_alert(analysis)
         
         if should_alert:
-            print(f"  Sending alerts...")
+            logger.info("%s: sending alerts...", repo_name)
             
             alerts_sent = {"email": False, "slack": False}
+            alert_kwargs = {
+                "repo_name": repo_name,
+                "old_version": old_version,
+                "new_version": new_version,
+                "analysis": analysis,
+                "repo_url": repo_url
+            }
+            pending = {}
+            slack_deferred = False
             
             # Send email alert if enabled
             if Config.EMAIL_ALERTS_ENABLED:
-                print(f"    Sending email alert...")
-                email_sent = email_service.send_alert(
-                    repo_name=repo_name,
-                    old_version=old_version,
-                    new_version=new_version,
-                    analysis=analysis,
-                    repo_url=repo_url
-                )
-                alerts_sent["email"] = email_sent
+                logger.debug("%s: sending email alert...", repo_name)
+                # Resolves once the email sender has delivered it (or given up)
+                pending["email"] = email_service.send_alert(**alert_kwargs)
             else:
-                print(f"    Email alerts disabled")
+                logger.debug("%s: email alerts disabled", repo_name)
             
             # Send Slack alert if enabled
-            if Config.SLACK_ALERTS_ENABLED and slack_service.enabled:
-                print(f"    Sending Slack alert...")
-                slack_sent = slack_service.send_alert(
-                    repo_name=repo_name,
-                    old_version=old_version,
-                    new_version=new_version,
-                    analysis=analysis,
-                    repo_url=repo_url
-                )
-                alerts_sent["slack"] = slack_sent
+            if Config.SLACK_ALERTS_ENABLED and slack_service.enabled and slack_batch is not None:
+                logger.debug("%s: queueing Slack alert for batch", repo_name)
+                slack_deferred = True
+            elif Config.SLACK_ALERTS_ENABLED and slack_service.enabled:
+                logger.debug("%s: sending Slack alert...", repo_name)
+                pending["slack"] = slack_service.send_alert(**alert_kwargs)
             elif not Config.SLACK_ALERTS_ENABLED:
-                print(f"    Slack alerts disabled")
+                logger.debug("%s: Slack alerts disabled", repo_name)
+            
+            # Email and Slack senders deliver in the background; wait for each result
+            for channel, future in pending.items():
+                try:
+                    alerts_sent[channel] = future.result()
+                except Exception as e:
+                    logger.error("%s: %s alert failed: %s", repo_name, channel, e)
             
-            # Update last alerted version if at least one alert was sent
+            # Update last alerted version only once a channel confirmed delivery
             if alerts_sent["email"] or alerts_sent["slack"]:
-                db.upsert_repository(
-                    repo_name,
-                    repo_url,
-                    last_alerted_version=new_version
-                )
-                
-                # Add to alert history
-                db.add_alert_history(
-                    repo_name=repo_name,
-                    version=new_version,
-                    severity=severity,
-                    mandatory_upgrade=mandatory,
-                    summary=analysis.get("summary", "")
-                )
-                
-                print(f"  ✓ Alert sent successfully")
-                
-                return {
-                    "repo_name": repo_name,
-                    "status": "alert_sent",
-                    "old_version": old_version,
-                    "new_version": new_version,
-                    "severity": severity,
-                    "mandatory_upgrade": mandatory,
-                    "email_sent": alerts_sent["email"],
-                    "slack_sent": alerts_sent["slack"],
-                    "summary": analysis.get("summary")
-                }
-            else:
-                print(f"  ✗ All notification methods failed")
-                return {
-                    "repo_name": repo_name,
-                    "status": "alert_failed",
-                    "old_version": old_version,
-                    "new_version": new_version,
-                    "message": "All notification methods failed"
-                }
+                _record_alert(db, alert_kwargs, notes_hash, now)
+                logger.info("%s: ✓ alert sent successfully", repo_name)
+            elif not slack_deferred:
+                logger.error("%s: ✗ all notification methods failed", repo_name)
+            
+            result = _alert_result(alert_kwargs, alerts_sent)
+            if slack_deferred:
+                slack_batch.append((alert_kwargs, result, notes_hash))
+            return result
         else:
-            print(f"  No alert needed (severity too low)")
+            logger.info("%s: no alert needed (severity too low)", repo_name)
             return {
                 "repo_name": repo_name,
                 "status": "update_detected_no_alert",
@@ -198,7 +302,7 @@ def check_repository_updates(repo_name: str, db: Database,
             }
             
     except Exception as e:
-        print(f"  ✗ Error: {e}")
+        logger.exception("%s: ✗ error: %s", repo_name, e)
         return {
             "repo_name": repo_name,
             "status": "error",
@@ -210,10 +314,14 @@ def check_all_repositories(db: Database, repo_service: RepositoryService,
                           gemini_service: GeminiService, 
                           email_service: EmailService,
                           slack_service: SlackService,
-                          repo_list: list) -> None:
+                          repo_list: list) -> List[Dict[str, Any]]:
     """
     Check all monitored repositories for updates.
     
+    Stored records are read with one query and the GitHub releases of
+    repositories not stored yet are fetched in GraphQL batches before
+    the per-repository checks run.
+    
     Args:
         db: Database instance.
         github_service: Repository service instance.
@@ -221,30 +329,67 @@ def check_all_repositories(db: Database, repo_service: RepositoryService,
         email_service: Email service instance.
         slack_service: Slack service instance.
         repo_list: List of repository names to check.
+        
+    Returns:
+        Result of each check_repository_updates() call, in repo_list order.
     """
-    print(f"\n{'='*60}")
-    print(f"Starting repository check for {len(repo_list)} repositories")
-    print(f"{'='*60}")
+    logger.info("Starting repository check for %d repositories", len(repo_list))
     
     results = []
+    # Slack alerts from this cycle, posted together once all checks finish
+    slack_batch: List[Tuple[Dict[str, Any], Dict[str, Any], str]] = []
     
-    for repo_name in repo_list:
-        result = check_repository_updates(
-            repo_name, db, repo_service, gemini_service, email_service, slack_service
-        )
-        results.append(result)
+    # One batched SELECT for every stored record instead of one per check
+    known_repos = db.get_repositories(repo_list)
     
-    # Summary
-    print(f"\n{'='*60}")
-    print("Check Summary:")
-    print(f"{'='*60}")
+    # Stored repositories revalidate with a conditional REST request: the
+    # first 200 stores its validators and later checks get a free 304.
+    # Only first checks, which have nothing to revalidate, use GraphQL
+    # (a prefetched release carries no validators to store).
+    repo_service.prefetch_latest_releases(
+        repo_name for repo_name in repo_list if repo_name not in known_repos
+    )
     
+    # Checks are dominated by network I/O, so run them concurrently
+    if repo_list:
+        with ThreadPoolExecutor(max_workers=min(MAX_CHECK_WORKERS, len(repo_list))) as executor:
+            results = list(executor.map(
+                lambda repo_name: check_repository_updates(
+                    repo_name, db, repo_service, gemini_service, 
+                    email_service, slack_service, slack_batch, known_repos
+                ),
+                repo_list
+            ))
+    
+    if slack_batch:
+        logger.info("Sending %d Slack alert(s)", len(slack_batch))
+        outcomes = slack_service.send_alert_batch([alert for alert, _, _ in slack_batch])
+        now = datetime.utcnow().isoformat()
+        
+        # Settle each check's result now that its Slack outcome is known
+        for (alert, result, notes_hash), outcome in zip(slack_batch, outcomes):
+            repo_name = alert["repo_name"]
+            if not outcome.result():
+                logger.error("%s: Slack alert could not be sent", repo_name)
+                if result["status"] == "alert_failed":
+                    logger.error("%s: ✗ all notification methods failed", repo_name)
+                continue
+            
+            email_sent = result.get("email_sent", False)
+            if not email_sent:
+                _record_alert(db, alert, notes_hash, now)
+                logger.info("%s: ✓ alert sent successfully", repo_name)
+            result.clear()
+            result.update(_alert_result(alert, {"email": email_sent, "slack": True}))
+    
+    # Summary
     alerts_sent = sum(1 for r in results if r.get("status") == "alert_sent")
     errors = sum(1 for r in results if r.get("status") == "error")
     no_updates = sum(1 for r in results if r.get("status") == "no_update")
     
-    print(f"  Total repositories: {len(results)}")
-    print(f"  Alerts sent: {alerts_sent}")
-    print(f"  No updates: {no_updates}")
-    print(f"  Errors: {errors}")
-    print(f"{'='*60}\n")
+    logger.info(
+        "Check summary: %d repositories, %d alerts sent, %d with no updates, %d errors",
+        len(results), alerts_sent, no_updates, errors
+    )
+    
+    return results
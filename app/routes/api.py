@@ -2,15 +2,27 @@
 Flask API routes and webhook handler.
 Provides REST endpoints for monitoring and GitHub webhook integration.
 """
-from flask import Blueprint, jsonify, request
-from typing import Dict, Any
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import hmac
+import threading
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from typing import Dict, Any, Iterable, Iterator, Optional, TYPE_CHECKING
 
-from app.db.database import Database
 from app.config import Config
-from app.services.repository_service import RepositoryService
-from app.services.gemini_service import GeminiService
-from app.services.email_service import EmailService
-from app.services.slack_service import SlackService
+from app.json_codec import dumps as json_dumps, loads as json_loads
+from app.monitor import check_repository_updates
+from app.webhook_queue import WebhookQueue
+
+if TYPE_CHECKING:
+    # Services are injected by init_routes; only needed for annotations
+    from app.db.database import Database
+    from app.services.repository_service import RepositoryService
+    from app.services.gemini_service import GeminiService
+    from app.services.email_service import EmailService
+    from app.services.slack_service import SlackService
 
 
 # Create blueprint
@@ -23,6 +35,18 @@ gemini_service: GeminiService = None
 email_service: EmailService = None
 slack_service: SlackService = None
 
+# Webhook-triggered checks run here instead of in the request handler
+webhook_queue: WebhookQueue = None
+
+# Recently seen X-GitHub-Delivery IDs, so redeliveries are ignored
+MAX_SEEN_DELIVERIES = 4096
+_seen_deliveries: "OrderedDict[str, None]" = OrderedDict()
+_seen_deliveries_lock = threading.Lock()
+
+# Bounds for the /alerts "limit" query parameter
+DEFAULT_ALERT_LIMIT = 50
+MAX_ALERT_LIMIT = 500
+
 
 def init_routes(database: Database, repo: RepositoryService, 
                gemini: GeminiService, email: EmailService, slack: SlackService):
@@ -36,12 +60,102 @@ def init_routes(database: Database, repo: RepositoryService,
         email: Email service instance.
         slack: Slack service instance.
     """
-    global db, repo_service, gemini_service, email_service, slack_service
+    global db, repo_service, gemini_service, email_service, slack_service, webhook_queue
     db = database
     repo_service = repo
     gemini_service = gemini
     email_service = email
     slack_service = slack
+    
+    if webhook_queue is None:
+        webhook_queue = WebhookQueue(_run_webhook_check)
+        webhook_queue.start()
+
+
+def _run_webhook_check(repo_name: str) -> None:
+    """
+    Check a repository on behalf of a queued webhook event.
+    
+    Args:
+        repo_name: Repository name (owner/repo).
+    """
+    # The event means the repo just changed; don't answer from the cache
+    repo_service.invalidate_cache(repo_name)
+    check_repository_updates(
+        repo_name, db, repo_service, 
+        gemini_service, email_service, slack_service
+    )
+
+
+def _is_duplicate_delivery(delivery_id: Optional[str]) -> bool:
+    """
+    Record a webhook delivery ID and report whether it was already seen.
+    
+    Args:
+        delivery_id: Value of the X-GitHub-Delivery header.
+        
+    Returns:
+        True if this delivery was handled before.
+    """
+    if not delivery_id:
+        return False
+    
+    with _seen_deliveries_lock:
+        if delivery_id in _seen_deliveries:
+            _seen_deliveries.move_to_end(delivery_id)
+            return True
+        
+        _seen_deliveries[delivery_id] = None
+        if len(_seen_deliveries) > MAX_SEEN_DELIVERIES:
+            _seen_deliveries.popitem(last=False)
+        return False
+
+
+def _stream_json_list(key: str, items: Iterable[Dict[str, Any]]) -> Response:
+    """
+    Stream {"success": true, key: [...], "count": N} one item at a time.
+    
+    Keeps memory flat for large result sets instead of building the
+    whole list and document before responding.
+    
+    Args:
+        key: Name of the list field.
+        items: Dictionaries to serialize, consumed lazily.
+        
+    Returns:
+        Streaming JSON response.
+    """
+    def generate() -> Iterator[str]:
+        yield f'{{"success":true,"{key}":['
+        count = 0
+        for item in items:
+            yield ("," if count else "") + json_dumps(item)
+            count += 1
+        yield f'],"count":{count}}}'
+    
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+def _verify_signature(body: bytes, signature: Optional[str]) -> bool:
+    """
+    Check a webhook body against its X-Hub-Signature-256 header.
+    
+    Args:
+        body: Raw request body.
+        signature: Header value, "sha256=<hexdigest>".
+        
+    Returns:
+        True if no secret is configured or the signature matches.
+    """
+    if not Config.GITHUB_WEBHOOK_SECRET:
+        return True
+    if not signature or not signature.startswith("sha256="):
+        return False
+    
+    expected = hmac.new(
+        Config.GITHUB_WEBHOOK_SECRET.encode("utf-8"), body, hashlib.sha256
+    ).hexdigest()
+    return hmac.compare_digest(expected, signature[7:])
 
 
 @api_bp.route("/health", methods=["GET"])
@@ -68,26 +182,22 @@ def get_repositories() -> Dict[str, Any]:
         List of repositories with their status.
     """
     try:
-        repos = db.get_all_repositories()
+        rows = db.iter_all_repositories_raw()
         
-        repo_list = [
+        repo_list = (
             {
-                "repo_name": repo.repo_name,
-                "repo_url": repo.repo_url,
-                "last_checked": repo.last_checked,
-                "last_version_or_tag": repo.last_version_or_tag,
-                "last_alerted_version": repo.last_alerted_version,
-                "severity": repo.severity,
-                "mandatory_upgrade": repo.mandatory_upgrade
+                "repo_name": row["repo_name"],
+                "repo_url": row["repo_url"],
+                "last_checked": row["last_checked"],
+                "last_version_or_tag": row["last_version_or_tag"],
+                "last_alerted_version": row["last_alerted_version"],
+                "severity": row["severity"],
+                "mandatory_upgrade": bool(row["mandatory_upgrade"])
             }
-            for repo in repos
-        ]
+            for row in rows
+        )
         
-        return jsonify({
-            "success": True,
-            "count": len(repo_list),
-            "repositories": repo_list
-        })
+        return _stream_json_list("repositories", repo_list)
         
     except Exception as e:
         return jsonify({
@@ -150,8 +260,8 @@ def check_repository(repo_name: str) -> Dict[str, Any]:
         Check result.
     """
     try:
-        from app.monitor import check_repository_updates
-        
+        # A manual check should always see the live state of the repo
+        repo_service.invalidate_cache(repo_name)
         result = check_repository_updates(
             repo_name, db, repo_service, gemini_service, email_service, slack_service
         )
@@ -173,33 +283,32 @@ def get_alerts() -> Dict[str, Any]:
     """
     Get alert history.
     
+    The "limit" query parameter defaults to 50 and is clamped to 1..500.
+    
     Returns:
         List of recent alerts.
     """
     try:
         repo_name = request.args.get("repo_name")
-        limit = int(request.args.get("limit", 50))
+        limit = request.args.get("limit", DEFAULT_ALERT_LIMIT, type=int) or DEFAULT_ALERT_LIMIT
+        limit = min(max(limit, 1), MAX_ALERT_LIMIT)
         
-        alerts = db.get_alert_history(repo_name, limit)
+        rows = db.iter_alert_history_raw(repo_name, limit)
         
-        alert_list = [
+        alert_list = (
             {
-                "id": alert.id,
-                "repo_name": alert.repo_name,
-                "version": alert.version,
-                "severity": alert.severity,
-                "mandatory_upgrade": alert.mandatory_upgrade,
-                "summary": alert.summary,
-                "alerted_at": alert.alerted_at
+                "id": row["id"],
+                "repo_name": row["repo_name"],
+                "version": row["version"],
+                "severity": row["severity"],
+                "mandatory_upgrade": bool(row["mandatory_upgrade"]),
+                "summary": row["summary"],
+                "alerted_at": row["alerted_at"]
             }
-            for alert in alerts
-        ]
+            for row in rows
+        )
         
-        return jsonify({
-            "success": True,
-            "count": len(alert_list),
-            "alerts": alert_list
-        })
+        return _stream_json_list("alerts", alert_list)
         
     except Exception as e:
         return jsonify({
@@ -217,13 +326,37 @@ def github_webhook() -> Dict[str, Any]:
     - release (published)
     - create (tag)
     
+    Matching events are queued for a background check and answered
+    with 202 so GitHub's delivery timeout is never hit.
+    
     Returns:
         Webhook processing result.
     """
     try:
+        # Authenticate the delivery before doing any work on it
+        body = request.get_data(cache=False)
+        if not _verify_signature(body, request.headers.get("X-Hub-Signature-256")):
+            return jsonify({
+                "success": False,
+                "error": "Invalid signature"
+            }), 401
+        
         # Get webhook event type
         event_type = request.headers.get("X-GitHub-Event")
-        payload = request.json
+        delivery_id = request.headers.get("X-GitHub-Delivery")
+        
+        # GitHub retries deliveries; only act on each one once
+        if _is_duplicate_delivery(delivery_id):
+            return jsonify({
+                "success": True,
+                "duplicate": True
+            }), 200
+        
+        # Parse the raw body directly; webhook payloads are often 100KB+
+        try:
+            payload = json_loads(body)
+        except ValueError:
+            payload = None
         
         if not payload:
             return jsonify({
@@ -242,7 +375,7 @@ def github_webhook() -> Dict[str, Any]:
             }), 400
         
         # Check if we're monitoring this repository
-        if repo_full_name not in Config.MONITORED_REPOS:
+        if repo_full_name not in Config.MONITORED_REPOS_SET:
             return jsonify({
                 "success": False,
                 "message": f"Repository {repo_full_name} is not monitored"
@@ -254,38 +387,28 @@ def github_webhook() -> Dict[str, Any]:
             if action == "published":
                 release = payload.get("release", {})
                 if not release.get("prerelease"):
-                    # Trigger check for this repository
-                    from app.monitor import check_repository_updates
-                    
-                    result = check_repository_updates(
-                        repo_full_name, db, repo_service, 
-                        gemini_service, email_service, slack_service
-                    )
+                    # Queue check for this repository and reply right away
+                    queued = webhook_queue.submit(repo_full_name, event_type, delivery_id)
                     
                     return jsonify({
                         "success": True,
                         "event": "release_published",
                         "repo": repo_full_name,
-                        "result": result
-                    })
+                        "queued": queued
+                    }), 202
         
         elif event_type == "create":
             ref_type = payload.get("ref_type")
             if ref_type == "tag":
-                # Trigger check for this repository
-                from app.monitor import check_repository_updates
-                
-                result = check_repository_updates(
-                    repo_full_name, db, repo_service, 
-                    gemini_service, email_service, slack_service
-                )
+                # Queue check for this repository and reply right away
+                queued = webhook_queue.submit(repo_full_name, event_type, delivery_id)
                 
                 return jsonify({
                     "success": True,
                     "event": "tag_created",
                     "repo": repo_full_name,
-                    "result": result
-                })
+                    "queued": queued
+                }), 202
         
         # Event not processed
         return jsonify({
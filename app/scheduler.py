@@ -0,0 +1,58 @@
+"""
+Lightweight interval scheduler.
+Runs a single job repeatedly on a fixed interval in a background thread.
+"""
+import logging
+import threading
+from typing import Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class IntervalScheduler:
+    """Run one job every N seconds in a daemon thread."""
+    
+    def __init__(self, func: Callable[[], None], interval_seconds: float,
+                 name: str = "interval-scheduler"):
+        """
+        Initialize scheduler.
+        
+        Args:
+            func: Job to run on each tick.
+            interval_seconds: Seconds to wait between runs.
+            name: Name of the background thread.
+        """
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self.name = name
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def _run(self):
+        """Wait for the interval, run the job, repeat until stopped."""
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.func()
+            except Exception:
+                logger.exception("Scheduled job failed")
+    
+    def start(self) -> None:
+        """Start the background thread. The first run happens after one interval."""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the scheduler.
+        
+        Args:
+            wait: Block until a job that is currently running finishes.
+        """
+        self._stop_event.set()
+        if wait and self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
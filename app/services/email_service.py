@@ -2,14 +2,68 @@
 Email notification service.
 Sends email alerts using SMTP.
 """
+import logging
+import queue
 import smtplib
+import threading
+from concurrent.futures import Future
 from email.message import EmailMessage
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from app.config import Config
 
 
+logger = logging.getLogger(__name__)
+
+# Static pieces of the alert email, built once at import
+SEP = "=" * 60
+
+
+def _section(title: str) -> str:
+    """Return a section heading framed by separator lines."""
+    return f"{SEP}\n{title}\n{SEP}"
+
+
+_SUBJECT_PREFIX = {
+    "CRITICAL": "🚨 CRITICAL",
+    "HIGH": "⚠️ HIGH",
+    "MEDIUM": "ℹ️ MEDIUM",
+}
+_DEFAULT_SUBJECT_PREFIX = "📝 LOW"
+
+_SUMMARY_SECTION = _section("SUMMARY")
+_REASONING_SECTION = _section("REASONING")
+_RECOMMENDATION_SECTION = _section("RECOMMENDATION")
+_LINKS_SECTION = _section("LINKS")
+
+_MANDATORY_RECOMMENDATION = """⚠️  This is a MANDATORY upgrade. Action required:
+   - Review the changes immediately
+   - Plan upgrade timeline
+   - Test in staging environment
+   - Deploy to production ASAP
+"""
+
+_RECOMMENDATIONS = {
+    "CRITICAL": """🚨 CRITICAL update detected:
+   - Review security implications
+   - Upgrade as soon as possible
+   - Monitor for network consensus changes
+""",
+    "HIGH": """⚠️  HIGH priority update:
+   - Review changes at your earliest convenience
+   - Plan upgrade within reasonable timeframe
+   - Consider impact on your infrastructure
+""",
+}
+
+_DEFAULT_RECOMMENDATION = """ℹ️  Update available:
+   - Review when convenient
+   - No immediate action required
+   - Plan upgrade during regular maintenance
+"""
+
+
 class EmailService:
     """Service for sending email notifications."""
     
@@ -21,6 +75,122 @@ class EmailService:
         self.smtp_password = Config.SMTP_PASSWORD
         self.email_from = Config.EMAIL_FROM
         self.email_to = Config.EMAIL_TO
+        
+        # One long-lived SMTP session, shared by the sender thread and test emails
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        
+        # Alerts are queued and delivered by a background thread
+        self._queue: "queue.Queue[Optional[Tuple[EmailMessage, Future]]]" = queue.Queue()
+        self._sender: Optional[threading.Thread] = None
+        self._sender_lock = threading.Lock()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open an authenticated SMTP session.
+        
+        Returns:
+            Connected SMTP client.
+        """
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
+        try:
+            server.starttls()
+            server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _disconnect(self) -> None:
+        """Close the SMTP session if one is open. Caller holds _smtp_lock."""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.quit()
+        except smtplib.SMTPException:
+            self._smtp.close()
+        except OSError:
+            pass
+        self._smtp = None
+    
+    def _deliver(self, msg: EmailMessage) -> None:
+        """
+        Send a message over the shared SMTP session.
+        
+        If the session has dropped (server idle timeout, network blip),
+        reconnect and retry once. Errors the server answered with (refused
+        recipients, a rejected message) are not retried, since the message
+        may already have been accepted for some recipients.
+        
+        Args:
+            msg: Message to send.
+            
+        Raises:
+            smtplib.SMTPException or OSError if delivery fails.
+        """
+        with self._smtp_lock:
+            if self._smtp is None:
+                self._smtp = self._connect()
+            
+            try:
+                self._smtp.send_message(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                pass
+            except smtplib.SMTPException:
+                # SMTPException subclasses OSError, so re-raise it first
+                raise
+            except OSError:
+                pass
+            
+            self._disconnect()
+            self._smtp = self._connect()
+            self._smtp.send_message(msg)
+    
+    def _run_sender(self):
+        """Deliver queued alert emails until a None sentinel is received."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                
+                msg, outcome = item
+                try:
+                    self._deliver(msg)
+                except Exception as e:
+                    logger.error("Failed to send email alert: %s", e)
+                    outcome.set_result(False)
+                else:
+                    logger.info("Alert email sent: %s", msg["Subject"])
+                    outcome.set_result(True)
+            finally:
+                self._queue.task_done()
+    
+    def _ensure_sender(self) -> None:
+        """Start the background sender thread on first use."""
+        with self._sender_lock:
+            if self._sender is None or not self._sender.is_alive():
+                self._sender = threading.Thread(
+                    target=self._run_sender, name="email-sender", daemon=True
+                )
+                self._sender.start()
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Flush queued alerts and close the SMTP session.
+        
+        Args:
+            wait: Block until queued alerts have been delivered.
+        """
+        if self._sender is not None and self._sender.is_alive():
+            self._queue.put(None)
+            if wait:
+                self._sender.join()
+        
+        with self._smtp_lock:
+            self._disconnect()
     
     def _create_alert_email(self, repo_name: str, old_version: str,
                            new_version: str, analysis: Dict[str, Any],
@@ -44,80 +214,45 @@ class EmailService:
         mandatory = analysis.get("mandatory_upgrade", False)
         
         # Subject line
-        subject_prefix = "🚨 CRITICAL" if severity == "CRITICAL" else \
-                        "⚠️ HIGH" if severity == "HIGH" else \
-                        "ℹ️ MEDIUM" if severity == "MEDIUM" else \
-                        "📝 LOW"
-        
+        subject_prefix = _SUBJECT_PREFIX.get(severity, _DEFAULT_SUBJECT_PREFIX)
         mandatory_flag = " [MANDATORY]" if mandatory else ""
         
         msg["Subject"] = f"{subject_prefix}{mandatory_flag} {repo_name} Update: {new_version}"
         msg["From"] = self.email_from
         msg["To"] = self.email_to
         
+        if mandatory:
+            recommendation = _MANDATORY_RECOMMENDATION
+        else:
+            recommendation = _RECOMMENDATIONS.get(severity, _DEFAULT_RECOMMENDATION)
+        
         # Email body
         body = f"""Blockchain Release Monitor Alert
-{'=' * 60}
+{SEP}
 
 Repository: {repo_name}
 Version Change: {old_version} → {new_version}
 Severity: {severity}
 Mandatory Upgrade: {'YES' if mandatory else 'NO'}
 
-{'=' * 60}
-SUMMARY
-{'=' * 60}
+{_SUMMARY_SECTION}
 
 {analysis.get('summary', 'No summary available.')}
 
-{'=' * 60}
-REASONING
-{'=' * 60}
+{_REASONING_SECTION}
 
 {analysis.get('reasoning', 'No detailed reasoning provided.')}
 
-{'=' * 60}
-RECOMMENDATION
-{'=' * 60}
+{_RECOMMENDATION_SECTION}
 
-"""
-        
-        if mandatory:
-            body += """⚠️  This is a MANDATORY upgrade. Action required:
-   - Review the changes immediately
-   - Plan upgrade timeline
-   - Test in staging environment
-   - Deploy to production ASAP
-"""
-        elif severity == "CRITICAL":
-            body += """🚨 CRITICAL update detected:
-   - Review security implications
-   - Upgrade as soon as possible
-   - Monitor for network consensus changes
-"""
-        elif severity == "HIGH":
-            body += """⚠️  HIGH priority update:
-   - Review changes at your earliest convenience
-   - Plan upgrade within reasonable timeframe
-   - Consider impact on your infrastructure
-"""
-        else:
-            body += """ℹ️  Update available:
-   - Review when convenient
-   - No immediate action required
-   - Plan upgrade during regular maintenance
-"""
-        
-        body += f"""
+{recommendation}
 
-{'=' * 60}
-LINKS
-{'=' * 60}
+{_LINKS_SECTION}
 
 Repository: {repo_url or f'https://github.com/{repo_name}'}
 New Version: {repo_url}/releases/tag/{new_version}
 
-{'=' * 60}
+{SEP}
 
 Generated at: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
 Blockchain Release Monitor
@@ -128,9 +263,13 @@ Blockchain Release Monitor
         return msg
     
     def send_alert(self, repo_name: str, old_version: str, new_version: str,
-                  analysis: Dict[str, Any], repo_url: str = "") -> bool:
+                  analysis: Dict[str, Any], repo_url: str = "") -> "Future[bool]":
         """
-        Send email alert for version update.
+        Queue email alert for version update.
+        
+        The message is built here and handed to the background sender,
+        so the caller never waits on the SMTP handshake; the returned
+        future resolves once the sender has tried to deliver it.
         
         Args:
             repo_name: Repository name.
@@ -140,26 +279,25 @@ Blockchain Release Monitor
             repo_url: Repository URL.
             
         Returns:
-            True if email sent successfully, False otherwise.
+            Future resolving to True if the email was delivered, False otherwise.
         """
+        outcome: "Future[bool]" = Future()
         try:
             # Create email message
             msg = self._create_alert_email(
                 repo_name, old_version, new_version, analysis, repo_url
             )
             
-            # Send email via SMTP
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            # Hand off to the background sender
+            self._ensure_sender()
+            self._queue.put((msg, outcome))
             
-            print(f"Alert email sent for {repo_name} {new_version}")
-            return True
+            logger.info("Alert email queued for %s %s", repo_name, new_version)
             
         except Exception as e:
-            print(f"Failed to send email alert: {e}")
-            return False
+            logger.error("Failed to queue email alert: %s", e)
+            outcome.set_result(False)
+        return outcome
     
     def send_test_email(self) -> bool:
         """
@@ -195,14 +333,12 @@ Generated at: {timestamp} UTC
             
             msg.set_content(body)
             
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            # Sent synchronously so the caller learns whether SMTP works
+            self._deliver(msg)
             
-            print("Test email sent successfully")
+            logger.info("Test email sent successfully")
             return True
             
         except Exception as e:
-            print(f"Failed to send test email: {e}")
+            logger.error("Failed to send test email: %s", e)
             return False
@@ -2,8 +2,11 @@
 Google Gemini AI service.
 Handles AI-powered analysis of blockchain version changes.
 """
+import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 
 try:
@@ -12,11 +15,51 @@ except ImportError:
     genai = None
 
 from app.config import Config
+from app.services.rate_limiter import RateLimiter
+
+
+# Number of analyses kept in the in-memory LRU cache
+ANALYSIS_CACHE_SIZE = 512
+
+# Prompt size limits: long release notes keep their head and tail, where
+# the summary and upgrade instructions usually are
+MAX_RELEASE_NOTES_CHARS = 8000
+RELEASE_NOTES_HEAD_CHARS = 6000
+RELEASE_NOTES_TAIL_CHARS = 2000
+MAX_COMMIT_MESSAGES = 20
+MAX_COMMIT_MESSAGE_CHARS = 300
+
+# Patterns for pulling the analysis JSON out of a model response
+_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_OBJECT_RE = re.compile(r'\{[^{}]*"summary"[^{}]*\}', re.DOTALL)
 
 
 class GeminiService:
     """Service for AI analysis using Google Gemini."""
     
+    # Static instructions appended to every analysis prompt
+    _PROMPT_SUFFIX = """Analyze this update and provide a response in STRICT JSON format with these exact fields:
+
+{
+  "summary": "Brief summary of changes in 2-3 sentences",
+  "mandatory_upgrade": true or false,
+  "severity": "LOW" or "MEDIUM" or "HIGH" or "CRITICAL",
+  "reasoning": "Why this severity and mandatory decision"
+}
+
+CRITICAL SEVERITY means: security vulnerabilities, hard forks, network-breaking changes, or consensus failures.
+HIGH SEVERITY means: important bug fixes, performance issues, or features affecting network stability.
+MEDIUM SEVERITY means: minor bug fixes, optimizations, or new non-critical features.
+LOW SEVERITY means: documentation, refactoring, or cosmetic changes.
+
+MANDATORY UPGRADE is true only if:
+- Security vulnerability is fixed
+- Hard fork or consensus change requires it
+- Network will reject old version
+- Critical bug affects operations
+
+Respond ONLY with valid JSON. No markdown, no extra text, just the JSON object."""
+    
     def __init__(self):
         """Initialize Gemini service."""
         if not genai:
@@ -27,6 +70,46 @@ class GeminiService:
         
         genai.configure(api_key=Config.GEMINI_API_KEY)
         self.model = genai.GenerativeModel(Config.GEMINI_MODEL)
+        self._rate_limiter = RateLimiter(Config.GEMINI_REQUESTS_PER_MINUTE / 60)
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _cache_key(self, repo_name: str, old_version: str, new_version: str,
+                   release_notes: str, commit_messages: List[str]) -> str:
+        """
+        Build the cache key for an analysis request.
+        
+        Args:
+            repo_name: Repository name.
+            old_version: Previous version.
+            new_version: New version.
+            release_notes: Release notes if available.
+            commit_messages: Commit messages if no release notes.
+            
+        Returns:
+            Hex digest identifying the inputs.
+        """
+        raw = "\x1f".join(
+            [repo_name, str(old_version), str(new_version), release_notes or "", *commit_messages]
+        )
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached analysis, marking it recently used."""
+        with self._cache_lock:
+            analysis = self._cache.get(key)
+            if analysis is None:
+                return None
+            self._cache.move_to_end(key)
+            return dict(analysis)
+    
+    def _cache_put(self, key: str, analysis: Dict[str, Any]) -> None:
+        """Store an analysis, evicting the least recently used entry if full."""
+        with self._cache_lock:
+            self._cache[key] = dict(analysis)
+            self._cache.move_to_end(key)
+            if len(self._cache) > ANALYSIS_CACHE_SIZE:
+                self._cache.popitem(last=False)
     
     def _create_analysis_prompt(self, repo_name: str, old_version: str,
                                new_version: str, release_notes: str,
@@ -44,46 +127,30 @@ class GeminiService:
         Returns:
             Formatted prompt string.
         """
+        release_notes = release_notes or ""
+        if len(release_notes) > MAX_RELEASE_NOTES_CHARS:
+            release_notes = (
+                release_notes[:RELEASE_NOTES_HEAD_CHARS]
+                + "\n...[truncated]...\n"
+                + release_notes[-RELEASE_NOTES_TAIL_CHARS:]
+            )
+        commit_messages = [
+            message[:MAX_COMMIT_MESSAGE_CHARS]
+            for message in commit_messages[:MAX_COMMIT_MESSAGES]
+        ]
+        
+        release_section = f"RELEASE NOTES:\n{release_notes}\n\n" if release_notes else ""
+        commit_section = (
+            f"COMMIT MESSAGES:\n{chr(10).join(commit_messages)}\n\n"
+            if commit_messages else ""
+        )
+        
         prompt = f"""You are a blockchain infrastructure expert analyzing a version update for {repo_name}.
 
 OLD VERSION: {old_version}
 NEW VERSION: {new_version}
 
-"""
-        
-        if release_notes:
-            prompt += f"""RELEASE NOTES:
-{release_notes}
-
-"""
-        
-        if commit_messages:
-            prompt += f"""COMMIT MESSAGES:
-{chr(10).join(commit_messages[:20])}
-
-"""
-        
-        prompt += """Analyze this update and provide a response in STRICT JSON format with these exact fields:
-
-{
-  "summary": "Brief summary of changes in 2-3 sentences",
-  "mandatory_upgrade": true or false,
-  "severity": "LOW" or "MEDIUM" or "HIGH" or "CRITICAL",
-  "reasoning": "Why this severity and mandatory decision"
-}
-
-CRITICAL SEVERITY means: security vulnerabilities, hard forks, network-breaking changes, or consensus failures.
-HIGH SEVERITY means: important bug fixes, performance issues, or features affecting network stability.
-MEDIUM SEVERITY means: minor bug fixes, optimizations, or new non-critical features.
-LOW SEVERITY means: documentation, refactoring, or cosmetic changes.
-
-MANDATORY UPGRADE is true only if:
-- Security vulnerability is fixed
-- Hard fork or consensus change requires it
-- Network will reject old version
-- Critical bug affects operations
-
-Respond ONLY with valid JSON. No markdown, no extra text, just the JSON object."""
+{release_section}{commit_section}{self._PROMPT_SUFFIX}"""
         
         return prompt
     
@@ -97,15 +164,18 @@ Respond ONLY with valid JSON. No markdown, no extra text, just the JSON object."
         Returns:
             Parsed JSON dictionary or None.
         """
-        # Try to parse as-is first
-        try:
-            return json.loads(response_text.strip())
-        except json.JSONDecodeError:
-            pass
+        # Fast path: parse from the first "{" to the last "}". This covers
+        # both bare JSON and a single fenced block without touching regex.
+        start = response_text.find("{")
+        end = response_text.rfind("}")
+        if start != -1 and end > start:
+            try:
+                return json.loads(response_text[start:end + 1])
+            except json.JSONDecodeError:
+                pass
         
         # Try to extract JSON from markdown code block
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', 
-                              response_text, re.DOTALL)
+        json_match = _CODEBLOCK_RE.search(response_text)
         if json_match:
             try:
                 return json.loads(json_match.group(1))
@@ -113,8 +183,7 @@ Respond ONLY with valid JSON. No markdown, no extra text, just the JSON object."
                 pass
         
         # Try to find JSON object in text
-        json_match = re.search(r'\{[^{}]*"summary"[^{}]*\}', 
-                              response_text, re.DOTALL)
+        json_match = _OBJECT_RE.search(response_text)
         if json_match:
             try:
                 return json.loads(json_match.group(0))
@@ -155,6 +224,10 @@ Respond ONLY with valid JSON. No markdown, no extra text, just the JSON object."
         """
         Analyze version change using Gemini AI.
         
+        Successful analyses are cached by their inputs, so repeated checks
+        of the same version pair (webhook retries, manual checks, the
+        scheduler) skip the API call. Fallback results are not cached.
+        
         Args:
             repo_name: Repository name.
             old_version: Previous version.
@@ -168,6 +241,13 @@ Respond ONLY with valid JSON. No markdown, no extra text, just the JSON object."
         if commit_messages is None:
             commit_messages = []
         
+        cache_key = self._cache_key(
+            repo_name, old_version, new_version, release_notes, commit_messages
+        )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Create prompt
         prompt = self._create_analysis_prompt(
             repo_name, old_version, new_version, 
@@ -175,7 +255,8 @@ Respond ONLY with valid JSON. No markdown, no extra text, just the JSON object."
         )
         
         try:
-            # Generate response
+            # Generate response, pacing calls to stay within quota
+            self._rate_limiter.acquire()
             response = self.model.generate_content(prompt)
             response_text = response.text
             
@@ -202,6 +283,7 @@ Respond ONLY with valid JSON. No markdown, no extra text, just the JSON object."
                     "reasoning": "AI response validation failed. Manual review recommended."
                 }
             
+            self._cache_put(cache_key, analysis)
             return analysis
             
         except Exception as e:
@@ -2,79 +2,349 @@
 GitHub API service.
 Handles interaction with GitHub REST API for releases, tags, and commits.
 """
+import logging
 import requests
-import re
+import threading
+import time
+from itertools import chain, islice
 from typing import Optional, Dict, Any, List, Tuple
-from datetime import datetime
 
 from app.config import Config
+from app.json_codec import loads as json_loads
+from app.services.http import create_session
+from app.services.rate_limiter import RateLimiter
+from app.services.release_lookup import MAX_PAGES, PER_PAGE, TagMatcher, iter_pages
+from app.services.ttl_cache import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+# Maximum in-flight requests to the GitHub API across all monitor threads
+MAX_CONCURRENT_REQUESTS = 8
+
+# Compare responses are the largest and slowest; cap how many of the
+# request slots they can hold at once so release/tag lookups keep flowing
+MAX_CONCURRENT_COMPARES = 4
+
+# Commit messages collected for a tag-only update (the analysis prompt
+# uses fewer still)
+MAX_COMMIT_MESSAGES = 50
+
+# Seconds a latest-release/latest-tag lookup is reused by later checks
+VERSION_CACHE_TTL_SECONDS = 60
+
+# Latest-release/latest-tag lookups shared by every GitHubService in the process,
+# so separately created instances (e.g. in test scripts) reuse them too
+_VERSION_CACHE = TTLCache(maxsize=1024, ttl=VERSION_CACHE_TTL_SECONDS)
+
+# Response bodies kept for If-None-Match revalidation, and for how long
+ETAG_CACHE_SIZE = 256
+ETAG_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Repositories looked up per GraphQL request in get_latest_releases_bulk()
+GRAPHQL_BATCH_SIZE = 50
+_LATEST_RELEASE_FIELDS = (
+    "latestRelease { tagName name publishedAt isPrerelease url description }"
+)
+
+# Newest releases a bulk query scans for a tag-filtered repository; if none
+# of them matches, the repository is left to the paged REST lookup
+GRAPHQL_FILTERED_RELEASES = 30
+_FILTERED_RELEASE_FIELDS = (
+    f"releases(first: {GRAPHQL_FILTERED_RELEASES}, "
+    "orderBy: {field: CREATED_AT, direction: DESC}) "
+    "{ nodes { tagName name publishedAt isPrerelease isDraft url description } }"
+)
+
+# Seconds to wait before each retry of a rate-limited request
+RATE_LIMIT_BACKOFF = (1, 2, 4, 8, 16, 32)
 
 
 class GitHubService:
     """Service for interacting with GitHub API."""
     
-    def __init__(self, tag_filters: Optional[Dict[str, List[str]]] = None):
+    __slots__ = (
+        "token", "base_url", "headers", "rate_limit_remaining", "rate_limit_reset",
+        "tag_filters", "_tag_matcher", "_owns_session",
+        "session", "_request_slots", "_compare_slots", "_version_cache",
+        "_etag_cache", "_rate_limiter",
+    )
+    
+    def __init__(self, tag_filters: Optional[Dict[str, List[str]]] = None,
+                 session: Optional[requests.Session] = None):
         """Initialize GitHub service with API token and optional tag filters.
         
         Args:
             tag_filters: Dictionary mapping repo names to list of tag patterns to filter.
+            session: Shared HTTP session; a new pooled session is created if omitted.
         """
         self.token = Config.GITHUB_TOKEN
         self.base_url = Config.GITHUB_API_BASE
+        # Sent per request rather than set on the session: the session may be
+        # shared with GitLab and Slack, which must not see the GitHub token
         self.headers = {
             "Accept": "application/vnd.github+json",
             "Authorization": f"Bearer {self.token}",
             "X-GitHub-Api-Version": "2022-11-28"
         }
-        self.rate_limit_remaining = None
-        self.rate_limit_reset = None
+        # REST quota from the latest response, as ints (reset is epoch seconds)
+        self.rate_limit_remaining: Optional[int] = None
+        self.rate_limit_reset: Optional[int] = None
         self.tag_filters = tag_filters or {}
+        self._tag_matcher = TagMatcher(self.tag_filters)
+        # Only close the session on close() if this service created it
+        self._owns_session = session is None
+        self.session = session or create_session()
+        self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self._compare_slots = threading.BoundedSemaphore(MAX_CONCURRENT_COMPARES)
+        # Recent latest-release/latest-tag lookups (keyed by _version_key())
+        # and release listings
+        self._version_cache = _VERSION_CACHE
+        # (etag, parsed body, next page URL) of recent GETs, keyed by URL
+        self._etag_cache = TTLCache(maxsize=ETAG_CACHE_SIZE, ttl=ETAG_CACHE_TTL_SECONDS)
+        self._rate_limiter = RateLimiter(
+            Config.GITHUB_REQUESTS_PER_HOUR / 3600, burst=MAX_CONCURRENT_REQUESTS
+        )
     
-    def _make_request(self, url: str) -> Optional[Dict[Any, Any]]:
+    def _send_request(self, url: str, 
+                      headers: Dict[str, str]) -> Optional[requests.Response]:
         """
-        Make authenticated request to GitHub API.
+        Send authenticated GET request to GitHub API.
+        
+        Requests are paced by the client-side rate limiter. When GitHub
+        still answers with a rate-limit error, the request is retried with
+        exponential backoff as long as the limit resets within the backoff
+        window.
         
         Args:
             url: API endpoint URL.
+            headers: Request headers.
             
         Returns:
-            JSON response or None on error.
+            Response (including 304 Not Modified) or None on error.
         """
+        # Quota already spent: skip the round trip until the window resets
+        if self.rate_limit_remaining == 0 and (self.rate_limit_reset or 0) > time.time():
+            logger.warning("Rate limit exceeded. Resets at: %s", self.rate_limit_reset)
+            return None
+        
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            
-            # Update rate limit info
-            self.rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
-            self.rate_limit_reset = response.headers.get("X-RateLimit-Reset")
-            
-            if response.status_code == 403:
-                print(f"Rate limit exceeded. Resets at: {self.rate_limit_reset}")
-                return None
+            for delay in (*RATE_LIMIT_BACKOFF, None):
+                self._rate_limiter.acquire()
+                with self._request_slots:
+                    response = self.session.get(url, headers=headers, timeout=30)
+                
+                self._update_rate_limit(response)
+                
+                if response.status_code not in (403, 429):
+                    break
+                
+                wait = self._rate_limit_wait(response, delay)
+                if wait is None:
+                    logger.warning("Rate limit exceeded. Resets at: %s", self.rate_limit_reset)
+                    return None
+                
+                logger.info("Rate limited, retrying in %.0fs", wait)
+                time.sleep(wait)
             
             if response.status_code == 404:
-                print(f"Resource not found: {url}")
+                logger.warning("Resource not found: %s", url)
                 return None
             
             response.raise_for_status()
-            return response.json()
+            return response
             
         except requests.exceptions.RequestException as e:
-            print(f"GitHub API request failed: {e}")
+            logger.error("GitHub API request failed: %s", e)
             return None
     
-    def _is_semantic_version(self, tag_name: str) -> bool:
+    def _update_rate_limit(self, response: requests.Response) -> None:
         """
-        Check if tag follows semantic versioning.
+        Record the quota reported by a REST response.
         
         Args:
-            tag_name: Tag name to check.
+            response: Any GitHub REST API response.
+        """
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        self.rate_limit_remaining, self.rate_limit_reset = (
+            int(remaining) if remaining and remaining.isdigit() else None,
+            int(reset) if reset and reset.isdigit() else None,
+        )
+    
+    def _rate_limit_wait(self, response: requests.Response,
+                         delay: Optional[float]) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a rate-limited request.
+        
+        Args:
+            response: The 403/429 response.
+            delay: Backoff delay for this attempt, or None if out of retries.
+            
+        Returns:
+            Seconds to sleep, or None if the request should not be retried.
+        """
+        if delay is None:
+            return None
+        
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            wait = float(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            # Primary limit: retry only if the window resets within the backoff cap
+            reset = response.headers.get("X-RateLimit-Reset")
+            if not reset or not reset.isdigit():
+                return None
+            wait = max(float(reset) - time.time(), delay)
+        elif response.status_code == 429:
+            wait = delay
+        else:
+            # Plain 403 (permissions), not worth retrying
+            return None
+        
+        return wait if wait <= RATE_LIMIT_BACKOFF[-1] else None
+    
+    def _make_request(self, url: str) -> Optional[Dict[Any, Any]]:
+        """
+        Make authenticated request to GitHub API.
+        
+        Args:
+            url: API endpoint URL.
             
         Returns:
-            True if tag is semantic version.
+            JSON response or None on error.
         """
-        # Match v1.2.3, 1.2.3, v1.2.3-beta, etc.
-        pattern = r'^v?\d+\.\d+\.\d+.*$'
-        return bool(re.match(pattern, tag_name))
+        return self._get_json(url)[0]
+    
+    def _get_json(self, url: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        GET a JSON resource, revalidating any earlier copy by its ETag.
+        
+        A 304 Not Modified answer is free against the rate limit and has
+        no body, so the previously parsed response is returned instead.
+        
+        Args:
+            url: API endpoint URL.
+            
+        Returns:
+            Tuple of (JSON response or None on error, next page URL or None).
+        """
+        cached = self._etag_cache.get(url)
+        
+        headers = self.headers
+        if cached is not None:
+            headers = {**self.headers, "If-None-Match": cached[0]}
+        
+        response = self._send_request(url, headers)
+        if response is None:
+            return None, None
+        
+        if response.status_code == 304 and cached is not None:
+            return cached[1], cached[2]
+        
+        try:
+            data = json_loads(response.content)
+        except ValueError as e:
+            logger.error("GitHub API returned invalid JSON: %s", e)
+            return None, None
+        
+        next_url = response.links.get("next", {}).get("url")
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache.set(url, (etag, data, next_url))
+        return data, next_url
+    
+    def _make_conditional_request(self, url: str, etag: Optional[str] = None,
+                                  last_modified: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Make request with If-None-Match/If-Modified-Since validators.
+        
+        GitHub answers 304 Not Modified without counting against the
+        rate limit when the resource is unchanged.
+        
+        Args:
+            url: API endpoint URL.
+            etag: ETag from a previous response.
+            last_modified: Last-Modified value from a previous response.
+            
+        Returns:
+            Dictionary with not_modified flag, JSON data and new validators.
+        """
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        response = self._send_request(url, headers)
+        
+        if response is None:
+            return {"not_modified": False, "data": None, "next_url": None,
+                    "etag": None, "last_modified": None}
+        
+        if response.status_code == 304:
+            return {"not_modified": True, "data": None, "next_url": None,
+                    "etag": etag, "last_modified": last_modified}
+        
+        try:
+            data = json_loads(response.content)
+        except ValueError as e:
+            logger.error("GitHub API returned invalid JSON: %s", e)
+            data = None
+        
+        return {
+            "not_modified": False,
+            "data": data,
+            "next_url": response.links.get("next", {}).get("url"),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+    
+    def _post_graphql(self, query: str, 
+                      variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run a GraphQL query against the GitHub v4 API.
+        
+        Args:
+            query: GraphQL query document.
+            variables: Query variables.
+            
+        Returns:
+            The "data" object (possibly partial) or None on error.
+        """
+        try:
+            self._rate_limiter.acquire()
+            with self._request_slots:
+                response = self.session.post(
+                    f"{self.base_url}/graphql",
+                    headers=self.headers,
+                    json={"query": query, "variables": variables},
+                    timeout=30
+                )
+            
+            # GraphQL has its own quota, so the REST counters are left alone
+            response.raise_for_status()
+            body = json_loads(response.content)
+            
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("GitHub GraphQL request failed: %s", e)
+            return None
+        
+        # Unknown repositories come back as null entries plus "errors";
+        # the other aliases are still usable
+        return body.get("data") or None
+    
+    def close(self) -> None:
+        """Release pooled connections held by this service's own session."""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self) -> "GitHubService":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _matches_tag_filter(self, tag_name: str, repo_name: str) -> bool:
         """
@@ -87,87 +357,259 @@ class GitHubService:
         Returns:
             True if tag matches filter or no filter exists for this repo.
         """
-        # If no filter for this repo, accept all tags
-        if repo_name not in self.tag_filters:
-            return True
+        return self._tag_matcher.matches(repo_name, tag_name)
+    
+    def _version_key(self, kind: str, owner: str, repo: str) -> Tuple[str, ...]:
+        """
+        Build the version cache key for a lookup.
         
-        patterns = self.tag_filters[repo_name]
-        tag_lower = tag_name.lower()
+        The tag filters are part of the key because they change which
+        release or tag is "latest", and the cache is shared by instances.
         
-        # Check if tag contains any of the filter patterns
-        for pattern in patterns:
-            pattern_lower = pattern.lower()
-            if pattern_lower in tag_lower:
-                return True
+        Args:
+            kind: "release" or "tag".
+            owner: Repository owner.
+            repo: Repository name.
+            
+        Returns:
+            Cache key.
+        """
+        return (kind, owner, repo) + self._tag_matcher.cache_key(f"{owner}/{repo}")
+    
+    def invalidate_cache(self, repo_name: str) -> None:
+        """
+        Drop cached latest-release/latest-tag lookups for a repository.
         
-        return False
+        ETag-cached responses need no invalidation: they are always
+        revalidated with the server before being reused.
+        
+        Args:
+            repo_name: Repository name (owner/repo).
+        """
+        owner, repo = self.parse_repo_name(repo_name)
+        self._version_cache.pop(self._version_key("release", owner, repo))
+        self._version_cache.pop(self._version_key("tag", owner, repo))
     
-    def _extract_version(self, tag_name: str) -> str:
+    def list_releases(self, owner: str, repo: str,
+                      per_page: int = PER_PAGE) -> Optional[List[Dict[str, Any]]]:
         """
-        Extract version number from tag name.
+        List the newest releases, reusing a listing made in the last minute.
         
         Args:
-            tag_name: Tag name.
+            owner: Repository owner.
+            repo: Repository name.
+            per_page: Number of releases to list (at most 100).
+            
+        Returns:
+            Raw release objects, newest first, or None on error.
+        """
+        key = ("releases", owner, repo, per_page)
+        cached = self._version_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        url = f"{self.base_url}/repos/{owner}/{repo}/releases?per_page={per_page}"
+        releases = self._make_request(url)
+        if not isinstance(releases, list):
+            return None
+        
+        self._version_cache.set(key, tuple(releases))
+        return releases
+    
+    def get_latest_release(self, owner: str, repo: str, etag: Optional[str] = None,
+                           last_modified: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get latest release, reusing a lookup made in the last minute.
+        
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            etag: ETag from the previous release lookup, if any.
+            last_modified: Last-Modified from the previous release lookup, if any.
             
         Returns:
-            Version string.
+            Release data, {"not_modified": True} if the releases are unchanged
+            since the given validators, or None if no releases exist.
         """
-        # Remove 'v' prefix if present
-        return tag_name.lstrip('v')
+        key = self._version_key("release", owner, repo)
+        cached = self._version_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        release = self._fetch_latest_release(owner, repo, etag, last_modified)
+        
+        # 304 results depend on the caller's validators, so never cache them
+        if release and not release.get("not_modified"):
+            self._version_cache.set(key, dict(release))
+        return release
     
-    def get_latest_release(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+    def _fetch_latest_release(self, owner: str, repo: str, etag: Optional[str] = None,
+                              last_modified: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
-        Get latest release from GitHub repository.
+        Fetch latest release from GitHub repository.
         
         Args:
             owner: Repository owner.
             repo: Repository name.
+            etag: ETag from the previous release lookup, if any.
+            last_modified: Last-Modified from the previous release lookup, if any.
             
         Returns:
-            Release data or None if no releases exist.
+            Release data, {"not_modified": True} if the releases are unchanged
+            since the given validators, or None if no releases exist.
         """
         repo_name = f"{owner}/{repo}"
         
-        # If tag filters exist for this repo, get all releases and filter
+        # If tag filters exist for this repo, page through releases and filter
+        if repo_name in self.tag_filters:
+            url = f"{self.base_url}/repos/{owner}/{repo}/releases?per_page={PER_PAGE}"
+        else:
+            # No filter - use the latest release endpoint
+            url = f"{self.base_url}/repos/{owner}/{repo}/releases/latest"
+        
+        response = self._make_conditional_request(url, etag, last_modified)
+        if response["not_modified"]:
+            return {"type": "release", "not_modified": True}
+        
+        data = response["data"]
+        release = None
+        
         if repo_name in self.tag_filters:
-            url = f"{self.base_url}/repos/{owner}/{repo}/releases"
-            data = self._make_request(url)
-            
             if data and isinstance(data, list):
-                for release in data:
-                    tag_name = release.get("tag_name", "")
-                    if self._matches_tag_filter(tag_name, repo_name) and not release.get("prerelease", False):
-                        return {
-                            "type": "release",
-                            "name": release.get("name", release.get("tag_name")),
-                            "tag_name": tag_name,
-                            "published_at": release.get("published_at"),
-                            "body": release.get("body", ""),
-                            "html_url": release.get("html_url"),
-                            "prerelease": release.get("prerelease", False)
-                        }
+                # First page came with the conditional request; fetch more
+                # only while no matching release has been found
+                candidates = chain(data, iter_pages(self._get_json, response["next_url"], MAX_PAGES - 1))
+                for candidate in candidates:
+                    tag_name = candidate.get("tag_name", "")
+                    if self._matches_tag_filter(tag_name, repo_name) and not candidate.get("prerelease", False):
+                        release = candidate
+                        break
+        elif data and not isinstance(data, list):
+            release = data
+        
+        if not release:
             return None
         
-        # No filter - use the latest release endpoint
-        url = f"{self.base_url}/repos/{owner}/{repo}/releases/latest"
-        data = self._make_request(url)
+        return {
+            "type": "release",
+            "name": release.get("name", release.get("tag_name")),
+            "tag_name": release.get("tag_name"),
+            "published_at": release.get("published_at"),
+            "body": release.get("body", ""),
+            "html_url": release.get("html_url"),
+            "prerelease": release.get("prerelease", False),
+            "etag": response["etag"],
+            "last_modified": response["last_modified"]
+        }
+    
+    def get_latest_releases_bulk(self, repo_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Look up the latest release of many repositories with GraphQL.
         
-        if data and not isinstance(data, list):
-            return {
-                "type": "release",
-                "name": data.get("name", data.get("tag_name")),
-                "tag_name": data.get("tag_name"),
-                "published_at": data.get("published_at"),
-                "body": data.get("body", ""),
-                "html_url": data.get("html_url"),
-                "prerelease": data.get("prerelease", False)
-            }
+        Each request covers up to GRAPHQL_BATCH_SIZE repositories through
+        aliased sub-queries, replacing one REST round trip per repository.
+        Results are stored in the version cache, so following
+        check_for_updates() calls for these repositories skip the release
+        request. For repositories with tag filters, the newest
+        GRAPHQL_FILTERED_RELEASES releases are fetched and matched
+        client-side.
         
-        return None
+        Args:
+            repo_names: Repository names (owner/repo).
+            
+        Returns:
+            Mapping of repository name to release data, or None if it has
+            no published release. Repositories that could not be looked up
+            are left out so callers fall back to REST.
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        
+        for start in range(0, len(repo_names), GRAPHQL_BATCH_SIZE):
+            batch = [
+                self.parse_repo_name(name)
+                for name in repo_names[start:start + GRAPHQL_BATCH_SIZE]
+            ]
+            
+            params = []
+            fields = []
+            variables: Dict[str, Any] = {}
+            for i, (owner, repo) in enumerate(batch):
+                params.append(f"$o{i}: String!, $n{i}: String!")
+                selection = (
+                    _FILTERED_RELEASE_FIELDS if f"{owner}/{repo}" in self.tag_filters
+                    else _LATEST_RELEASE_FIELDS
+                )
+                fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {selection} }}")
+                variables[f"o{i}"] = owner
+                variables[f"n{i}"] = repo
+            
+            query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+            data = self._post_graphql(query, variables)
+            if not data:
+                continue
+            
+            for i, (owner, repo) in enumerate(batch):
+                node = data.get(f"r{i}")
+                if node is None:
+                    continue
+                
+                repo_name = f"{owner}/{repo}"
+                if repo_name in self.tag_filters:
+                    nodes = (node.get("releases") or {}).get("nodes") or []
+                    latest = next((
+                        candidate for candidate in nodes
+                        if not candidate.get("isPrerelease") and not candidate.get("isDraft")
+                        and self._matches_tag_filter(candidate.get("tagName") or "", repo_name)
+                    ), None)
+                    if latest is None:
+                        # A match may be further back; leave it to REST paging
+                        continue
+                else:
+                    latest = node.get("latestRelease")
+                    if not latest:
+                        results[repo_name] = None
+                        continue
+                
+                release = {
+                    "type": "release",
+                    "name": latest.get("name") or latest.get("tagName"),
+                    "tag_name": latest.get("tagName"),
+                    "published_at": latest.get("publishedAt"),
+                    "body": latest.get("description") or "",
+                    "html_url": latest.get("url"),
+                    "prerelease": latest.get("isPrerelease", False),
+                    "etag": None,
+                    "last_modified": None
+                }
+                self._version_cache.set(self._version_key("release", owner, repo), dict(release))
+                results[repo_name] = release
+        
+        return results
     
     def get_latest_tag(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
         """
-        Get latest semantic version tag from repository.
+        Get latest tag, reusing a lookup made in the last minute.
+        
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            
+        Returns:
+            Tag data or None if no tags exist.
+        """
+        key = self._version_key("tag", owner, repo)
+        cached = self._version_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        tag = self._fetch_latest_tag(owner, repo)
+        if tag:
+            self._version_cache.set(key, dict(tag))
+        return tag
+    
+    def _fetch_latest_tag(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch latest semantic version tag from repository.
         
         Args:
             owner: Repository owner.
@@ -177,37 +619,42 @@ class GitHubService:
             Tag data or None if no tags exist.
         """
         repo_name = f"{owner}/{repo}"
-        url = f"{self.base_url}/repos/{owner}/{repo}/tags"
-        data = self._make_request(url)
-        
-        if data and isinstance(data, list) and len(data) > 0:
-            # Find first semantic version tag that matches filter
-            for tag in data:
-                tag_name = tag.get("name", "")
-                if self._is_semantic_version(tag_name) and self._matches_tag_filter(tag_name, repo_name):
-                    return {
-                        "type": "tag",
-                        "name": tag_name,
-                        "tag_name": tag_name,
-                        "commit_sha": tag.get("commit", {}).get("sha"),
-                        "commit_url": tag.get("commit", {}).get("url")
-                    }
+        url = f"{self.base_url}/repos/{owner}/{repo}/tags?per_page={PER_PAGE}"
+        
+        # Find first semantic version tag that matches filter, stopping
+        # pagination as soon as one is found
+        for tag in iter_pages(self._get_json, url):
+            tag_name = tag.get("name", "")
+            if self._tag_matcher.is_version(repo_name, tag_name):
+                return {
+                    "type": "tag",
+                    "name": tag_name,
+                    "tag_name": tag_name,
+                    "commit_sha": tag.get("commit", {}).get("sha"),
+                    "commit_url": tag.get("commit", {}).get("url")
+                }
         
         return None
     
-    def get_latest_version(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+    def get_latest_version(self, owner: str, repo: str, etag: Optional[str] = None,
+                           last_modified: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get latest version - prioritize releases, fall back to tags.
         
         Args:
             owner: Repository owner.
             repo: Repository name.
+            etag: ETag from the previous release lookup, if any.
+            last_modified: Last-Modified from the previous release lookup, if any.
             
         Returns:
-            Version data (release or tag) or None.
+            Version data (release or tag), {"not_modified": True} if the
+            latest release is unchanged, or None.
         """
         # Try to get latest release first
-        release = self.get_latest_release(owner, repo)
+        release = self.get_latest_release(owner, repo, etag, last_modified)
+        if release and release.get("not_modified"):
+            return release
         if release and not release.get("prerelease"):
             return release
         
@@ -227,17 +674,23 @@ class GitHubService:
             head: Head version/tag.
             
         Returns:
-            Comparison data including commit messages.
+            Comparison data; "commit_messages" is a lazy iterator.
         """
+        # Nothing between a ref and itself; skip the (expensive) compare call
+        if base == head:
+            return {"ahead_by": 0, "behind_by": 0, "total_commits": 0,
+                    "commit_messages": iter(()), "html_url": None}
+        
         url = f"{self.base_url}/repos/{owner}/{repo}/compare/{base}...{head}"
-        data = self._make_request(url)
+        with self._compare_slots:
+            data = self._make_request(url)
         
         if data:
             commits = data.get("commits", [])
-            commit_messages = [
+            commit_messages = (
                 commit.get("commit", {}).get("message", "")
                 for commit in commits
-            ]
+            )
             
             return {
                 "ahead_by": data.get("ahead_by", 0),
@@ -250,7 +703,8 @@ class GitHubService:
         return None
     
     def get_commit_messages_between_tags(self, owner: str, repo: str,
-                                        old_tag: str, new_tag: str) -> List[str]:
+                                        old_tag: str, new_tag: str,
+                                        limit: int = MAX_COMMIT_MESSAGES) -> List[str]:
         """
         Get commit messages between two tags.
         
@@ -259,14 +713,15 @@ class GitHubService:
             repo: Repository name.
             old_tag: Old tag name.
             new_tag: New tag name.
+            limit: Maximum number of messages to return.
             
         Returns:
-            List of commit messages.
+            List of at most limit commit messages.
         """
         comparison = self.compare_commits(owner, repo, old_tag, new_tag)
         
         if comparison:
-            return comparison.get("commit_messages", [])
+            return list(islice(comparison["commit_messages"], limit))
         
         return []
     
@@ -280,28 +735,37 @@ class GitHubService:
         Returns:
             Tuple of (owner, repo).
         """
-        parts = repo_name.split("/")
-        if len(parts) != 2:
+        owner, separator, repo = repo_name.partition("/")
+        if not separator or "/" in repo:
             raise ValueError(f"Invalid repository name format: {repo_name}")
         
-        return parts[0], parts[1]
+        return owner, repo
     
     def check_for_updates(self, repo_name: str, 
-                         last_version: Optional[str] = None) -> Dict[str, Any]:
+                         last_version: Optional[str] = None,
+                         etag: Optional[str] = None,
+                         last_modified: Optional[str] = None) -> Dict[str, Any]:
         """
         Check if repository has new version available.
         
         Args:
             repo_name: Repository name (owner/repo).
             last_version: Last known version.
+            etag: ETag stored from the previous release lookup.
+            last_modified: Last-Modified stored from the previous release lookup.
             
         Returns:
-            Dictionary with update information.
+            Dictionary with update information, including the validators
+            ("etag", "last_modified") to store for the next check.
         """
         owner, repo = self.parse_repo_name(repo_name)
         
+        # Validators are only meaningful once a version is known
+        if not last_version:
+            etag = last_modified = None
+        
         # Get latest version
-        latest = self.get_latest_version(owner, repo)
+        latest = self.get_latest_version(owner, repo, etag, last_modified)
         
         if not latest:
             return {
@@ -309,8 +773,24 @@ class GitHubService:
                 "error": "Could not fetch latest version"
             }
         
+        # Latest release unchanged since the last check (304 Not Modified)
+        if latest.get("not_modified"):
+            return {
+                "has_update": False,
+                "current_version": last_version,
+                "etag": etag,
+                "last_modified": last_modified
+            }
+        
         latest_version = latest.get("tag_name")
         
+        # Validators only describe the release lookup, so keep them only
+        # when the latest version actually came from a release
+        validators = {
+            "etag": latest.get("etag"),
+            "last_modified": latest.get("last_modified")
+        }
+        
         # If no previous version, this is first check
         if not last_version:
             return {
@@ -321,14 +801,16 @@ class GitHubService:
                 "release_notes": latest.get("body", ""),
                 "version_type": latest.get("type"),
                 "html_url": latest.get("html_url", ""),
-                "commit_messages": []
+                "commit_messages": [],
+                **validators
             }
         
         # Check if version has changed
         if latest_version == last_version:
             return {
                 "has_update": False,
-                "current_version": latest_version
+                "current_version": latest_version,
+                **validators
             }
         
         # New version detected
@@ -340,11 +822,12 @@ class GitHubService:
             "release_notes": latest.get("body", ""),
             "version_type": latest.get("type"),
             "html_url": latest.get("html_url", ""),
-            "commit_messages": []
+            "commit_messages": [],
+            **validators
         }
         
         # If no release notes, get commit messages between versions
-        if not result["release_notes"] and latest.get("type") == "tag" and latest_version:
+        if not (result["release_notes"] or "").strip() and latest.get("type") == "tag" and latest_version:
             commit_messages = self.get_commit_messages_between_tags(
                 owner, repo, last_version, latest_version
             )
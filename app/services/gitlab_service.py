@@ -2,68 +2,144 @@
 GitLab API service.
 Handles interaction with GitLab REST API for releases, tags, and commits.
 """
+import functools
+import logging
 import requests
-import re
+import threading
+from itertools import islice
 from typing import Optional, Dict, Any, List, Tuple
-from datetime import datetime
 from urllib.parse import quote
 
 from app.config import Config
+from app.json_codec import loads as json_loads
+from app.services.http import create_session
+from app.services.release_lookup import PER_PAGE, TagMatcher, iter_pages
+from app.services.ttl_cache import TTLCache
 
 
+logger = logging.getLogger(__name__)
+
+# Maximum in-flight requests to the GitLab API across all monitor threads
+MAX_CONCURRENT_REQUESTS = 8
+
+# Compare responses are the largest and slowest; cap how many of the
+# request slots they can hold at once so release/tag lookups keep flowing
+MAX_CONCURRENT_COMPARES = 4
+
+# Commit messages collected for a tag-only update (the analysis prompt
+# uses fewer still)
+MAX_COMMIT_MESSAGES = 50
+
+# Seconds a latest-release/latest-tag lookup is reused by later checks
+VERSION_CACHE_TTL_SECONDS = 60
+
+# Latest-release/latest-tag lookups shared by every GitLabService in the process,
+# so separately created instances (e.g. in test scripts) reuse them too
+_VERSION_CACHE = TTLCache(maxsize=1024, ttl=VERSION_CACHE_TTL_SECONDS)
+
 class GitLabService:
     """Service for interacting with GitLab API."""
     
-    def __init__(self, tag_filters: Optional[Dict[str, List[str]]] = None):
+    __slots__ = (
+        "token", "base_url", "headers", "tag_filters", "_tag_matcher",
+        "_owns_session", "session",
+        "_request_slots", "_compare_slots", "_version_cache",
+    )
+    
+    def __init__(self, tag_filters: Optional[Dict[str, List[str]]] = None,
+                 session: Optional[requests.Session] = None):
         """Initialize GitLab service with API token and optional tag filters.
         
         Args:
             tag_filters: Dictionary mapping repo names to list of tag patterns to filter.
+            session: Shared HTTP session; a new pooled session is created if omitted.
         """
         self.token = Config.GITLAB_TOKEN
         self.base_url = Config.GITLAB_API_BASE
+        # Sent per request rather than set on the session: the session may be
+        # shared with GitHub and Slack, which must not see the GitLab token
         self.headers = {
             "PRIVATE-TOKEN": self.token
         } if self.token else {}
         self.tag_filters = tag_filters or {}
+        self._tag_matcher = TagMatcher(self.tag_filters)
+        # Only close the session on close() if this service created it
+        self._owns_session = session is None
+        self.session = session or create_session()
+        self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self._compare_slots = threading.BoundedSemaphore(MAX_CONCURRENT_COMPARES)
+        # Recent latest-release/latest-tag lookups, keyed by _version_key()
+        self._version_cache = _VERSION_CACHE
     
-    def _make_request(self, url: str) -> Optional[Dict[Any, Any]]:
+    def _send_request(self, url: str) -> Optional[requests.Response]:
         """
-        Make authenticated request to GitLab API.
+        Send authenticated GET request to GitLab API.
         
         Args:
             url: API endpoint URL.
             
         Returns:
-            JSON response or None on error.
+            Response or None on error.
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            with self._request_slots:
+                response = self.session.get(url, headers=self.headers, timeout=30)
             
             if response.status_code == 404:
-                print(f"Resource not found: {url}")
+                logger.warning("Resource not found: %s", url)
                 return None
             
             response.raise_for_status()
-            return response.json()
+            return response
             
         except requests.exceptions.RequestException as e:
-            print(f"GitLab API request failed: {e}")
+            logger.error("GitLab API request failed: %s", e)
             return None
     
-    def _is_semantic_version(self, tag_name: str) -> bool:
+    def _make_request(self, url: str) -> Optional[Dict[Any, Any]]:
         """
-        Check if tag follows semantic versioning.
+        Make authenticated request to GitLab API.
         
         Args:
-            tag_name: Tag name to check.
+            url: API endpoint URL.
+            
+        Returns:
+            JSON response or None on error.
+        """
+        return self._get_json(url)[0]
+    
+    def _get_json(self, url: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        GET a JSON resource along with the URL of its next page.
+        
+        Args:
+            url: API endpoint URL.
             
         Returns:
-            True if tag is semantic version.
+            Tuple of (JSON response or None on error, next page URL or None).
         """
-        # Match v1.2.3, 1.2.3, v1.2.3-beta, etc.
-        pattern = r'^v?\d+\.\d+\.\d+.*$'
-        return bool(re.match(pattern, tag_name))
+        response = self._send_request(url)
+        if response is None:
+            return None, None
+        
+        try:
+            data = json_loads(response.content)
+        except ValueError as e:
+            logger.error("GitLab API returned invalid JSON: %s", e)
+            return None, None
+        
+        return data, response.links.get("next", {}).get("url")
+    
+    def close(self) -> None:
+        """Release pooled connections held by this service's own session."""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self) -> "GitLabService":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _matches_tag_filter(self, tag_name: str, repo_name: str) -> bool:
         """
@@ -76,37 +152,60 @@ class GitLabService:
         Returns:
             True if tag matches filter or no filter exists for this repo.
         """
-        # If no filter for this repo, accept all tags
-        if repo_name not in self.tag_filters:
-            return True
+        return self._tag_matcher.matches(repo_name, tag_name)
+    
+    def _version_key(self, kind: str, group: str, project: str) -> Tuple[str, ...]:
+        """
+        Build the version cache key for a lookup.
         
-        patterns = self.tag_filters[repo_name]
-        tag_lower = tag_name.lower()
+        The tag filters are part of the key because they change which
+        release or tag is "latest", and the cache is shared by instances.
         
-        # Check if tag contains any of the filter patterns
-        for pattern in patterns:
-            pattern_lower = pattern.lower()
-            if pattern_lower in tag_lower:
-                return True
+        Args:
+            kind: "release" or "tag".
+            group: Project group/namespace.
+            project: Project name.
+            
+        Returns:
+            Cache key.
+        """
+        return (kind, group, project) + self._tag_matcher.cache_key(f"{group}/{project}")
+    
+    def invalidate_cache(self, repo_name: str) -> None:
+        """
+        Drop cached latest-release/latest-tag lookups for a repository.
         
-        return False
+        Args:
+            repo_name: Repository name (group/project).
+        """
+        group, project = self.parse_repo_name(repo_name)
+        self._version_cache.pop(self._version_key("release", group, project))
+        self._version_cache.pop(self._version_key("tag", group, project))
     
-    def _extract_version(self, tag_name: str) -> str:
+    def get_latest_release(self, group: str, project: str) -> Optional[Dict[str, Any]]:
         """
-        Extract version number from tag name.
+        Get latest release, reusing a lookup made in the last minute.
         
         Args:
-            tag_name: Tag name.
+            group: Project group/namespace.
+            project: Project name.
             
         Returns:
-            Version string.
+            Release data or None if no releases exist.
         """
-        # Remove 'v' prefix if present
-        return tag_name.lstrip('v')
+        key = self._version_key("release", group, project)
+        cached = self._version_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        release = self._fetch_latest_release(group, project)
+        if release:
+            self._version_cache.set(key, dict(release))
+        return release
     
-    def get_latest_release(self, group: str, project: str) -> Optional[Dict[str, Any]]:
+    def _fetch_latest_release(self, group: str, project: str) -> Optional[Dict[str, Any]]:
         """
-        Get latest release from GitLab project.
+        Fetch latest release from GitLab project.
         
         Args:
             group: Project group/namespace.
@@ -116,29 +215,27 @@ class GitLabService:
             Release data or None if no releases exist.
         """
         repo_name = f"{group}/{project}"
-        project_id = quote(f"{group}/{project}", safe='')
+        project_id = self._project_id(group, project)
         
-        # If tag filters exist for this repo, get all releases and filter
+        # If tag filters exist for this repo, page through releases and filter
         if repo_name in self.tag_filters:
-            url = f"{self.base_url}/projects/{project_id}/releases"
-            data = self._make_request(url)
+            url = f"{self.base_url}/projects/{project_id}/releases?per_page={PER_PAGE}"
             
-            if data and isinstance(data, list):
-                for release in data:
-                    tag_name = release.get("tag_name", "")
-                    if self._matches_tag_filter(tag_name, repo_name):
-                        return {
-                            "type": "release",
-                            "name": release.get("name", release.get("tag_name")),
-                            "tag_name": tag_name,
-                            "released_at": release.get("released_at"),
-                            "body": release.get("description", ""),
-                            "html_url": release.get("_links", {}).get("self", ""),
-                        }
+            for release in iter_pages(self._get_json, url):
+                tag_name = release.get("tag_name", "")
+                if self._matches_tag_filter(tag_name, repo_name):
+                    return {
+                        "type": "release",
+                        "name": release.get("name", release.get("tag_name")),
+                        "tag_name": tag_name,
+                        "released_at": release.get("released_at"),
+                        "body": release.get("description", ""),
+                        "html_url": release.get("_links", {}).get("self", ""),
+                    }
             return None
         
-        # No filter - get latest release
-        url = f"{self.base_url}/projects/{project_id}/releases"
+        # No filter - only the newest release is needed
+        url = f"{self.base_url}/projects/{project_id}/releases?per_page=1"
         data = self._make_request(url)
         
         if data and isinstance(data, list) and len(data) > 0:
@@ -156,7 +253,7 @@ class GitLabService:
     
     def get_latest_tag(self, group: str, project: str) -> Optional[Dict[str, Any]]:
         """
-        Get latest semantic version tag from repository.
+        Get latest tag, reusing a lookup made in the last minute.
         
         Args:
             group: Project group/namespace.
@@ -165,23 +262,43 @@ class GitLabService:
         Returns:
             Tag data or None if no tags exist.
         """
-        repo_name = f"{group}/{project}"
-        project_id = quote(f"{group}/{project}", safe='')
-        url = f"{self.base_url}/projects/{project_id}/repository/tags"
-        data = self._make_request(url)
+        key = self._version_key("tag", group, project)
+        cached = self._version_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        tag = self._fetch_latest_tag(group, project)
+        if tag:
+            self._version_cache.set(key, dict(tag))
+        return tag
+    
+    def _fetch_latest_tag(self, group: str, project: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch latest semantic version tag from repository.
         
-        if data and isinstance(data, list) and len(data) > 0:
-            # Find first semantic version tag that matches filter
-            for tag in data:
-                tag_name = tag.get("name", "")
-                if self._is_semantic_version(tag_name) and self._matches_tag_filter(tag_name, repo_name):
-                    return {
-                        "type": "tag",
-                        "name": tag_name,
-                        "tag_name": tag_name,
-                        "commit_sha": tag.get("commit", {}).get("id"),
-                        "commit_url": tag.get("commit", {}).get("web_url")
-                    }
+        Args:
+            group: Project group/namespace.
+            project: Project name.
+            
+        Returns:
+            Tag data or None if no tags exist.
+        """
+        repo_name = f"{group}/{project}"
+        project_id = self._project_id(group, project)
+        url = f"{self.base_url}/projects/{project_id}/repository/tags?per_page={PER_PAGE}"
+        
+        # Find first semantic version tag that matches filter, stopping
+        # pagination as soon as one is found
+        for tag in iter_pages(self._get_json, url):
+            tag_name = tag.get("name", "")
+            if self._tag_matcher.is_version(repo_name, tag_name):
+                return {
+                    "type": "tag",
+                    "name": tag_name,
+                    "tag_name": tag_name,
+                    "commit_sha": tag.get("commit", {}).get("id"),
+                    "commit_url": tag.get("commit", {}).get("web_url")
+                }
         
         return None
     
@@ -217,18 +334,24 @@ class GitLabService:
             head: Head version/tag.
             
         Returns:
-            Comparison data including commit messages.
+            Comparison data; "commit_messages" is a lazy iterator.
         """
-        project_id = quote(f"{group}/{project}", safe='')
+        # Nothing between a ref and itself; skip the (expensive) compare call
+        if base == head:
+            return {"ahead_by": 0, "total_commits": 0,
+                    "commit_messages": iter(()), "html_url": ""}
+        
+        project_id = self._project_id(group, project)
         url = f"{self.base_url}/projects/{project_id}/repository/compare?from={base}&to={head}"
-        data = self._make_request(url)
+        with self._compare_slots:
+            data = self._make_request(url)
         
         if data:
             commits = data.get("commits", [])
-            commit_messages = [
+            commit_messages = (
                 commit.get("message", "")
                 for commit in commits
-            ]
+            )
             
             return {
                 "ahead_by": len(commits),
@@ -240,7 +363,8 @@ class GitLabService:
         return None
     
     def get_commit_messages_between_tags(self, group: str, project: str,
-                                        old_tag: str, new_tag: str) -> List[str]:
+                                        old_tag: str, new_tag: str,
+                                        limit: int = MAX_COMMIT_MESSAGES) -> List[str]:
         """
         Get commit messages between two tags.
         
@@ -249,17 +373,33 @@ class GitLabService:
             project: Project name.
             old_tag: Old tag name.
             new_tag: New tag name.
+            limit: Maximum number of messages to return.
             
         Returns:
-            List of commit messages.
+            List of at most limit commit messages.
         """
         comparison = self.compare_commits(group, project, old_tag, new_tag)
         
         if comparison:
-            return comparison.get("commit_messages", [])
+            return list(islice(comparison["commit_messages"], limit))
         
         return []
     
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _project_id(group: str, project: str) -> str:
+        """
+        URL-encode a project path for use as a GitLab project ID.
+        
+        Args:
+            group: Group (or nested group) path.
+            project: Project name.
+            
+        Returns:
+            Encoded 'group%2Fproject' string.
+        """
+        return quote(f"{group}/{project}", safe='')
+    
     def parse_repo_name(self, repo_name: str) -> Tuple[str, str]:
         """
         Parse repository name into group and project.
@@ -270,11 +410,11 @@ class GitLabService:
         Returns:
             Tuple of (group, project).
         """
-        parts = repo_name.split("/", 1)
-        if len(parts) != 2:
+        group, separator, project = repo_name.partition("/")
+        if not separator:
             raise ValueError(f"Invalid repository name format: {repo_name}")
         
-        return parts[0], parts[1]
+        return group, project
     
     def check_for_updates(self, repo_name: str, 
                          last_version: Optional[str] = None) -> Dict[str, Any]:
@@ -334,7 +474,7 @@ class GitLabService:
         }
         
         # If no release notes, get commit messages between versions
-        if not result["release_notes"] and latest.get("type") == "tag" and latest_version:
+        if not (result["release_notes"] or "").strip() and latest.get("type") == "tag" and latest_version:
             commit_messages = self.get_commit_messages_between_tags(
                 group, project, last_version, latest_version
             )
@@ -0,0 +1,27 @@
+"""
+Shared HTTP session factory.
+Builds pooled requests sessions so services reuse TCP/TLS connections.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Connections kept alive per host; covers the monitor's concurrent workers
+DEFAULT_POOL_SIZE = 20
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    Create a requests session with a connection pool.
+    
+    Args:
+        pool_size: Number of hosts to pool and connections kept per host.
+        
+    Returns:
+        Configured session, safe to share between services.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
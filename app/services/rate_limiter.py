@@ -0,0 +1,43 @@
+"""
+Token-bucket rate limiter.
+Keeps outbound API calls under a provider's quota across threads.
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+    
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            rate_per_sec: Tokens added to the bucket per second.
+            burst: Maximum tokens the bucket can hold.
+        """
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until the bucket has refilled if needed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._updated) * self.rate_per_sec
+                )
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate_per_sec
+            
+            time.sleep(wait)
@@ -0,0 +1,108 @@
+"""
+Helpers shared by the GitHub and GitLab services.
+Tag filter matching and lazy pagination of list endpoints.
+"""
+import re
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple
+
+
+# Page size for list endpoints (the maximum on both GitHub and GitLab) and
+# how many pages to scan before giving up on finding a matching release or tag
+PER_PAGE = 100
+MAX_PAGES = 5
+
+# Semantic version tag prefix: v1.2.3, 1.2.3, v1.2.3-beta, etc.
+SEMVER_RE = re.compile(r'^v?\d+\.\d+\.\d+')
+
+# Filter for a repository configured with no patterns: accepts no tag
+_MATCH_NOTHING = re.compile(r'(?!)')
+
+
+class TagMatcher:
+    """Per-repository tag filters, each compiled once into a single regex."""
+    
+    __slots__ = ("_filter_res",)
+    
+    def __init__(self, tag_filters: Dict[str, List[str]]):
+        """
+        Compile the filter patterns of every repository.
+        
+        Each repository gets one case-insensitive alternation, so a
+        single search() scans the tag once in C instead of testing each
+        pattern with a Python-level substring loop.
+        
+        Args:
+            tag_filters: Dictionary mapping repo names to list of tag patterns to filter.
+        """
+        self._filter_res: Dict[str, re.Pattern] = {
+            repo: re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE)
+            if patterns else _MATCH_NOTHING
+            for repo, patterns in tag_filters.items()
+        }
+    
+    def matches(self, repo_name: str, tag_name: str) -> bool:
+        """
+        Check if tag matches any filter patterns for the repository.
+        
+        Args:
+            repo_name: Repository name.
+            tag_name: Tag name to check.
+        
+        Returns:
+            True if tag matches filter or no filter exists for this repo.
+        """
+        filter_re = self._filter_res.get(repo_name)
+        return filter_re is None or filter_re.search(tag_name) is not None
+    
+    def is_version(self, repo_name: str, tag_name: str) -> bool:
+        """
+        Check if tag is a semantic version accepted by the repository's filter.
+        
+        Args:
+            repo_name: Repository name.
+            tag_name: Tag name to check.
+        
+        Returns:
+            True if tag counts as a version of this repository.
+        """
+        return SEMVER_RE.match(tag_name) is not None and self.matches(repo_name, tag_name)
+    
+    def cache_key(self, repo_name: str) -> Tuple[str, ...]:
+        """
+        Identify the repository's filter for use in cache keys.
+        
+        Args:
+            repo_name: Repository name.
+        
+        Returns:
+            The compiled filter's pattern, or () when the repo has no filter.
+        """
+        filter_re = self._filter_res.get(repo_name)
+        return (filter_re.pattern,) if filter_re is not None else ()
+
+
+def iter_pages(get_page: Callable[[str], Tuple[Optional[Any], Optional[str]]],
+               url: Optional[str], max_pages: int = MAX_PAGES) -> Iterator[Dict[str, Any]]:
+    """
+    Yield items from a paginated list endpoint, following Link headers.
+    
+    Pages are fetched lazily, so a caller that stops iterating once it
+    finds what it needs never requests the remaining pages.
+    
+    Args:
+        get_page: Fetches a URL, returning (JSON response or None, next page URL or None).
+        url: URL of the first page to fetch (None yields nothing).
+        max_pages: Maximum number of pages to fetch.
+    
+    Yields:
+        Items from each page in order.
+    """
+    for _ in range(max_pages):
+        if not url:
+            return
+        
+        data, url = get_page(url)
+        if not isinstance(data, list):
+            return
+        
+        yield from data
@@ -2,79 +2,178 @@
 Unified repository service.
 Handles both GitHub and GitLab repositories.
 """
-from typing import Optional, Dict, Any, List
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Tuple
+import requests
 from app.services.github_service import GitHubService
 from app.services.gitlab_service import GitLabService
+from app.services.http import create_session
+
+
+# Platform selected by an explicit "<prefix>:" in the repository name
+PLATFORM_PREFIXES = {
+    "github": "github",
+    "gitlab": "gitlab",
+}
+
+# Upper bound on repositories checked at once by check_many()
+MAX_PARALLEL_CHECKS = 16
+
+# Display name for each platform
+PLATFORM_NAMES = {
+    "github": "GitHub",
+    "gitlab": "GitLab",
+}
 
 
 class RepositoryService:
     """Unified service for interacting with GitHub and GitLab repositories."""
     
-    def __init__(self, tag_filters: Optional[Dict[str, List[str]]] = None):
+    __slots__ = (
+        "_owns_session", "_session", "github_service", "gitlab_service",
+        "tag_filters", "_services", "_repo_url_cache", "_platform_cache",
+    )
+    
+    def __init__(self, tag_filters: Optional[Dict[str, List[str]]] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize repository service with both GitHub and GitLab services.
         
         Args:
             tag_filters: Dictionary mapping repo names to list of tag patterns to filter.
+            session: HTTP session shared by both platform services; a new
+                pooled session is created if omitted.
         """
-        self.github_service = GitHubService(tag_filters=tag_filters)
-        self.gitlab_service = GitLabService(tag_filters=tag_filters)
+        self._owns_session = session is None
+        session = session or create_session()
+        self._session = session
+        self.github_service = GitHubService(tag_filters=tag_filters, session=session)
+        self.gitlab_service = GitLabService(tag_filters=tag_filters, session=session)
         self.tag_filters = tag_filters or {}
+        self._services = {
+            "github": self.github_service,
+            "gitlab": self.gitlab_service,
+        }
+        
+        # URL and platform are pure functions of the (bounded) repo name
+        self._repo_url_cache = functools.lru_cache(maxsize=256)(self._repo_url)
+        self._platform_cache = functools.lru_cache(maxsize=256)(self._platform)
     
-    def _detect_platform(self, repo_name: str) -> str:
+    def close(self) -> None:
+        """Release pooled connections if this service created the session."""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self) -> "RepositoryService":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _split(self, repo_name: str) -> Tuple[str, str]:
         """
-        Detect if repository is from GitHub or GitLab.
+        Detect the platform and strip its prefix in one pass.
         
         Args:
             repo_name: Repository name (can include platform prefix).
             
         Returns:
-            'github' or 'gitlab'.
+            Tuple of ('github' or 'gitlab', name without prefix).
         """
         # Check for explicit prefix
-        if repo_name.startswith("gitlab:"):
-            return "gitlab"
-        if repo_name.startswith("github:"):
-            return "github"
+        prefix, separator, clean_name = repo_name.partition(":")
+        platform = PLATFORM_PREFIXES.get(prefix) if separator else None
+        if platform:
+            return platform, clean_name
         
         # Default to GitHub for backward compatibility
-        return "github"
-    
-    def _clean_repo_name(self, repo_name: str) -> str:
-        """
-        Remove platform prefix from repository name.
-        
-        Args:
-            repo_name: Repository name with optional prefix.
-            
-        Returns:
-            Clean repository name without prefix.
-        """
-        if repo_name.startswith("gitlab:"):
-            return repo_name[7:]  # Remove 'gitlab:' prefix
-        if repo_name.startswith("github:"):
-            return repo_name[7:]  # Remove 'github:' prefix
-        return repo_name
+        return "github", repo_name
     
     def check_for_updates(self, repo_name: str, 
-                         last_version: Optional[str] = None) -> Dict[str, Any]:
+                         last_version: Optional[str] = None,
+                         etag: Optional[str] = None,
+                         last_modified: Optional[str] = None) -> Dict[str, Any]:
         """
         Check if repository has new version available.
         
         Args:
             repo_name: Repository name (owner/repo or gitlab:group/project).
             last_version: Last known version.
+            etag: ETag stored from the previous check (GitHub only).
+            last_modified: Last-Modified stored from the previous check (GitHub only).
             
         Returns:
             Dictionary with update information.
         """
-        platform = self._detect_platform(repo_name)
-        clean_name = self._clean_repo_name(repo_name)
+        platform, clean_name = self._split(repo_name)
         
         if platform == "gitlab":
             return self.gitlab_service.check_for_updates(clean_name, last_version)
         else:
-            return self.github_service.check_for_updates(clean_name, last_version)
+            return self.github_service.check_for_updates(
+                clean_name, last_version, etag, last_modified
+            )
+    
+    def invalidate_cache(self, repo_name: str) -> None:
+        """
+        Forget recent version lookups so the next check hits the API.
+        
+        Args:
+            repo_name: Repository name (owner/repo or gitlab:group/project).
+        """
+        platform, clean_name = self._split(repo_name)
+        self._services[platform].invalidate_cache(clean_name)
+    
+    def check_many(self, repo_versions: Mapping[str, Optional[str]],
+                   max_workers: int = MAX_PARALLEL_CHECKS) -> Dict[str, Dict[str, Any]]:
+        """
+        Check several repositories for updates concurrently.
+        
+        Each lookup is network-bound, so running them side by side makes
+        the batch take roughly as long as the slowest repository. GitHub
+        release lookups are first batched into GraphQL queries. A failure
+        in one repository is reported in its own result and does not
+        affect the others.
+        
+        Args:
+            repo_versions: Mapping of repository name to last known version.
+            max_workers: Maximum number of concurrent checks.
+            
+        Returns:
+            Mapping of repository name to its check_for_updates() result.
+        """
+        if not repo_versions:
+            return {}
+        
+        self.prefetch_latest_releases(repo_versions)
+        
+        def check(repo_name: str) -> Dict[str, Any]:
+            try:
+                return self.check_for_updates(repo_name, repo_versions[repo_name])
+            except Exception as e:
+                return {"has_update": False, "error": str(e)}
+        
+        workers = min(max_workers, len(repo_versions))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(repo_versions, executor.map(check, repo_versions)))
+    
+    def prefetch_latest_releases(self, repo_names: Iterable[str]) -> None:
+        """
+        Prime the GitHub release cache with one GraphQL query per batch.
+        
+        Following check_for_updates() calls for these repositories reuse
+        the prefetched release instead of making a REST request each.
+        
+        Args:
+            repo_names: Repository names (owner/repo or gitlab:group/project).
+        """
+        github_names = [
+            clean_name for platform, clean_name in map(self._split, repo_names)
+            if platform == "github"
+        ]
+        if len(github_names) > 1:
+            self.github_service.get_latest_releases_bulk(github_names)
     
     def get_repo_url(self, repo_name: str) -> str:
         """
@@ -86,13 +185,12 @@ class RepositoryService:
         Returns:
             Repository URL.
         """
-        platform = self._detect_platform(repo_name)
-        clean_name = self._clean_repo_name(repo_name)
-        
-        if platform == "gitlab":
-            return self.gitlab_service.get_repo_url(clean_name)
-        else:
-            return self.github_service.get_repo_url(clean_name)
+        return self._repo_url_cache(repo_name)
+    
+    def _repo_url(self, repo_name: str) -> str:
+        """Uncached get_repo_url()."""
+        platform, clean_name = self._split(repo_name)
+        return self._services[platform].get_repo_url(clean_name)
     
     def get_platform(self, repo_name: str) -> str:
         """
@@ -104,5 +202,8 @@ class RepositoryService:
         Returns:
             'GitHub' or 'GitLab'.
         """
-        platform = self._detect_platform(repo_name)
-        return "GitLab" if platform == "gitlab" else "GitHub"
+        return self._platform_cache(repo_name)
+    
+    def _platform(self, repo_name: str) -> str:
+        """Uncached get_platform()."""
+        return PLATFORM_NAMES[self._split(repo_name)[0]]
@@ -2,24 +2,203 @@
 Slack notification service.
 Sends alerts to Slack channels using webhooks.
 """
+import hashlib
+import logging
+import queue
 import requests
-from typing import Dict, Any, Optional
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
 
 from app.config import Config
+from app.json_codec import dumpb as json_dumpb
+from app.services.http import create_session
+from app.services.rate_limiter import RateLimiter
+from app.services.ttl_cache import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between webhook posts (Slack allows about one per second)
+MIN_POST_INTERVAL = 0.5
+
+# Payloads are serialized up front (orjson when available), so label them
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Blocks per batched message (Slack rejects more than 50)
+MAX_BLOCKS_PER_MESSAGE = 45
+
+# Messages waiting for the background sender before new alerts are refused
+MAX_QUEUED_MESSAGES = 256
+
+# Attempts per message before its alerts are reported as failed
+MAX_POST_ATTEMPTS = 3
+
+# Seconds before the first retry; doubles after each failed attempt
+RETRY_BACKOFF = 2.0
+
+# (dedupe key, fallback text, blocks, delivery outcome) for one alert awaiting delivery
+_PendingAlert = Tuple[bytes, str, list, "Future[bool]"]
+
+# Delivered alerts remembered for deduplication (oldest evicted first)
+DEDUPE_CACHE_SIZE = 10000
+
+# Static pieces of the alert message, built once at import
+_SEVERITY_EMOJI = {
+    "CRITICAL": "🚨",
+    "HIGH": "⚠️",
+    "MEDIUM": "ℹ️",
+    "LOW": "📝"
+}
+_DEFAULT_EMOJI = "📢"
+
+_DIVIDER = {"type": "divider"}
+
+_MANDATORY_RECOMMENDATION = "⚠️ *MANDATORY UPGRADE REQUIRED*\n• Review changes immediately\n• Plan upgrade timeline\n• Test in staging environment\n• Deploy to production ASAP"
+
+_RECOMMENDATIONS = {
+    "CRITICAL": "🚨 *CRITICAL UPDATE*\n• Review security implications\n• Upgrade as soon as possible\n• Monitor for network consensus changes",
+    "HIGH": "⚠️ *HIGH PRIORITY*\n• Review changes at earliest convenience\n• Plan upgrade within next maintenance window",
+}
+
+_DEFAULT_RECOMMENDATION = "ℹ️ *INFORMATIONAL*\n• Review changes when convenient\n• No urgent action required"
+
+
+def _recommendation_block(text: str) -> Dict[str, Any]:
+    """Wrap recommendation text in a Slack section block."""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+_MANDATORY_RECOMMENDATION_BLOCK = _recommendation_block(_MANDATORY_RECOMMENDATION)
+_RECOMMENDATION_BLOCKS = {
+    severity: _recommendation_block(text) for severity, text in _RECOMMENDATIONS.items()
+}
+_DEFAULT_RECOMMENDATION_BLOCK = _recommendation_block(_DEFAULT_RECOMMENDATION)
+
+def _dedupe_key(repo_name: str, old_version: str, new_version: str,
+                severity: str, mandatory: bool) -> bytes:
+    """
+    Identify an alert by a fixed-size SHA-256 digest of what it announces.
+    
+    Args:
+        repo_name: Repository name.
+        old_version: Previous version.
+        new_version: New version.
+        severity: Analysed severity.
+        mandatory: Whether the upgrade is mandatory.
+        
+    Returns:
+        32-byte digest.
+    """
+    identity = "\0".join((repo_name, str(old_version), str(new_version), str(severity), str(mandatory)))
+    return hashlib.sha256(identity.encode("utf-8")).digest()
+
+
+# Last formatted footer timestamp as (epoch second, text)
+_last_timestamp: Tuple[int, str] = (0, "")
+
+
+def _resolved(value: bool) -> "Future[bool]":
+    """Return a future already holding value."""
+    future: "Future[bool]" = Future()
+    future.set_result(value)
+    return future
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time for message footers, formatted once per second."""
+    global _last_timestamp
+    
+    second = int(time.time())
+    cached_second, text = _last_timestamp
+    if second != cached_second:
+        text = datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+        _last_timestamp = (second, text)
+    return text
 
 
 class SlackService:
     """Service for sending Slack notifications."""
     
-    def __init__(self):
-        """Initialize Slack service with webhook URL."""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize Slack service with webhook URL.
+        
+        Args:
+            session: Shared HTTP session; a new pooled session is created if omitted.
+        """
         self.webhook_url = Config.SLACK_WEBHOOK_URL
         self.enabled = bool(self.webhook_url)
+        # Only close the session on close() if this service created it
+        self._owns_session = session is None
+        self.session = session or create_session()
+        # Alerts delivered recently, keyed by _dedupe_key()
+        self._delivered = TTLCache(maxsize=DEDUPE_CACHE_SIZE, ttl=Config.SLACK_DEDUPE_TTL)
+        # Spaces out posts when many repositories update in one cycle
+        self._rate_limiter = RateLimiter(1 / MIN_POST_INTERVAL)
+        
+        # Alerts are queued and posted by a background thread
+        self._queue: "queue.Queue[Optional[List[_PendingAlert]]]" = queue.Queue(MAX_QUEUED_MESSAGES)
+        self._sender: Optional[threading.Thread] = None
+        self._sender_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Release pooled connections held by this service's own session."""
+        if self._owns_session:
+            self.session.close()
+    
+    def _run_sender(self):
+        """Post queued alert messages until a None sentinel is received."""
+        while True:
+            message = self._queue.get()
+            try:
+                if message is None:
+                    return
+                
+                try:
+                    self._post_alerts(message)
+                except Exception as e:
+                    logger.error("Error sending Slack alert: %s", e)
+                    # Never leave a caller waiting on an unresolved outcome
+                    for _, _, _, outcome in message:
+                        if not outcome.done():
+                            outcome.set_result(False)
+            finally:
+                self._queue.task_done()
+    
+    def _ensure_sender(self) -> None:
+        """Start the background sender thread on first use."""
+        with self._sender_lock:
+            if self._sender is None or not self._sender.is_alive():
+                self._sender = threading.Thread(
+                    target=self._run_sender, name="slack-sender", daemon=True
+                )
+                self._sender.start()
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Flush queued alerts.
+        
+        Args:
+            wait: Block until queued alerts have been posted.
+        """
+        if self._sender is not None and self._sender.is_alive():
+            self._queue.put(None)
+            if wait:
+                self._sender.join()
+    
+    def __enter__(self) -> "SlackService":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _create_alert_blocks(self, repo_name: str, old_version: str,
                             new_version: str, analysis: Dict[str, Any],
-                            repo_url: str = "") -> list:
+                            repo_url: str = "", severity: Optional[str] = None,
+                            mandatory: Optional[bool] = None) -> list:
         """
         Create Slack blocks for version alert.
         
@@ -29,37 +208,54 @@ class SlackService:
             new_version: New version.
             analysis: AI analysis results.
             repo_url: Repository URL.
+            severity: Severity already read from analysis, if the caller has it.
+            mandatory: Mandatory flag already read from analysis, if the caller has it.
             
         Returns:
             List of Slack block elements.
         """
-        severity = analysis.get("severity", "MEDIUM")
-        mandatory = analysis.get("mandatory_upgrade", False)
+        if severity is None:
+            severity = analysis.get("severity", "MEDIUM")
+        if mandatory is None:
+            mandatory = analysis.get("mandatory_upgrade", False)
+        summary = analysis.get("summary", "No summary available.")
+        reasoning = analysis.get("reasoning", "")
         
-        # Emoji and color based on severity
-        emoji_map = {
-            "CRITICAL": "🚨",
-            "HIGH": "⚠️",
-            "MEDIUM": "ℹ️",
-            "LOW": "📝"
-        }
+        emoji = _SEVERITY_EMOJI.get(severity, _DEFAULT_EMOJI)
         
-        color_map = {
-            "CRITICAL": "#d93f0b",  # Red
-            "HIGH": "#f2c744",      # Orange/Yellow
-            "MEDIUM": "#2eb886",    # Green
-            "LOW": "#6b7280"        # Gray
-        }
+        # Optional sections, empty when there is nothing to show
+        reasoning_blocks = ({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*Reasoning*\n{reasoning}"
+            }
+        },) if reasoning else ()
         
-        emoji = emoji_map.get(severity, "📢")
-        color = color_map.get(severity, "#2eb886")
+        action_blocks = ({
+            "type": "actions",
+            "elements": [
+                {
+                    "type": "button",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "View on GitHub",
+                        "emoji": True
+                    },
+                    "url": repo_url,
+                    "style": "primary"
+                }
+            ]
+        },) if repo_url else ()
         
-        # Build header
-        mandatory_text = " *[MANDATORY]*" if mandatory else ""
-        header = f"{emoji} *{severity}*{mandatory_text} Update: {repo_name}"
+        # Recommendation based on severity/mandatory
+        if mandatory:
+            recommendation_block = _MANDATORY_RECOMMENDATION_BLOCK
+        else:
+            recommendation_block = _RECOMMENDATION_BLOCKS.get(severity, _DEFAULT_RECOMMENDATION_BLOCK)
         
-        # Build blocks
-        blocks = [
+        # Build the whole list in one literal
+        return [
             {
                 "type": "header",
                 "text": {
@@ -89,83 +285,32 @@ class SlackService:
                     }
                 ]
             },
+            _DIVIDER,
             {
-                "type": "divider"
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Summary*\n{analysis.get('summary', 'No summary available.')}"
-                }
-            }
-        ]
-        
-        # Add reasoning section
-        reasoning = analysis.get('reasoning', '')
-        if reasoning:
-            blocks.append({
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*Reasoning*\n{reasoning}"
+                    "text": f"*Summary*\n{summary}"
                 }
-            })
-        
-        # Add recommendation based on severity/mandatory
-        blocks.append({"type": "divider"})
-        
-        if mandatory:
-            recommendation = "⚠️ *MANDATORY UPGRADE REQUIRED*\n• Review changes immediately\n• Plan upgrade timeline\n• Test in staging environment\n• Deploy to production ASAP"
-        elif severity == "CRITICAL":
-            recommendation = "🚨 *CRITICAL UPDATE*\n• Review security implications\n• Upgrade as soon as possible\n• Monitor for network consensus changes"
-        elif severity == "HIGH":
-            recommendation = "⚠️ *HIGH PRIORITY*\n• Review changes at earliest convenience\n• Plan upgrade within next maintenance window"
-        else:
-            recommendation = "ℹ️ *INFORMATIONAL*\n• Review changes when convenient\n• No urgent action required"
-        
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": recommendation
-            }
-        })
-        
-        # Add action buttons
-        if repo_url:
-            blocks.append({
-                "type": "actions",
+            },
+            *reasoning_blocks,
+            _DIVIDER,
+            recommendation_block,
+            *action_blocks,
+            {
+                "type": "context",
                 "elements": [
                     {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "View on GitHub",
-                            "emoji": True
-                        },
-                        "url": repo_url,
-                        "style": "primary"
+                        "type": "mrkdwn",
+                        "text": f"Blockchain Release Monitor | {_utc_timestamp()}"
                     }
                 ]
-            })
-        
-        # Add footer
-        blocks.append({
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"Blockchain Release Monitor | {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
-                }
-            ]
-        })
-        
-        return blocks
+            }
+        ]
     
     def send_alert(self, repo_name: str, old_version: str,
                   new_version: str, analysis: Dict[str, Any],
-                  repo_url: str = "") -> bool:
+                  repo_url: str = "") -> "Future[bool]":
         """
         Send Slack alert for version update.
         
@@ -177,45 +322,162 @@ class SlackService:
             repo_url: Repository URL.
             
         Returns:
-            True if message sent successfully, False otherwise.
+            Future resolving to True if the alert was posted, False otherwise.
         """
-        if not self.enabled:
-            print("  Slack notifications disabled (no webhook URL)")
-            return False
+        return self.send_alert_batch([{
+            "repo_name": repo_name,
+            "old_version": old_version,
+            "new_version": new_version,
+            "analysis": analysis,
+            "repo_url": repo_url
+        }])[0]
+    
+    def send_alert_batch(self, alerts: List[Dict[str, Any]]) -> List["Future[bool]"]:
+        """
+        Queue several version alerts in as few Slack messages as possible.
         
-        try:
-            blocks = self._create_alert_blocks(
-                repo_name, old_version, new_version, analysis, repo_url
-            )
+        Alerts are packed into messages of at most MAX_BLOCKS_PER_MESSAGE
+        blocks, separated by dividers, so a cycle with many updates costs
+        one or two webhook posts instead of one per repository. Messages
+        are posted by a background thread, so a slow webhook never holds
+        up the caller; each alert's future resolves once its message has
+        been posted or has run out of retries.
+        
+        Args:
+            alerts: send_alert() keyword arguments, one dict per alert.
             
-            # Prepare message
+        Returns:
+            One future per alert, in order, resolving to True if the alert
+            was posted (or had been sent recently), False otherwise.
+        """
+        if not self.enabled:
+            logger.info("Slack notifications disabled (no webhook URL)")
+            return [_resolved(False) for _ in alerts]
+        
+        if Config.SLACK_DRY_RUN:
+            for alert in alerts:
+                logger.info("[DRY RUN] Would alert %s %s → %s", alert["repo_name"],
+                            alert["old_version"], alert["new_version"])
+            return [_resolved(True) for _ in alerts]
+        
+        outcomes: List["Future[bool]"] = []
+        messages: List[List[_PendingAlert]] = []
+        block_count = 0
+        
+        for alert in alerts:
+            repo_name = alert["repo_name"]
+            old_version = alert["old_version"]
+            new_version = alert["new_version"]
+            analysis = alert["analysis"]
             severity = analysis.get("severity", "MEDIUM")
             mandatory = analysis.get("mandatory_upgrade", False)
-            mandatory_text = " [MANDATORY]" if mandatory else ""
             
-            payload = {
-                "blocks": blocks,
-                "text": f"{severity}{mandatory_text} Update: {repo_name} {old_version} → {new_version}"  # Fallback text
-            }
+            dedupe_key = _dedupe_key(repo_name, old_version, new_version, severity, mandatory)
+            if self._delivered.get(dedupe_key):
+                logger.info("Slack alert for %s %s already sent, skipping", repo_name, new_version)
+                outcomes.append(_resolved(True))
+                continue
             
-            # Send to Slack
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=10
+            blocks = self._create_alert_blocks(
+                repo_name, old_version, new_version, analysis, alert.get("repo_url", ""),
+                severity=severity, mandatory=mandatory
             )
+            mandatory_text = " [MANDATORY]" if mandatory else ""
+            text = f"{severity}{mandatory_text} Update: {repo_name} {old_version} → {new_version}"
             
-            if response.status_code == 200:
-                print(f"  ✓ Slack alert sent successfully")
-                return True
-            else:
-                print(f"  ✗ Failed to send Slack alert: {response.status_code}")
-                print(f"    Response: {response.text}")
-                return False
+            # Start a new message when this alert (plus a separator) won't fit
+            if not messages or block_count + len(blocks) + 1 > MAX_BLOCKS_PER_MESSAGE:
+                messages.append([])
+                block_count = 0
+            
+            block_count += len(blocks) + (1 if messages[-1] else 0)
+            outcome: "Future[bool]" = Future()
+            outcomes.append(outcome)
+            messages[-1].append((dedupe_key, text, blocks, outcome))
+        
+        if messages:
+            self._ensure_sender()
+        for message in messages:
+            try:
+                self._queue.put_nowait(message)
+            except queue.Full:
+                logger.error("Slack queue full, dropping %d alert(s)", len(message))
+                for _, _, _, outcome in message:
+                    outcome.set_result(False)
+        return outcomes
+    
+    def _post_alerts(self, message: List[_PendingAlert]) -> bool:
+        """
+        Post one message carrying one or more alerts.
+        
+        Network errors, rate limiting (429) and server errors are retried
+        up to MAX_POST_ATTEMPTS times with exponential backoff. Each
+        alert's future is resolved with the final outcome.
+        
+        Args:
+            message: (dedupe key, fallback text, blocks, outcome) for each alert.
+            
+        Returns:
+            True if message sent successfully, False otherwise.
+        """
+        blocks = []
+        for _, _, alert_blocks, _ in message:
+            if blocks:
+                blocks.append(_DIVIDER)
+            blocks.extend(alert_blocks)
+        
+        payload = {
+            "blocks": blocks,
+            "text": "\n".join(text for _, text, _, _ in message)  # Fallback text
+        }
+        data = json_dumpb(payload)
+        
+        sent = False
+        delay = RETRY_BACKOFF
+        for attempt in range(1, MAX_POST_ATTEMPTS + 1):
+            retry = True
+            try:
+                # Send to Slack
+                self._rate_limiter.acquire()
+                response = self.session.post(
+                    self.webhook_url,
+                    data=data,
+                    headers=JSON_HEADERS,
+                    timeout=10
+                )
                 
-        except Exception as e:
-            print(f"  ✗ Error sending Slack alert: {e}")
-            return False
+                if response.status_code == 200:
+                    sent = True
+                    break
+                
+                logger.error("Failed to send Slack alert (attempt %d/%d): %s %s", attempt,
+                             MAX_POST_ATTEMPTS, response.status_code, response.text)
+                # Other client errors (bad payload, revoked webhook) will not recover
+                retry = response.status_code == 429 or response.status_code >= 500
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+            
+            except Exception as e:
+                logger.error("Error sending Slack alert (attempt %d/%d): %s",
+                             attempt, MAX_POST_ATTEMPTS, e)
+            
+            if not retry or attempt == MAX_POST_ATTEMPTS:
+                break
+            time.sleep(delay)
+            delay *= 2
+        
+        if sent:
+            logger.info("Slack alert sent (%d update(s))", len(message))
+        else:
+            logger.error("Giving up on Slack alert (%d update(s))", len(message))
+        
+        for dedupe_key, _, _, outcome in message:
+            # Only successful deliveries suppress repeats; failures may retry
+            if sent:
+                self._delivered.set(dedupe_key, True)
+            outcome.set_result(sent)
+        return sent
     
     def send_test_message(self) -> bool:
         """
@@ -225,7 +487,7 @@ class SlackService:
             True if test message sent successfully, False otherwise.
         """
         if not self.enabled:
-            print("Slack notifications disabled (no webhook URL configured)")
+            logger.info("Slack notifications disabled (no webhook URL configured)")
             return False
         
         try:
@@ -251,7 +513,7 @@ class SlackService:
                         "elements": [
                             {
                                 "type": "mrkdwn",
-                                "text": f"Test sent at {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
+                                "text": f"Test sent at {_utc_timestamp()}"
                             }
                         ]
                     }
@@ -259,20 +521,22 @@ class SlackService:
                 "text": "Test message from Blockchain Release Monitor"
             }
             
-            response = requests.post(
+            self._rate_limiter.acquire()
+            response = self.session.post(
                 self.webhook_url,
-                json=payload,
+                data=json_dumpb(payload),
+                headers=JSON_HEADERS,
                 timeout=10
             )
             
             if response.status_code == 200:
-                print("✓ Slack test message sent successfully")
+                logger.info("Slack test message sent successfully")
                 return True
             else:
-                print(f"✗ Failed to send Slack test message: {response.status_code}")
-                print(f"  Response: {response.text}")
+                logger.error("Failed to send Slack test message: %s %s",
+                             response.status_code, response.text)
                 return False
                 
         except Exception as e:
-            print(f"✗ Error sending Slack test message: {e}")
+            logger.error("Error sending Slack test message: %s", e)
             return False
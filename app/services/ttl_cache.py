@@ -0,0 +1,72 @@
+"""
+Small thread-safe cache with per-entry expiry.
+Used to reuse recent API lookups across back-to-back checks.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """LRU-bounded mapping whose entries expire ttl seconds after being set."""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """
+        Initialize cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Seconds an entry stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a live entry.
+        
+        Args:
+            key: Cache key.
+        
+        Returns:
+            Cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one if full.
+        
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> None:
+        """
+        Remove an entry if present.
+        
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
@@ -0,0 +1,142 @@
+"""
+Background queue for webhook-triggered repository checks.
+Lets the webhook handler return immediately while checks run in worker threads.
+Bursts of events for the same repository are coalesced into a single check.
+"""
+import logging
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Default number of worker threads draining the queue
+DEFAULT_WORKERS = 2
+
+# Seconds to wait for further events on a repository before checking it
+COALESCE_SECONDS = 5.0
+
+
+class WebhookQueue:
+    """Run repository checks from a queue, coalescing duplicates per repository."""
+    
+    def __init__(self, handler: Callable[[str], None], workers: int = DEFAULT_WORKERS,
+                 delay_seconds: float = COALESCE_SECONDS, name: str = "webhook-worker"):
+        """
+        Initialize the queue.
+        
+        Args:
+            handler: Called with the repository name for each queued check.
+            workers: Number of worker threads.
+            delay_seconds: Quiet period after the last event before a check is queued.
+            name: Name prefix for the worker threads.
+        """
+        self.handler = handler
+        self.workers = workers
+        self.delay_seconds = delay_seconds
+        self.name = name
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._pending: Set[str] = set()
+        self._timers: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+    
+    def submit(self, repo_name: str, event_type: Optional[str] = None,
+               delivery_id: Optional[str] = None) -> bool:
+        """
+        Schedule a check for a repository.
+        
+        The check is queued once no further events for the repository
+        have arrived for ``delay_seconds``; each new event restarts the wait.
+        
+        Args:
+            repo_name: Repository name (owner/repo).
+            event_type: Webhook event that triggered the check (for logging).
+            delivery_id: Webhook delivery ID (for logging).
+        
+        Returns:
+            True if a new check was scheduled, False if the event was
+            merged into one that is already pending.
+        """
+        with self._lock:
+            timer = self._timers.get(repo_name)
+            if timer is not None:
+                timer.cancel()
+            
+            coalesced = timer is not None or repo_name in self._pending
+            timer = threading.Timer(self.delay_seconds, self._enqueue, args=(repo_name,))
+            timer.daemon = True
+            self._timers[repo_name] = timer
+            timer.start()
+        
+        if coalesced:
+            logger.info("%s: check already pending, coalesced %s event (delivery %s)",
+                        repo_name, event_type, delivery_id)
+        else:
+            logger.info("%s: scheduled check for %s event (delivery %s)",
+                        repo_name, event_type, delivery_id)
+        return not coalesced
+    
+    def _enqueue(self, repo_name: str) -> None:
+        """Hand a repository to the workers once its quiet period has passed."""
+        with self._lock:
+            self._timers.pop(repo_name, None)
+            if repo_name in self._pending:
+                return
+            self._pending.add(repo_name)
+        
+        self._queue.put(repo_name)
+    
+    def _run(self):
+        """Pop repositories off the queue and check them until stopped."""
+        while True:
+            repo_name = self._queue.get()
+            if repo_name is None:
+                self._queue.task_done()
+                return
+            
+            # Release the slot before checking so events arriving mid-check
+            # queue a follow-up check instead of being dropped
+            with self._lock:
+                self._pending.discard(repo_name)
+            
+            try:
+                self.handler(repo_name)
+            except Exception:
+                logger.exception("%s: webhook-triggered check failed", repo_name)
+            finally:
+                self._queue.task_done()
+    
+    def start(self) -> None:
+        """Start the worker threads."""
+        if any(thread.is_alive() for thread in self._threads):
+            return
+        
+        self._threads = [
+            threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads once the queued checks are done.
+        
+        Checks still waiting out their quiet period are dropped.
+        
+        Args:
+            wait: Block until the workers exit.
+        """
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+        
+        for _ in self._threads:
+            self._queue.put(None)
+        
+        if wait:
+            for thread in self._threads:
+                if thread is not threading.current_thread():
+                    thread.join()
@@ -2,13 +2,18 @@
 """
 Entry point script for running the blockchain release monitor.
 """
+import argparse
 import sys
 import os
 
 # Add app directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.main import main
-
 if __name__ == "__main__":
+    # Handle --help before loading the app and its service dependencies
+    argparse.ArgumentParser(
+        description="Monitor blockchain repositories for new releases and send alerts."
+    ).parse_args()
+    
+    from app.main import main
     main()
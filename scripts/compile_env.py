@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compile a .env file into an importable Python module.
+
+Run at build/deploy time so the application can import its settings as
+plain Python literals instead of parsing .env on every process start.
+"""
+import argparse
+import os
+import pprint
+import sys
+
+from dotenv import dotenv_values
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_ENV_FILE = os.path.join(ROOT_DIR, ".env")
+DEFAULT_OUTPUT = os.path.join(ROOT_DIR, "app", "config_compiled.py")
+
+HEADER = '''"""
+Compiled environment settings.
+Generated by scripts/compile_env.py - do not edit by hand.
+"""
+'''
+
+
+def compile_env(env_file: str, output: str) -> int:
+    """
+    Write the values from env_file to output as a Python dict literal.
+    
+    Args:
+        env_file: Path to the .env file to read.
+        output: Path of the Python module to generate.
+        
+    Returns:
+        Number of settings written.
+    """
+    values = {
+        key: value
+        for key, value in dotenv_values(env_file).items()
+        if value is not None
+    }
+    
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        f.write("\nENV = ")
+        f.write(pprint.pformat(values, sort_dicts=True))
+        f.write("\n")
+    
+    return len(values)
+
+
+def main():
+    """Parse arguments and compile the .env file."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--env-file", default=DEFAULT_ENV_FILE,
+                        help="Path to the .env file (default: %(default)s)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="Module to generate (default: %(default)s)")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.env_file):
+        print(f"ERROR: {args.env_file} not found")
+        sys.exit(1)
+    
+    count = compile_env(args.env_file, args.output)
+    print(f"✓ Compiled {count} settings to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Shared pytest fixtures.
+Config parsing, service construction and database setup run once per
+test session instead of once per test. Tests marked integration call
+live APIs and only run with --integration.
+"""
+from typing import Any, Dict, List
+
+import pytest
+
+from app.config import Config
+from app.db.database import Database
+from app.services.github_service import GitHubService
+
+
+def pytest_addoption(parser):
+    """Add the opt-in flag for live API tests."""
+    parser.addoption(
+        "--integration", action="store_true",
+        help="also run tests marked integration (live GitHub, Gemini and SMTP calls)"
+    )
+
+
+def pytest_configure(config):
+    """Register the markers used by this suite."""
+    config.addinivalue_line(
+        "markers", "integration: calls live external APIs (skipped unless --integration)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless --integration was given, keeping the default run offline."""
+    if config.getoption("--integration"):
+        return
+    
+    skip = pytest.mark.skip(reason="calls live APIs; run with --integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+class StubGemini:
+    """Offline stand-in for GeminiService returning a fixed HIGH analysis."""
+    
+    def analyze_version_change(self, repo_name: str, old_version: str,
+                               new_version: str, release_notes: str = "",
+                               commit_messages: List[str] = None) -> Dict[str, Any]:
+        """Return a canned analysis in GeminiService's format."""
+        return {
+            "severity": "HIGH",
+            "mandatory_upgrade": False,
+            "summary": f"{repo_name} {old_version} → {new_version}",
+            "reasoning": "Stub analysis."
+        }
+    
+    def should_send_alert(self, analysis: Dict[str, Any]) -> bool:
+        """Same rule as GeminiService: mandatory, HIGH or CRITICAL."""
+        if analysis.get("mandatory_upgrade"):
+            return True
+        return analysis.get("severity", "MEDIUM") in ["HIGH", "CRITICAL"]
+
+
+@pytest.fixture(scope="session")
+def tag_filters():
+    """Tag filters parsed from the environment."""
+    return Config.get_repo_tag_filters()
+
+
+@pytest.fixture(scope="session")
+def github_service(tag_filters):
+    """GitHub service configured with the environment's tag filters."""
+    with GitHubService(tag_filters=tag_filters) as service:
+        yield service
+
+
+@pytest.fixture(scope="session")
+def gemini():
+    """Gemini stand-in that never calls the API."""
+    return StubGemini()
+
+
+@pytest.fixture(scope="session")
+def db(tmp_path_factory):
+    """Throwaway database, so tests never write to the configured one."""
+    database = Database(str(tmp_path_factory.mktemp("db") / "monitor.db"))
+    yield database
+    database.close()
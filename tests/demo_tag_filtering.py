@@ -3,8 +3,9 @@
 Demonstration of tag filtering feature.
 Shows how the monitor handles multiple repos, some with filters and some without.
 """
+from concurrent.futures import ThreadPoolExecutor
+
 from app.config import Config
-from app.services.github_service import GitHubService
 
 
 def demonstrate_filtering():
@@ -30,7 +31,9 @@ def demonstrate_filtering():
     print("-" * 70)
     print()
     
-    # Initialize GitHub service
+    # Initialize GitHub service (imported here so the banner prints first)
+    from app.services.github_service import GitHubService
+    
     github_service = GitHubService(tag_filters=filters)
     
     # Test different repositories
@@ -40,16 +43,21 @@ def demonstrate_filtering():
         ("InjectiveLabs/injective-chain-releases", "No filter - will track all releases"),
     ]
     
-    for repo_name, description in test_repos:
+    # Fetch all repositories at once, then print the results in order
+    with ThreadPoolExecutor(max_workers=len(test_repos)) as executor:
+        futures = [
+            executor.submit(github_service.get_latest_version, *repo_name.split("/"))
+            for repo_name, _ in test_repos
+        ]
+    
+    for (repo_name, description), future in zip(test_repos, futures):
         print(f"Repository: {repo_name}")
         print(f"Description: {description}")
         print()
         
-        owner, repo = repo_name.split("/")
-        
         try:
             # Get latest version
-            latest = github_service.get_latest_version(owner, repo)
+            latest = future.result()
             
             if latest:
                 tag_name = latest.get("tag_name")
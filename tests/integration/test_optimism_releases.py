@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Live check of tag-filtered release lookup against GitHub.
+Needs network access and GITHUB_TOKEN; meant for scheduled runs, not CI.
+"""
+import logging
+import os
+import re
+import socket
+import sys
+
+import pytest
+
+from app.config import Config
+from app.services.github_service import GitHubService
+
+
+logger = logging.getLogger(__name__)
+
+# Releases of the Optimism monorepo the monitor tracks
+TAG_FILTERS = {"ethereum-optimism/optimism": ["op-geth", "op-node"]}
+EXPECTED_TAG_RE = re.compile(r"op-geth|op-node", re.IGNORECASE)
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not Config.GITHUB_TOKEN, reason="GITHUB_TOKEN not set"),
+]
+
+
+def github_reachable() -> bool:
+    """Check whether the GitHub API host accepts connections."""
+    try:
+        socket.create_connection(("api.github.com", 443), timeout=5).close()
+    except OSError:
+        return False
+    return True
+
+
+@pytest.fixture(scope="module")
+def optimism_service():
+    """GitHub service filtering Optimism releases, skipped when offline."""
+    if not github_reachable():
+        pytest.skip("GitHub API unreachable")
+    with GitHubService(tag_filters=TAG_FILTERS) as service:
+        yield service
+
+
+def test_optimism_releases(optimism_service):
+    """Test fetching filtered releases from Optimism repo."""
+    logger.info("Fetching latest op-geth or op-node release from ethereum-optimism/optimism...")
+    latest = optimism_service.get_latest_version("ethereum-optimism", "optimism")
+    assert latest, "No matching release found (rate limited, or no release matches the filters)"
+    
+    tag_name = latest.get("tag_name") or ""
+    logger.info("✓ Found: %s (type: %s)", tag_name, latest.get("type"))
+    assert EXPECTED_TAG_RE.search(tag_name), f"Tag '{tag_name}' doesn't contain op-geth or op-node"
+
+
+def main():
+    """Run the live check."""
+    if not Config.GITHUB_TOKEN:
+        logger.warning("✗ ERROR: GITHUB_TOKEN not set in .env")
+        sys.exit(1)
+    
+    with GitHubService(tag_filters=TAG_FILTERS) as github_service:
+        try:
+            test_optimism_releases(github_service)
+        except Exception as e:
+            logger.warning("✗ Error: %s", e)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("BRW_LOG", "INFO"), format="%(message)s")
+    main()
@@ -5,19 +5,40 @@ Tests Gemini AI analysis with custom inputs.
 """
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.config import Config
-from app.services.gemini_service import GeminiService
 
+# Every test here calls the live Gemini API
+pytestmark = pytest.mark.integration
 
-def test_ai_with_release_notes():
-    """Test AI analysis with release notes."""
+
+def print_analysis(title, analysis, should_alert, show_reasoning=True):
+    """Print one test's analysis result under a banner."""
     print("\n" + "="*60)
-    print("Testing AI Analysis with Release Notes")
+    print(title)
     print("="*60)
     
+    print(f"\n✓ Analysis Complete:")
+    print(f"  Severity: {analysis.get('severity')}")
+    print(f"  Mandatory: {analysis.get('mandatory_upgrade')}")
+    print(f"\n  Summary:")
+    print(f"  {analysis.get('summary')}")
+    if show_reasoning:
+        print(f"\n  Reasoning:")
+        print(f"  {analysis.get('reasoning')}")
+    
+    print(f"\n  Send Alert: {should_alert}")
+
+
+def test_ai_with_release_notes():
+    """Test AI analysis with release notes."""
+    from app.services.gemini_service import GeminiService
+    
     gemini = GeminiService()
     
     # Sample release notes
@@ -47,26 +68,12 @@ Reasoning: This consolidation allows us to more easily introduce and manage Base
         commit_messages=[]
     )
     
-    print(f"\n✓ Analysis Complete:")
-    print(f"  Severity: {analysis.get('severity')}")
-    print(f"  Mandatory: {analysis.get('mandatory_upgrade')}")
-    print(f"\n  Summary:")
-    print(f"  {analysis.get('summary')}")
-    print(f"\n  Reasoning:")
-    print(f"  {analysis.get('reasoning')}")
-    
-    # Check if alert should be sent
-    should_alert = gemini.should_send_alert(analysis)
-    print(f"\n  Send Alert: {should_alert}")
-    
-    return analysis
+    return analysis, gemini.should_send_alert(analysis)
 
 
 def test_ai_with_commits():
     """Test AI analysis with commit messages."""
-    print("\n" + "="*60)
-    print("Testing AI Analysis with Commit Messages")
-    print("="*60)
+    from app.services.gemini_service import GeminiService
     
     gemini = GeminiService()
     
@@ -88,25 +95,12 @@ def test_ai_with_commits():
         commit_messages=commit_messages
     )
     
-    print(f"\n✓ Analysis Complete:")
-    print(f"  Severity: {analysis.get('severity')}")
-    print(f"  Mandatory: {analysis.get('mandatory_upgrade')}")
-    print(f"\n  Summary:")
-    print(f"  {analysis.get('summary')}")
-    print(f"\n  Reasoning:")
-    print(f"  {analysis.get('reasoning')}")
-    
-    should_alert = gemini.should_send_alert(analysis)
-    print(f"\n  Send Alert: {should_alert}")
-    
-    return analysis
+    return analysis, gemini.should_send_alert(analysis)
 
 
 def test_ai_with_minor_update():
     """Test AI analysis with minor update."""
-    print("\n" + "="*60)
-    print("Testing AI Analysis with Minor Update")
-    print("="*60)
+    from app.services.gemini_service import GeminiService
     
     gemini = GeminiService()
     
@@ -125,16 +119,7 @@ def test_ai_with_minor_update():
         commit_messages=[]
     )
     
-    print(f"\n✓ Analysis Complete:")
-    print(f"  Severity: {analysis.get('severity')}")
-    print(f"  Mandatory: {analysis.get('mandatory_upgrade')}")
-    print(f"\n  Summary:")
-    print(f"  {analysis.get('summary')}")
-    
-    should_alert = gemini.should_send_alert(analysis)
-    print(f"\n  Send Alert: {should_alert}")
-    
-    return analysis
+    return analysis, gemini.should_send_alert(analysis)
 
 
 def main():
@@ -151,15 +136,27 @@ def main():
     
     print(f"✓ Gemini API Key configured")
     
-    try:
+    # (banner, test, show reasoning)
+    tests = [
         # Test 1: Critical update with release notes
-        result1 = test_ai_with_release_notes()
-        
+        ("Testing AI Analysis with Release Notes", test_ai_with_release_notes, True),
         # Test 2: Update with commit messages
-        result2 = test_ai_with_commits()
-        
+        ("Testing AI Analysis with Commit Messages", test_ai_with_commits, True),
         # Test 3: Minor update
-        result3 = test_ai_with_minor_update()
+        ("Testing AI Analysis with Minor Update", test_ai_with_minor_update, False),
+    ]
+    
+    try:
+        # The Gemini calls are independent; run them at once and print in order
+        results = []
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(test) for _, test, _ in tests]
+            for (title, _, show_reasoning), future in zip(tests, futures):
+                analysis, should_alert = future.result()
+                print_analysis(title, analysis, should_alert, show_reasoning)
+                results.append(analysis)
+        
+        result1, result2, result3 = results
         
         # Summary
         print("\n" + "="*60)
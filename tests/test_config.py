@@ -1,200 +1,236 @@
 #!/usr/bin/env python3
 """
 Test script to verify configuration and services.
+Runs standalone (python3 tests/test_config.py) or under pytest.
 """
+import logging
 import sys
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pytest
 
 # Add app directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.config import Config
-from app.db.database import Database
-from app.services.github_service import GitHubService
-from app.services.gemini_service import GeminiService
-from app.services.email_service import EmailService
 
 
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.integration
 def test_configuration():
     """Test configuration loading."""
-    print("\n" + "="*60)
-    print("Testing Configuration")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("Testing Configuration")
+    logger.info("="*60)
     
     missing = Config.validate()
+    assert not missing, f"Missing configuration: {', '.join(missing)}"
     
-    if missing:
-        print("❌ Missing configuration:")
-        for item in missing:
-            print(f"   - {item}")
-        return False
+    logger.info("✓ All required configuration present")
+    logger.info("✓ Monitoring %s repositories", len(Config.MONITORED_REPOS))
+    logger.info("✓ Check interval: %s minutes", Config.CHECK_INTERVAL_MINUTES)
+
+
+def test_database(db):
+    """Test database initialization."""
+    logger.info("\n" + "="*60)
+    logger.info("Testing Database")
+    logger.info("="*60)
     
-    print("✓ All required configuration present")
-    print(f"✓ Monitoring {len(Config.MONITORED_REPOS)} repositories")
-    print(f"✓ Check interval: {Config.CHECK_INTERVAL_MINUTES} minutes")
+    logger.info("✓ Database initialized")
     
-    return True
+    # Test upsert
+    db.upsert_repository("test/repo", "https://github.com/test/repo")
+    logger.info("✓ Database write successful")
+    
+    # Test read
+    repo = db.get_repository("test/repo")
+    assert repo, "Database read failed"
+    logger.info("✓ Database read successful")
 
 
-def test_database():
-    """Test database initialization."""
-    print("\n" + "="*60)
-    print("Testing Database")
-    print("="*60)
+def test_cached_analysis(db, gemini):
+    """Test that a stored analysis is reused only for the same update."""
+    from app.db.database import release_notes_hash
     
-    try:
-        db = Database(Config.DATABASE_PATH)
-        print("✓ Database initialized")
-        
-        # Test upsert
-        db.upsert_repository("test/repo", "https://github.com/test/repo")
-        print("✓ Database write successful")
-        
-        # Test read
-        repo = db.get_repository("test/repo")
-        if repo:
-            print("✓ Database read successful")
-        else:
-            print("❌ Database read failed")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Database error: {e}")
-        return False
+    analysis = gemini.analyze_version_change("test/repo", "v1.0.0", "v1.1.0", "Notes")
+    notes_hash = release_notes_hash("Notes")
+    db.add_alert_history(
+        "test/repo", "v1.1.0", analysis["severity"], analysis["mandatory_upgrade"],
+        analysis["summary"], old_version="v1.0.0", reasoning=analysis["reasoning"],
+        release_notes_hash=notes_hash
+    )
+    
+    cached = db.get_cached_analysis("test/repo", "v1.0.0", "v1.1.0", notes_hash)
+    assert cached and cached["reasoning"] == analysis["reasoning"], "Stored analysis not reused"
+    assert not db.get_cached_analysis("test/repo", "v0.9.0", "v1.1.0", notes_hash)
+    assert not db.get_cached_analysis(
+        "test/repo", "v1.0.0", "v1.1.0", release_notes_hash("Edited notes")
+    )
+    logger.info("✓ Analysis reuse keyed on the full update")
 
 
-def test_github_service():
+@pytest.mark.integration
+def test_github_service(github_service):
     """Test GitHub API connection."""
-    print("\n" + "="*60)
-    print("Testing GitHub Service")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("Testing GitHub Service")
+    logger.info("="*60)
     
-    try:
-        github = GitHubService()
-        print("✓ GitHub service initialized")
-        
-        # Test with a known public repository
-        latest = github.get_latest_version("ethereum", "go-ethereum")
-        
-        if latest:
-            print(f"✓ GitHub API working")
-            print(f"  Latest version: {latest.get('tag_name')}")
-            print(f"  Rate limit remaining: {github.rate_limit_remaining}")
-        else:
-            print("❌ Could not fetch repository data")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ GitHub service error: {e}")
-        return False
+    logger.info("✓ GitHub service initialized")
+    
+    # Test with a known public repository
+    latest = github_service.get_latest_version("ethereum", "go-ethereum")
+    assert latest, "Could not fetch repository data"
+    
+    logger.info("✓ GitHub API working")
+    logger.info("  Latest version: %s", latest.get('tag_name'))
+    logger.info("  Rate limit remaining: %s", github_service.rate_limit_remaining)
 
 
+@pytest.mark.integration
 def test_gemini_service():
     """Test Gemini AI service."""
-    print("\n" + "="*60)
-    print("Testing Gemini Service")
-    print("="*60)
-    
-    try:
-        gemini = GeminiService()
-        print("✓ Gemini service initialized")
-        
-        # Test with sample data
-        analysis = gemini.analyze_version_change(
-            repo_name="test/repo",
-            old_version="v1.0.0",
-            new_version="v1.1.0",
-            release_notes="Bug fixes and performance improvements",
-            commit_messages=[]
-        )
-        
-        if analysis and "summary" in analysis:
-            print("✓ Gemini API working")
-            print(f"  Severity: {analysis.get('severity')}")
-            print(f"  Mandatory: {analysis.get('mandatory_upgrade')}")
-        else:
-            print("❌ Invalid Gemini response")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Gemini service error: {e}")
+    from app.services.gemini_service import GeminiService
+    
+    logger.info("\n" + "="*60)
+    logger.info("Testing Gemini Service")
+    logger.info("="*60)
+    
+    gemini = GeminiService()
+    logger.info("✓ Gemini service initialized")
+    
+    # Test with sample data
+    analysis = gemini.analyze_version_change(
+        repo_name="test/repo",
+        old_version="v1.0.0",
+        new_version="v1.1.0",
+        release_notes="Bug fixes and performance improvements",
+        commit_messages=[]
+    )
+    assert analysis and "summary" in analysis, "Invalid Gemini response"
+    
+    logger.info("✓ Gemini API working")
+    logger.info("  Severity: %s", analysis.get('severity'))
+    logger.info("  Mandatory: %s", analysis.get('mandatory_upgrade'))
+
+
+def should_send_test_email():
+    """Decide whether to send a test email: BRW_TEST_EMAIL=1/0, else ask."""
+    setting = os.environ.get("BRW_TEST_EMAIL")
+    if setting is not None:
+        return setting == "1"
+    if not sys.stdin.isatty():
         return False
+    return input("Send test email? (y/n): ").lower() == 'y'
 
 
-def test_email_service():
+@pytest.mark.integration
+def test_email_service(send=None):
     """Test email service configuration."""
-    print("\n" + "="*60)
-    print("Testing Email Service")
-    print("="*60)
+    from app.services.email_service import EmailService
     
-    response = input("Send test email? (y/n): ")
+    if send is None:
+        send = should_send_test_email()
     
-    if response.lower() != 'y':
-        print("⊘ Email test skipped")
-        return True
+    logger.info("\n" + "="*60)
+    logger.info("Testing Email Service")
+    logger.info("="*60)
+    
+    if not send:
+        logger.info("⊘ Email test skipped")
+        return
     
+    email = EmailService()
+    logger.info("✓ Email service initialized")
+    
+    assert email.send_test_email(), "Failed to send test email"
+    
+    logger.info("✓ Test email sent successfully")
+    logger.info("  Check inbox: %s", Config.EMAIL_TO)
+
+
+def run_test(test, *args):
+    """
+    Run one test function for the standalone summary.
+    
+    Returns:
+        True if the test passed.
+    """
     try:
-        email = EmailService()
-        print("✓ Email service initialized")
-        
-        success = email.send_test_email()
-        
-        if success:
-            print("✓ Test email sent successfully")
-            print(f"  Check inbox: {Config.EMAIL_TO}")
-        else:
-            print("❌ Failed to send test email")
-            return False
-        
+        test(*args)
         return True
-        
+    except AssertionError as e:
+        logger.warning("❌ %s", e)
     except Exception as e:
-        print(f"❌ Email service error: {e}")
-        return False
+        logger.warning("❌ %s error: %s", test.__name__, e)
+    return False
 
 
 def main():
     """Run all tests."""
-    print("="*60)
-    print("Blockchain Release Monitor - Configuration Test")
-    print("="*60)
-    
-    results = []
-    
-    # Run tests
-    results.append(("Configuration", test_configuration()))
-    results.append(("Database", test_database()))
-    results.append(("GitHub Service", test_github_service()))
-    results.append(("Gemini Service", test_gemini_service()))
-    results.append(("Email Service", test_email_service()))
+    from app.db.database import Database
+    from app.services.github_service import GitHubService
+    
+    logger.info("="*60)
+    logger.info("Blockchain Release Monitor - Configuration Test")
+    logger.info("="*60)
+    
+    # Like the pytest fixture, write to a throwaway database
+    db_dir = tempfile.TemporaryDirectory()
+    db = Database(os.path.join(db_dir.name, "monitor.db"))
+    github_service = GitHubService()
+    
+    # Prerequisites run first, one at a time
+    results = [
+        ("Configuration", run_test(test_configuration)),
+        ("Database", run_test(test_database, db)),
+    ]
+    
+    # The network-bound tests are independent, so overlap their round trips
+    # (their output may interleave). Ask about the email up front so no
+    # worker blocks on input().
+    send_email = should_send_test_email()
+    network_tests = [
+        ("GitHub Service", (test_github_service, github_service)),
+        ("Gemini Service", (test_gemini_service,)),
+        ("Email Service", (test_email_service, send_email)),
+    ]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {pool.submit(run_test, *call): name for name, call in network_tests}
+        outcomes = {futures[future]: future.result() for future in as_completed(futures)}
+    results.extend((name, outcomes[name]) for name, _ in network_tests)
+    
+    github_service.close()
+    db.close()
+    db_dir.cleanup()
     
     # Summary
-    print("\n" + "="*60)
-    print("Test Summary")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("Test Summary")
+    logger.info("="*60)
     
     for name, passed in results:
         status = "✓ PASS" if passed else "❌ FAIL"
-        print(f"{status} - {name}")
+        logger.info("%s - %s", status, name)
     
     total = len(results)
     passed = sum(1 for _, result in results if result)
     
-    print(f"\nTotal: {passed}/{total} tests passed")
+    logger.info("\nTotal: %s/%s tests passed", passed, total)
     
     if passed == total:
-        print("\n✓ All tests passed! Ready to run the application.")
-        print("\nRun: python run.py")
+        logger.info("\n✓ All tests passed! Ready to run the application.")
+        logger.info("\nRun: python run.py")
     else:
-        print("\n❌ Some tests failed. Please check configuration.")
+        logger.info("\n❌ Some tests failed. Please check configuration.")
         sys.exit(1)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("BRW_LOG", "INFO"), format="%(message)s")
     main()
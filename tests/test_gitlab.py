@@ -2,81 +2,88 @@
 """
 Test GitLab integration.
 """
+import logging
+import os
 from app.config import Config
-from app.services.gitlab_service import GitLabService
+
+
+logger = logging.getLogger(__name__)
 
 
 def main():
     """Test GitLab service."""
-    print("=" * 60)
-    print("GitLab Service Test")
-    print("=" * 60)
-    print()
+    from app.services.gitlab_service import GitLabService
+    
+    logger.info("=" * 60)
+    logger.info("GitLab Service Test")
+    logger.info("=" * 60)
+    logger.info("")
     
     # Check configuration
-    print("Configuration:")
-    print(f"  GitLab Token Configured: {bool(Config.GITLAB_TOKEN)}")
-    print(f"  GitLab API Base: {Config.GITLAB_API_BASE}")
-    print()
+    logger.info("Configuration:")
+    logger.info("  GitLab Token Configured: %s", bool(Config.GITLAB_TOKEN))
+    logger.info("  GitLab API Base: %s", Config.GITLAB_API_BASE)
+    logger.info("")
     
     if not Config.GITLAB_TOKEN:
-        print("⚠ GitLab token not configured")
-        print("  Note: GitLab token is optional for public repositories")
-        print()
+        logger.warning("⚠ GitLab token not configured")
+        logger.info("  Note: GitLab token is optional for public repositories")
+        logger.info("")
     
     # Test with a public GitLab repository
-    print("-" * 60)
-    print("Testing with public GitLab repository...")
-    print("-" * 60)
-    print()
+    logger.info("-" * 60)
+    logger.info("Testing with public GitLab repository...")
+    logger.info("-" * 60)
+    logger.info("")
     
     test_repo = "gitlab-org/gitlab-runner"  # Public repo
-    print(f"Repository: {test_repo}")
-    print()
+    logger.info("Repository: %s", test_repo)
+    logger.info("")
     
     gitlab_service = GitLabService()
     
     try:
         # Test getting latest version
-        print("Fetching latest version...")
+        logger.info("Fetching latest version...")
         group, project = gitlab_service.parse_repo_name(test_repo)
         latest = gitlab_service.get_latest_version(group, project)
         
         if latest:
-            print(f"✓ Latest version: {latest.get('tag_name')}")
-            print(f"  Type: {latest.get('type')}")
+            logger.info("✓ Latest version: %s", latest.get('tag_name'))
+            logger.info("  Type: %s", latest.get('type'))
             if latest.get('body'):
-                print(f"  Description: {latest.get('body')[:100]}...")
-            print()
+                logger.info("  Description: %s...", latest.get('body')[:100])
+            logger.info("")
         else:
-            print("✗ Could not fetch latest version")
-            print()
+            logger.warning("✗ Could not fetch latest version")
+            logger.info("")
         
         # Test repo URL
-        print("Testing repository URL generation...")
+        logger.info("Testing repository URL generation...")
         repo_url = gitlab_service.get_repo_url(test_repo)
-        print(f"✓ Repository URL: {repo_url}")
-        print()
+        logger.info("✓ Repository URL: %s", repo_url)
+        logger.info("")
         
     except Exception as e:
-        print(f"✗ Error: {e}")
-        print()
+        logger.warning("✗ Error: %s", e)
+        logger.info("")
     
-    print("=" * 60)
-    print("Summary:")
-    print("=" * 60)
-    print()
-    print("To monitor GitLab repositories:")
-    print("1. Add 'gitlab:' prefix to repository name in MONITORED_REPOS")
-    print("   Example: gitlab:gitlab-org/gitlab-runner")
-    print()
-    print("2. (Optional) Add GITLAB_TOKEN to .env for private repos")
-    print("   Get token from: https://gitlab.com/-/profile/personal_access_tokens")
-    print()
-    print("3. For self-hosted GitLab, set GITLAB_API_BASE")
-    print("   Example: GITLAB_API_BASE=https://gitlab.example.com/api/v4")
-    print()
+    logger.info("=" * 60)
+    logger.info("Summary:")
+    logger.info("=" * 60)
+    logger.info("")
+    logger.info("To monitor GitLab repositories:")
+    logger.info("1. Add 'gitlab:' prefix to repository name in MONITORED_REPOS")
+    logger.info("   Example: gitlab:gitlab-org/gitlab-runner")
+    logger.info("")
+    logger.info("2. (Optional) Add GITLAB_TOKEN to .env for private repos")
+    logger.info("   Get token from: https://gitlab.com/-/profile/personal_access_tokens")
+    logger.info("")
+    logger.info("3. For self-hosted GitLab, set GITLAB_API_BASE")
+    logger.info("   Example: GITLAB_API_BASE=https://gitlab.example.com/api/v4")
+    logger.info("")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("BRW_LOG", "INFO"), format="%(message)s")
     main()
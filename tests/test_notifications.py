@@ -2,95 +2,116 @@
 """
 Test Slack and email alert configuration.
 """
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from app.config import Config
 from app.services.email_service import EmailService
 from app.services.slack_service import SlackService
 
 
+logger = logging.getLogger(__name__)
+
+
 def main():
     """Test notification services."""
-    print("=" * 60)
-    print("Notification Services Test")
-    print("=" * 60)
-    print()
+    logger.info("=" * 60)
+    logger.info("Notification Services Test")
+    logger.info("=" * 60)
+    logger.info("")
+    
+    # Settings used throughout the test
+    email_enabled = Config.EMAIL_ALERTS_ENABLED
+    slack_enabled = Config.SLACK_ALERTS_ENABLED
+    webhook_url = Config.SLACK_WEBHOOK_URL
     
     # Check configuration
-    print("Configuration Status:")
-    print(f"  Email Alerts Enabled: {Config.EMAIL_ALERTS_ENABLED}")
-    print(f"  Slack Alerts Enabled: {Config.SLACK_ALERTS_ENABLED}")
-    print(f"  Slack Webhook Configured: {bool(Config.SLACK_WEBHOOK_URL)}")
-    print()
+    logger.info("Configuration Status:")
+    logger.info("  Email Alerts Enabled: %s", email_enabled)
+    logger.info("  Slack Alerts Enabled: %s", slack_enabled)
+    logger.info("  Slack Webhook Configured: %s", bool(webhook_url))
+    logger.info("")
+    
+    # Send the test email and Slack message concurrently; results are
+    # reported below in a fixed order
+    slack_service = SlackService()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        email_future = None
+        if email_enabled:
+            email_future = pool.submit(EmailService().send_test_email)
+        slack_future = None
+        if slack_enabled and slack_service.enabled:
+            slack_future = pool.submit(slack_service.send_test_message)
     
     # Test Email
-    if Config.EMAIL_ALERTS_ENABLED:
-        print("-" * 60)
-        print("Testing Email Service...")
-        print("-" * 60)
+    if email_future is not None:
+        logger.info("-" * 60)
+        logger.info("Testing Email Service...")
+        logger.info("-" * 60)
         
-        email_service = EmailService()
         try:
-            success = email_service.send_test_email()
+            success = email_future.result()
             if success:
-                print("✓ Email test passed!")
+                logger.info("✓ Email test passed!")
             else:
-                print("✗ Email test failed!")
+                logger.warning("✗ Email test failed!")
         except Exception as e:
-            print(f"✗ Email test error: {e}")
-        print()
+            logger.warning("✗ Email test error: %s", e)
+        logger.info("")
     else:
-        print("Email alerts disabled - skipping email test")
-        print()
+        logger.info("Email alerts disabled - skipping email test")
+        logger.info("")
     
     # Test Slack
-    if Config.SLACK_ALERTS_ENABLED:
-        print("-" * 60)
-        print("Testing Slack Service...")
-        print("-" * 60)
-        
-        slack_service = SlackService()
+    if slack_enabled:
+        logger.info("-" * 60)
+        logger.info("Testing Slack Service...")
+        logger.info("-" * 60)
         
-        if slack_service.enabled:
+        if slack_future is not None:
             try:
-                success = slack_service.send_test_message()
+                success = slack_future.result()
                 if success:
-                    print("✓ Slack test passed!")
+                    logger.info("✓ Slack test passed!")
                 else:
-                    print("✗ Slack test failed!")
+                    logger.warning("✗ Slack test failed!")
             except Exception as e:
-                print(f"✗ Slack test error: {e}")
+                logger.warning("✗ Slack test error: %s", e)
         else:
-            print("⚠ Slack webhook URL not configured")
-            print("  Add SLACK_WEBHOOK_URL to .env to enable Slack notifications")
-        print()
+            logger.warning("⚠ Slack webhook URL not configured")
+            logger.info("  Add SLACK_WEBHOOK_URL to .env to enable Slack notifications")
+        logger.info("")
     else:
-        print("Slack alerts disabled - skipping Slack test")
-        print()
+        logger.info("Slack alerts disabled - skipping Slack test")
+        logger.info("")
     
-    print("=" * 60)
-    print("Configuration Summary:")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("Configuration Summary:")
+    logger.info("=" * 60)
     
-    email_configured = Config.EMAIL_ALERTS_ENABLED and Config.SMTP_USERNAME
-    slack_configured = Config.SLACK_ALERTS_ENABLED and Config.SLACK_WEBHOOK_URL
+    email_configured = email_enabled and Config.SMTP_USERNAME
+    slack_configured = slack_enabled and webhook_url
     
     if email_configured and slack_configured:
-        print("✓ Both email and Slack alerts configured")
+        logger.info("✓ Both email and Slack alerts configured")
     elif email_configured:
-        print("✓ Email alerts configured")
-        print("ℹ Slack alerts not configured (optional)")
+        logger.info("✓ Email alerts configured")
+        logger.info("ℹ Slack alerts not configured (optional)")
     elif slack_configured:
-        print("✓ Slack alerts configured")
-        print("ℹ Email alerts not configured (optional)")
+        logger.info("✓ Slack alerts configured")
+        logger.info("ℹ Email alerts not configured (optional)")
     else:
-        print("⚠ No notification methods configured!")
-        print("  Configure at least one: Email or Slack")
+        logger.warning("⚠ No notification methods configured!")
+        logger.info("  Configure at least one: Email or Slack")
     
-    print()
-    print("To enable/disable alerts, set in .env:")
-    print("  EMAIL_ALERTS_ENABLED=true/false")
-    print("  SLACK_ALERTS_ENABLED=true/false")
-    print()
+    logger.info("")
+    logger.info("To enable/disable alerts, set in .env:")
+    logger.info("  EMAIL_ALERTS_ENABLED=true/false")
+    logger.info("  SLACK_ALERTS_ENABLED=true/false")
+    logger.info("")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("BRW_LOG", "INFO"), format="%(message)s")
     main()
@@ -2,61 +2,71 @@
 """
 Test monitoring a specific repository with tag filters.
 """
+import logging
+import os
 from app.config import Config
 from app.db.database import Database
-from app.services.github_service import GitHubService
+from app.services.repository_service import RepositoryService
 from app.services.gemini_service import GeminiService
 from app.services.email_service import EmailService
-from app.monitor import check_repository_updates
+from app.services.slack_service import SlackService
+from app.monitor import check_all_repositories
+
+
+logger = logging.getLogger(__name__)
 
 
 def main():
     """Test checking Optimism repository with tag filters."""
-    print("=" * 60)
-    print("Testing Optimism Monitoring with Tag Filters")
-    print("=" * 60)
-    print()
+    logger.info("=" * 60)
+    logger.info("Testing Optimism Monitoring with Tag Filters")
+    logger.info("=" * 60)
+    logger.info("")
     
     # Initialize services
     db = Database(Config.DATABASE_PATH)
     tag_filters = Config.get_repo_tag_filters()
     
-    print(f"Tag filters: {tag_filters}")
-    print()
+    logger.info("Tag filters: %s", tag_filters)
+    logger.info("")
     
-    github_service = GitHubService(tag_filters=tag_filters)
+    repo_service = RepositoryService(tag_filters=tag_filters)
     gemini_service = GeminiService()
     email_service = EmailService()
+    slack_service = SlackService()
     
     # Test Optimism repo
     repo_name = "ethereum-optimism/optimism"
     
-    print(f"Checking {repo_name}...")
-    print(f"Filter: Only track releases containing 'op-geth' or 'op-node'")
-    print()
+    logger.info("Checking %s...", repo_name)
+    logger.info("Filter: Only track releases containing 'op-geth' or 'op-node'")
+    logger.info("")
     
-    result = check_repository_updates(
-        repo_name=repo_name,
-        db=db,
-        github_service=github_service,
-        gemini_service=gemini_service,
-        email_service=email_service
+    # Same batched path as the scheduled run (one DB query, GraphQL
+    # prefetch), so adding repositories here costs no extra round trips
+    [result] = check_all_repositories(
+        db, repo_service, gemini_service, email_service, slack_service, [repo_name]
     )
     
-    print()
-    print("Result:", result)
-    print()
+    # Let queued alerts go out before exiting
+    email_service.shutdown()
+    slack_service.shutdown()
+    
+    logger.info("")
+    logger.info("Result: %s", result)
+    logger.info("")
     
     # Show what's in the database
     repo = db.get_repository(repo_name)
     if repo:
-        print(f"Database record:")
-        print(f"  Last version: {repo.last_version_or_tag}")
-        print(f"  Last checked: {repo.last_checked}")
+        logger.info("Database record:")
+        logger.info("  Last version: %s", repo.last_version_or_tag)
+        logger.info("  Last checked: %s", repo.last_checked)
     
-    print()
-    print("=" * 60)
+    logger.info("")
+    logger.info("=" * 60)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("BRW_LOG", "INFO"), format="%(message)s")
     main()
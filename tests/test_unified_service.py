@@ -2,16 +2,22 @@
 """
 Test unified repository service with both GitHub and GitLab.
 """
+import logging
+import os
 from app.config import Config
-from app.services.repository_service import RepositoryService
+
+
+logger = logging.getLogger(__name__)
 
 
 def main():
     """Test unified repository service."""
-    print("=" * 70)
-    print("Unified Repository Service Test (GitHub + GitLab)")
-    print("=" * 70)
-    print()
+    from app.services.repository_service import RepositoryService
+    
+    logger.info("=" * 70)
+    logger.info("Unified Repository Service Test (GitHub + GitLab)")
+    logger.info("=" * 70)
+    logger.info("")
     
     repo_service = RepositoryService()
     
@@ -21,52 +27,58 @@ def main():
         ("babylonlabs-io/babylon", "GitHub"),
     ]
     
+    # Check all repositories side by side (one thread each, GitHub releases
+    # batched into a GraphQL query), then report them in order
+    logger.info("Checking for latest versions...")
+    logger.info("")
+    updates = repo_service.check_many({repo_name: None for repo_name, _ in test_repos})
+    
     for repo_name, expected_platform in test_repos:
-        print(f"Repository: {repo_name}")
-        print(f"Expected Platform: {expected_platform}")
+        logger.info("Repository: %s", repo_name)
+        logger.info("Expected Platform: %s", expected_platform)
         
         try:
             # Detect platform
             platform = repo_service.get_platform(repo_name)
-            print(f"  ✓ Detected Platform: {platform}")
+            logger.info("  ✓ Detected Platform: %s", platform)
             
             # Get URL
             url = repo_service.get_repo_url(repo_name)
-            print(f"  ✓ Repository URL: {url}")
+            logger.info("  ✓ Repository URL: %s", url)
             
-            # Check for updates (will be first check)
-            print(f"  Checking for latest version...")
-            update_info = repo_service.check_for_updates(repo_name, last_version=None)
+            # Result of the first check (no last version)
+            update_info = updates[repo_name]
             
             if "error" in update_info:
-                print(f"  ✗ Error: {update_info['error']}")
+                logger.info("  ✗ Error: %s", update_info['error'])
             elif update_info.get("has_update"):
-                print(f"  ✓ Latest version: {update_info.get('new_version')}")
-                print(f"    Type: {update_info.get('version_type')}")
+                logger.info("  ✓ Latest version: %s", update_info.get('new_version'))
+                logger.info("    Type: %s", update_info.get('version_type'))
             else:
-                print(f"  ✓ No updates")
+                logger.info("  ✓ No updates")
             
         except Exception as e:
-            print(f"  ✗ Error: {e}")
+            logger.info("  ✗ Error: %s", e)
         
-        print()
-        print("-" * 70)
-        print()
+        logger.info("")
+        logger.info("-" * 70)
+        logger.info("")
     
-    print("=" * 70)
-    print("Summary")
-    print("=" * 70)
-    print()
-    print("✓ Unified service successfully handles both platforms")
-    print()
-    print("Repository Format:")
-    print("  GitHub:  owner/repo")
-    print("  GitLab:  gitlab:group/project")
-    print()
-    print("The service automatically detects the platform and routes")
-    print("requests to the appropriate service (GitHub or GitLab).")
-    print()
+    logger.info("=" * 70)
+    logger.info("Summary")
+    logger.info("=" * 70)
+    logger.info("")
+    logger.info("✓ Unified service successfully handles both platforms")
+    logger.info("")
+    logger.info("Repository Format:")
+    logger.info("  GitHub:  owner/repo")
+    logger.info("  GitLab:  gitlab:group/project")
+    logger.info("")
+    logger.info("The service automatically detects the platform and routes")
+    logger.info("requests to the appropriate service (GitHub or GitLab).")
+    logger.info("")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("BRW_LOG", "INFO"), format="%(message)s")
     main()
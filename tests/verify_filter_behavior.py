@@ -2,54 +2,59 @@
 """
 Verify that tag filtering correctly excludes non-matching releases.
 """
-import requests
-from app.config import Config
+import logging
+import os
+from app.services.github_service import GitHubService
+
+
+logger = logging.getLogger(__name__)
+
+
+REPO_NAME = "ethereum-optimism/optimism"
+
+# Filter the monitor would be configured with for this repository
+TAG_FILTERS = {REPO_NAME: ["op-geth", "op-node"]}
 
 
 def main():
     """Check what releases exist in Optimism repo."""
-    print("=" * 60)
-    print("Optimism Repository - All Recent Releases")
-    print("=" * 60)
-    print()
-    
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {Config.GITHUB_TOKEN}",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
+    logger.info("=" * 60)
+    logger.info("Optimism Repository - All Recent Releases")
+    logger.info("=" * 60)
+    logger.info("")
     
-    url = "https://api.github.com/repos/ethereum-optimism/optimism/releases"
-    response = requests.get(url, headers=headers, timeout=30)
+    # Goes through the service so the listing is shared with other lookups
+    # in this process and repeat requests revalidate with If-None-Match
+    with GitHubService(tag_filters=TAG_FILTERS) as service:
+        releases = service.list_releases(*service.parse_repo_name(REPO_NAME))
     
-    if response.status_code == 200:
-        releases = response.json()
-        
-        print(f"Found {len(releases)} releases. Showing first 15:\n")
+    if releases is not None:
+        logger.info("Found %s releases. Showing first 15:\n", len(releases))
         
         for i, release in enumerate(releases[:15], 1):
             tag = release.get("tag_name", "")
             name = release.get("name", "")
             prerelease = release.get("prerelease", False)
             
-            # Check if it matches our filter
-            matches_filter = ("op-geth" in tag.lower() or "op-node" in tag.lower())
+            # Same precompiled matcher the monitor uses, so this verifies
+            # the real filter rather than a copy of it
+            matches_filter = service._matches_tag_filter(tag, REPO_NAME)
             status = "✓ MATCH" if matches_filter else "✗ SKIP"
             pre = " [PRERELEASE]" if prerelease else ""
             
-            print(f"{i:2}. {status:10} {tag:30} {name}{pre}")
+            logger.info("%2s. %-10s %-30s %s%s", i, status, tag, name, pre)
         
-        print()
-        print("Legend:")
-        print("  ✓ MATCH - Would be tracked with op-geth,op-node filter")
-        print("  ✗ SKIP  - Would be ignored (op-proposer, op-batcher, etc.)")
+        logger.info("")
+        logger.info("Legend:")
+        logger.info("  ✓ MATCH - Would be tracked with op-geth,op-node filter")
+        logger.info("  ✗ SKIP  - Would be ignored (op-proposer, op-batcher, etc.)")
     else:
-        print(f"Error: {response.status_code}")
-        print(response.text)
+        logger.warning("Error: could not fetch releases (see log output)")
     
-    print()
-    print("=" * 60)
+    logger.info("")
+    logger.info("=" * 60)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("BRW_LOG", "INFO"), format="%(message)s")
     main()